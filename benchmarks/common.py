@@ -0,0 +1,98 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Provides a deterministic synthetic corpus that mimics the documents produced
+by the Telegram and WhatsApp preprocessors, plus small timing utilities.
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_WORDS = (
+    "meeting tomorrow lunch project deadline photo link call weekend trip "
+    "invoice flight hotel birthday party code review deploy server bug fix "
+    "coffee gym movie dinner train ticket price budget update draft slides "
+    "question answer thanks sorry later today morning evening week month"
+).split()
+
+_NAMES = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace", "Heidi"]
+
+
+def _sentence(rng: random.Random, min_words: int = 3, max_words: int = 18) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def whatsapp_document(rng: random.Random) -> str:
+    """One message plus +/-2 context messages, like WhatsAppPreprocessor output."""
+    author = rng.choice(_NAMES)
+    text = (
+        f"(author: {author} datetime: 2025-03-01 10:00:00 source: whatsapp "
+        f"chatname: Family chattype: group) {_sentence(rng)}\n\nContext:\n"
+    )
+    for direction in ("before", "before", "after", "after"):
+        text += f"[{direction}] {rng.choice(_NAMES)}: {_sentence(rng, 1, 10)}\n"
+    return text
+
+
+def telegram_document(rng: random.Random) -> str:
+    """A conversation chunk of up to 10 messages, like TelegramPreprocessor output."""
+    message_count = rng.randint(1, 10)
+    lines = [f"(chatname: Work chattype: private source: telegram messages: {message_count})"]
+    for _ in range(message_count):
+        lines.append(f"{rng.choice(_NAMES)} (2025-03-01 10:00:00):")
+        lines.append(_sentence(rng, 2, 30))
+    return "\n".join(lines)
+
+
+def synthetic_corpus(size: int, seed: int = 42) -> List[str]:
+    """
+    Build a mixed-length corpus of chat documents.
+
+    Args:
+        size: Number of documents to generate
+        seed: Random seed for reproducibility
+
+    Returns:
+        List[str]: Document texts, roughly half WhatsApp and half Telegram shaped
+    """
+    rng = random.Random(seed)
+    return [
+        whatsapp_document(rng) if rng.random() < 0.5 else telegram_document(rng)
+        for _ in range(size)
+    ]
+
+
+class Timer:
+    """Context manager measuring wall-clock time with perf_counter."""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self.start
+
+
+def print_table(rows: List[Dict[str, object]]) -> None:
+    """Print a list of result dictionaries as an aligned table."""
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = {h: max(len(h), *(len(_fmt(r[h])) for r in rows)) for h in headers}
+    print("  ".join(h.ljust(widths[h]) for h in headers))
+    print("  ".join("-" * widths[h] for h in headers))
+    for row in rows:
+        print("  ".join(_fmt(row[h]).ljust(widths[h]) for h in headers))
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return str(value)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Accuracy-vs-throughput benchmark for SentenceTransformerEmbedder backends.
+
+Encodes a synthetic chat corpus with the eager torch (fp32) backend and with
+the alternative CPU backends (ONNX Runtime, int8 dynamic quantization), and
+reports docs/sec plus the cosine agreement of each backend's vectors with
+the fp32 baseline.
+
+Usage:
+    python benchmarks/embedding_backends.py [--docs N] [--backends torch,int8,onnx]
+                                            [--config-path PATH]
+"""
+
+import argparse
+import asyncio
+import os
+
+import numpy as np
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+
+
+def cosine_agreement(vectors: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two embedding matrices."""
+    dot = np.sum(vectors * baseline, axis=1)
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(baseline, axis=1)
+    return dot / np.maximum(norms, 1e-12)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends")
+    parser.add_argument("--docs", type=int, default=1000, help="Number of synthetic documents")
+    parser.add_argument("--backends", default="torch,int8,onnx",
+                        help="Comma-separated backends to compare (torch is always the baseline)")
+    parser.add_argument("--config-path", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    os.environ["ICI_CONFIG_PATH"] = args.config_path
+
+    embedder = SentenceTransformerEmbedder()
+    await embedder.initialize()
+
+    texts = synthetic_corpus(args.docs)
+    backends = ["torch"] + [b for b in args.backends.split(",") if b and b != "torch"]
+
+    rows = []
+    baseline = None
+    for backend in backends:
+        try:
+            embedder._backend = backend
+            embedder._model = embedder._load_model()
+        except Exception as e:
+            print(f"Skipping backend '{backend}': {e}")
+            continue
+
+        # Warm up the model so the first call's overhead is not measured
+        embedder._encode_texts(texts[:8])
+
+        with Timer() as timer:
+            vectors = embedder._encode_texts(texts)
+
+        if baseline is None:
+            baseline = vectors
+        agreement = cosine_agreement(vectors, baseline)
+
+        rows.append({
+            "backend": backend,
+            "seconds": timer.elapsed,
+            "docs/sec": args.docs / timer.elapsed,
+            # Agreement is close to 1, so show more digits than print_table's default
+            "mean cosine": f"{agreement.mean():.4f}",
+            "min cosine": f"{agreement.min():.4f}",
+        })
+
+    baseline_seconds = rows[0]["seconds"]
+    for row in rows:
+        row["speedup"] = baseline_seconds / row["seconds"]
+
+    print(f"Model: {embedder._model_name}  device: {embedder._device}  "
+          f"encode batch_size: {embedder._batch_size}  docs: {args.docs}")
+    print_table(rows)
+
+    await embedder.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Embedding throughput benchmark for the ingestion pipeline.
+
+Compares the previous per-document embedding loop (one embed() call per
+document) with the batched path used by DefaultIngestionPipeline
+(one embed_batch() call per pipeline batch) on a synthetic chat corpus.
+
+Usage:
+    python benchmarks/embedding_throughput.py [--docs N] [--pipeline-batch-size N]
+                                              [--config-path PATH]
+"""
+
+import argparse
+import asyncio
+import os
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+
+
+async def embed_per_document(embedder, texts):
+    """Baseline: one model call per document."""
+    for text in texts:
+        await embedder.embed(text)
+
+
+async def embed_per_batch(embedder, texts, pipeline_batch_size):
+    """Batched: one embed_batch() call per pipeline batch."""
+    for i in range(0, len(texts), pipeline_batch_size):
+        await embedder.embed_batch(texts[i:i + pipeline_batch_size])
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingestion embedding throughput")
+    parser.add_argument("--docs", type=int, default=1000, help="Number of synthetic documents")
+    parser.add_argument("--pipeline-batch-size", type=int, default=100,
+                        help="Documents per pipeline batch (pipelines.default.batch_size)")
+    parser.add_argument("--config-path", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    os.environ["ICI_CONFIG_PATH"] = args.config_path
+
+    embedder = SentenceTransformerEmbedder()
+    await embedder.initialize()
+    # Measure the model, not the persistent embedding cache
+    embedder._cache = None
+
+    texts = synthetic_corpus(args.docs)
+
+    # Warm up the model so the first call's overhead is not measured
+    await embedder.embed_batch(texts[:8])
+
+    with Timer() as sequential:
+        await embed_per_document(embedder, texts)
+    with Timer() as batched:
+        await embed_per_batch(embedder, texts, args.pipeline_batch_size)
+
+    print(f"Model: {embedder._model_name}  device: {embedder._device}  "
+          f"encode batch_size: {embedder._batch_size}  docs: {args.docs}")
+    print_table([
+        {"mode": "per-document embed()", "seconds": sequential.elapsed,
+         "docs/sec": args.docs / sequential.elapsed, "speedup": 1.0},
+        {"mode": "embed_batch() per batch", "seconds": batched.elapsed,
+         "docs/sec": args.docs / batched.elapsed,
+         "speedup": sequential.elapsed / batched.elapsed},
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
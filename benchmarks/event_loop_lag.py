@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Event-loop responsiveness benchmark for SentenceTransformerEmbedder.
+
+Embeds a large synthetic batch while a probe task repeatedly sleeps for a
+fixed interval and records how late it wakes up (event-loop lag). Compares
+encoding inline on the loop (the previous behaviour) with embed_batch(),
+which dispatches encoding to the embedder's thread pool.
+
+Usage:
+    python benchmarks/event_loop_lag.py [--docs N] [--interval-ms MS]
+                                        [--config-path PATH]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+
+
+async def probe_lag(interval: float, lags: list, stop: asyncio.Event) -> None:
+    """Sleep for interval repeatedly, recording how late each wake-up is."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - started - interval))
+
+
+async def measure(embed, texts, interval: float):
+    """Run embed(texts) alongside the lag probe and return (seconds, lags)."""
+    lags = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(interval, lags, stop))
+    # Let the probe start before the encode begins
+    await asyncio.sleep(interval)
+
+    with Timer() as timer:
+        await embed(texts)
+
+    stop.set()
+    await probe
+    return timer.elapsed, lags
+
+
+def summarize(mode: str, seconds: float, lags: list) -> dict:
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "mode": mode,
+        "seconds": seconds,
+        "probe wakeups": len(lags),
+        "p50 lag ms": statistics.median(lags_ms),
+        "p95 lag ms": lags_ms[int(0.95 * (len(lags_ms) - 1))],
+        "max lag ms": lags_ms[-1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark event-loop lag during embedding")
+    parser.add_argument("--docs", type=int, default=2000, help="Number of synthetic documents")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="Probe sleep interval")
+    parser.add_argument("--config-path", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    os.environ["ICI_CONFIG_PATH"] = args.config_path
+
+    embedder = SentenceTransformerEmbedder()
+    await embedder.initialize()
+    # Measure the model, not the persistent embedding cache
+    embedder._cache = None
+
+    texts = synthetic_corpus(args.docs)
+    interval = args.interval_ms / 1000
+
+    # Warm up the model so the first call's overhead is not measured
+    await embedder.embed_batch(texts[:8])
+
+    async def encode_inline(batch):
+        embedder._encode(batch)
+
+    inline_seconds, inline_lags = await measure(encode_inline, texts, interval)
+    executor_seconds, executor_lags = await measure(embedder.embed_batch, texts, interval)
+
+    print(f"Model: {embedder._model_name}  device: {embedder._device}  "
+          f"num_workers: {embedder._num_workers}  torch_threads: {embedder._torch_threads}  "
+          f"docs: {args.docs}  probe interval: {args.interval_ms} ms")
+    print_table([
+        summarize("inline encode (blocks loop)", inline_seconds, inline_lags),
+        summarize("embed_batch() on executor", executor_seconds, executor_lags),
+    ])
+
+    await embedder.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
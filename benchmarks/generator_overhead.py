@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Per-request overhead benchmark for LangchainGenerator.
+
+Starts a local stub of the OpenAI chat completions endpoint that answers
+instantly, so the measured latency is the client-side cost of a request.
+Compares building a new ChatOpenAI client and LLMChain for every request
+(the previous behaviour whenever generation options were passed) with
+LangchainGenerator.generate(), which reuses cached clients and a pooled HTTP
+connection. Reports latency and the number of TCP connections the stub saw.
+
+Usage:
+    python benchmarks/generator_overhead.py [--requests N] [--warmup N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+from common import print_table
+
+from langchain.chains import LLMChain
+from langchain_openai import ChatOpenAI
+
+from ici.adapters.generators.langchain_generator import LangchainGenerator
+
+_COMPLETION = json.dumps({
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stub-model",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "Yes, I am operational."},
+        "finish_reason": "stop"
+    }],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a fixed chat completion over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler.lock:
+            StubHandler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_COMPLETION)))
+        self.end_headers()
+        self.wfile.write(_COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+async def measure(generate, requests: int, warmup: int) -> dict:
+    """Call generate() sequentially and return latency and connection counts."""
+    for _ in range(warmup):
+        await generate()
+
+    StubHandler.connections = 0
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await generate()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    return {
+        "mean ms": statistics.mean(latencies),
+        "p50 ms": statistics.median(latencies),
+        "p95 ms": latencies[int(0.95 * (len(latencies) - 1))],
+        "connections": StubHandler.connections,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-request generator overhead")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per mode")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per mode")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_BASE"] = base_url
+
+    config = {"orchestrator": {"generator": {
+        "provider": "openai",
+        "model": "stub-model",
+        "api_key": "stub-key",
+        "max_retries": 1,
+    }}}
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as config_file:
+        yaml.safe_dump(config, config_file)
+    os.environ["ICI_CONFIG_PATH"] = config_file.name
+
+    # The orchestrator always passes its generation_options
+    options = {"temperature": 0.7, "max_tokens": 64}
+    prompt = "Hello, are you working properly?"
+
+    try:
+        generator = LangchainGenerator()
+        await generator.initialize()
+
+        async def rebuild_per_request():
+            # What generate() did before clients were cached
+            credentials = generator._get_credentials()
+            llm = ChatOpenAI(
+                model_name=generator._model,
+                temperature=options["temperature"],
+                max_tokens=options["max_tokens"],
+                top_p=1.0,
+                api_key=credentials,
+            )
+            chain = LLMChain(llm=llm, prompt=generator._prompt_template)
+            await chain.ainvoke({"prompt": prompt})
+
+        async def cached_client():
+            await generator.generate(prompt, options)
+
+        rows = []
+        for mode, generate in (("rebuild per request", rebuild_per_request), ("cached client", cached_client)):
+            result = await measure(generate, args.requests, args.warmup)
+            rows.append({"mode": mode, "requests": args.requests, **result})
+
+        print_table(rows)
+        print(f"\nspeedup (mean): {rows[0]['mean ms'] / rows[1]['mean ms']:.2f}x")
+
+        await generator.close()
+    finally:
+        server.shutdown()
+        os.unlink(config_file.name)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Recall@k versus latency sweep over ChromaDB HNSW settings.
+
+Builds a Chroma collection in a temporary directory for each
+(max_neighbors, ef_construction) pair and, for each ef_search, measures query
+latency and recall@k against exact brute-force search. With --source config the vectors are read from the
+collection configured under vector_stores.chroma in config.yaml (our own
+data, read-only); otherwise clustered random vectors are used. Pick the
+settings with the recall you need at the lowest latency, then apply them
+with:
+
+    python -m ici.adapters.vector_stores.chroma_maintenance rebuild ...
+
+Usage:
+    python benchmarks/hnsw_sweep.py [--source synthetic|config] [--docs N]
+                                    [--queries N] [--top-k K] [--space l2|cosine|ip]
+                                    [--max-neighbors 16,32] [--ef-construction 100,200]
+                                    [--ef-search 10,20,50,100,200]
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+
+import chromadb
+import numpy as np
+from chromadb.api.client import SharedSystemClient
+
+from common import Timer, print_table
+
+from ici.utils.config import get_component_config
+
+
+def int_list(value: str):
+    return [int(item) for item in value.split(",") if item]
+
+
+def load_collection_vectors(config_path: str, limit: int) -> np.ndarray:
+    """Read up to limit stored vectors from the configured collection."""
+    config = get_component_config("vector_stores.chroma", config_path)
+    client = chromadb.PersistentClient(path=config["persist_directory"])
+    collection = client.get_collection(config.get("collection_name", "default_collection"))
+
+    pages = []
+    offset = 0
+    page_size = min(5000, client.get_max_batch_size())
+    while offset < limit:
+        page = collection.get(include=["embeddings"], limit=min(page_size, limit - offset), offset=offset)
+        if len(page["ids"]) == 0:
+            break
+        pages.append(np.asarray(page["embeddings"], dtype=np.float32))
+        offset += len(page["ids"])
+    if not pages:
+        raise SystemExit("The configured collection is empty; ingest data or use --source synthetic")
+    return np.concatenate(pages)
+
+
+def clustered_vectors(rng, count: int, dimensions: int, topics: int = 200) -> np.ndarray:
+    """Unit vectors scattered around topic centres, like embeddings of chat messages."""
+    centres = rng.standard_normal((topics, dimensions)).astype(np.float32)
+    vectors = centres[rng.integers(topics, size=count)] + 0.8 * rng.standard_normal(
+        (count, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_neighbours(vectors: np.ndarray, queries: np.ndarray, space: str, k: int) -> np.ndarray:
+    """Indices of the exact top-k vectors per query under the given distance."""
+    if space == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    if space == "l2":
+        scores = -(np.sum(vectors ** 2, axis=1)[None, :] - 2 * queries @ vectors.T)
+    else:
+        scores = queries @ vectors.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def sweep_index(directory, vectors, ids, queries, exact, max_neighbors, ef_construction, args):
+    """Build one index and measure it at every ef_search value."""
+    client = chromadb.PersistentClient(path=directory)
+    name = f"sweep_{max_neighbors}_{ef_construction}"
+    collection = client.create_collection(
+        name=name,
+        configuration={"hnsw": {"space": args.space, "max_neighbors": max_neighbors,
+                                "ef_construction": ef_construction}}
+    )
+    batch_size = client.get_max_batch_size()
+    with Timer() as build_timer:
+        for i in range(0, len(vectors), batch_size):
+            collection.add(ids=ids[i:i + batch_size], embeddings=vectors[i:i + batch_size])
+
+    rows = []
+    for ef_search in args.ef_search:
+        # ef_search is read when the index is loaded, so reopen the client after changing it
+        collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+        SharedSystemClient.clear_system_cache()
+        client = chromadb.PersistentClient(path=directory)
+        collection = client.get_collection(name)
+        collection.query(query_embeddings=[queries[0]], n_results=args.top_k, include=[])
+
+        latencies = []
+        hits = 0
+        for query, expected in zip(queries, exact):
+            with Timer() as query_timer:
+                found = collection.query(query_embeddings=[query], n_results=args.top_k, include=[])
+            latencies.append(query_timer.elapsed * 1000)
+            hits += len({int(doc_id) for doc_id in found["ids"][0]} & set(expected.tolist()))
+
+        rows.append({
+            "M": max_neighbors,
+            "ef_construction": ef_construction,
+            "ef_search": ef_search,
+            "build s": build_timer.elapsed,
+            f"recall@{args.top_k}": hits / (args.top_k * len(queries)),
+            "query p50 ms": statistics.median(latencies),
+            "query p95 ms": float(np.percentile(latencies, 95)),
+        })
+    client.delete_collection(name)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep ChromaDB HNSW settings for recall and latency")
+    parser.add_argument("--source", choices=("synthetic", "config"), default="synthetic",
+                        help="Use random clustered vectors or the configured collection")
+    parser.add_argument("--config", default="config.yaml", help="Path to config.yaml (--source config)")
+    parser.add_argument("--docs", type=int, default=20000, help="Maximum number of vectors")
+    parser.add_argument("--dimensions", type=int, default=384, help="Vector dimensions (synthetic)")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--space", choices=("l2", "cosine", "ip"), default="l2", help="Distance function")
+    parser.add_argument("--max-neighbors", type=int_list, default=[16, 32], help="Comma-separated M values")
+    parser.add_argument("--ef-construction", type=int_list, default=[100, 200],
+                        help="Comma-separated ef_construction values")
+    parser.add_argument("--ef-search", type=int_list, default=[10, 20, 50, 100, 200],
+                        help="Comma-separated ef_search values")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    if args.source == "config":
+        vectors = load_collection_vectors(args.config, args.docs)
+    else:
+        vectors = clustered_vectors(rng, args.docs, args.dimensions)
+    # Queries near stored vectors, like real questions near their answers
+    scale = float(np.linalg.norm(vectors, axis=1).mean())
+    queries = vectors[rng.choice(len(vectors), args.queries)] + 0.5 * scale * rng.standard_normal(
+        (args.queries, vectors.shape[1])).astype(np.float32) / np.sqrt(vectors.shape[1])
+    exact = exact_neighbours(vectors, queries, args.space, args.top_k)
+    ids = [str(i) for i in range(len(vectors))]
+
+    directory = tempfile.mkdtemp(prefix="ici-bench-hnsw-")
+    rows = []
+    try:
+        for max_neighbors in args.max_neighbors:
+            for ef_construction in args.ef_construction:
+                rows.extend(sweep_index(directory, vectors, ids, queries, exact, max_neighbors, ef_construction, args))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"source: {args.source}  vectors: {len(vectors)}  dimensions: {vectors.shape[1]}  "
+          f"queries: {args.queries}  top-k: {args.top_k}  space: {args.space}")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
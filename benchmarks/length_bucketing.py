@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Length-bucketing benchmark for SentenceTransformerEmbedder.
+
+Encodes a mixed-length synthetic chat corpus (short WhatsApp-shaped documents
+and long Telegram-shaped chunks) two ways:
+
+- single encode() call: what embed_batch() does. SentenceTransformer.encode
+  sorts its input by length before batching, so similar lengths already
+  share a forward pass.
+- token-length buckets: tokenize every text first, sort by token count and
+  call encode() once per batch_size bucket.
+
+Reports docs/sec and the share of padding tokens. Padding is measured after
+timing, so the extra tokenizer pass counts only against the bucketed mode,
+which needs it to form buckets.
+
+Usage:
+    python benchmarks/length_bucketing.py [--docs N] [--config-path PATH]
+"""
+
+import argparse
+import asyncio
+import os
+
+import numpy as np
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+
+
+def token_lengths(model, texts):
+    """Token count of each text, capped at the model's max sequence length."""
+    encoded = model.tokenizer(texts, add_special_tokens=True, truncation=True, max_length=model.max_seq_length)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def padding_ratio(lengths, batches):
+    """Share of padded positions that are padding, for batches of text indices."""
+    real = sum(lengths)
+    padded = sum(max(lengths[i] for i in batch) * len(batch) for batch in batches)
+    return 1 - real / padded if padded else 0.0
+
+
+def single_call(embedder, texts):
+    """The embed_batch() path: one encode() call over the whole list."""
+    return embedder._encode_texts(texts)
+
+
+def token_buckets(embedder, texts):
+    """Pre-tokenize, sort by token count and encode each batch_size bucket separately."""
+    lengths = token_lengths(embedder._model, texts)
+    order = sorted(range(len(texts)), key=lambda i: lengths[i])
+    vectors = None
+    for start in range(0, len(order), embedder._batch_size):
+        bucket = order[start:start + embedder._batch_size]
+        bucket_vectors = embedder._model.encode(
+            [texts[i] for i in bucket], batch_size=embedder._batch_size, convert_to_numpy=True
+        )
+        if vectors is None:
+            vectors = np.empty((len(texts), bucket_vectors.shape[1]), dtype=np.float32)
+        vectors[bucket] = bucket_vectors
+    return vectors
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark length-bucketed embedding batches")
+    parser.add_argument("--docs", type=int, default=2000, help="Number of synthetic documents")
+    parser.add_argument("--config-path", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    os.environ["ICI_CONFIG_PATH"] = args.config_path
+
+    embedder = SentenceTransformerEmbedder()
+    await embedder.initialize()
+
+    texts = synthetic_corpus(args.docs)
+    lengths = token_lengths(embedder._model, texts)
+    batch_size = embedder._batch_size
+
+    # encode() batches in order of descending character length
+    by_chars = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+    by_tokens = sorted(range(len(texts)), key=lambda i: lengths[i])
+    batches = {
+        "single encode() call": [by_chars[i:i + batch_size] for i in range(0, len(texts), batch_size)],
+        "token-length buckets": [by_tokens[i:i + batch_size] for i in range(0, len(texts), batch_size)],
+    }
+
+    # Warm up the model so the first call's overhead is not measured
+    embedder._encode_texts(texts[:8])
+
+    rows = []
+    for mode, encode in (("single encode() call", single_call), ("token-length buckets", token_buckets)):
+        with Timer() as timer:
+            encode(embedder, texts)
+        rows.append({
+            "mode": mode,
+            "seconds": timer.elapsed,
+            "docs/sec": len(texts) / timer.elapsed,
+            "padding ratio": padding_ratio(lengths, batches[mode]),
+        })
+    for row in rows:
+        row["speedup"] = rows[0]["seconds"] / row["seconds"]
+
+    print(f"Model: {embedder._model_name}  device: {embedder._device}  "
+          f"encode batch_size: {batch_size}  docs: {args.docs}")
+    print_table(rows)
+
+    await embedder.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Allocation benchmark for passing embedding vectors to the vector store.
+
+Compares the list path (embed_batch() returning one list of Python floats
+per document, converted back to an array for Chroma) with the array path
+(embed_batch_array() returning one contiguous float32 matrix per batch)
+using tracemalloc, on a synthetic chat corpus. Results are reported end to
+end and for the vector hand-off alone (model output -> store input), where
+the model's own allocations do not hide the difference.
+
+Usage:
+    python benchmarks/vector_allocations.py [--docs N] [--pipeline-batch-size N]
+                                            [--config-path PATH]
+"""
+
+import argparse
+import asyncio
+import os
+import tracemalloc
+
+import numpy as np
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+
+
+async def list_path(embedder, batch):
+    """Previous contract: lists of floats, converted to an array by the store."""
+    results = await embedder.embed_batch(batch)
+    vectors = [vector for vector, _ in results]
+    return np.asarray(vectors, dtype=np.float32)
+
+
+async def array_path(embedder, batch):
+    """Current contract: one float32 matrix handed straight to the store."""
+    vectors, _ = await embedder.embed_batch_array(batch)
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def handoff_lists(matrix):
+    """Vector hand-off of the list path: box every float, then unbox for the store."""
+    return np.asarray(matrix.tolist(), dtype=np.float32)
+
+
+def handoff_array(matrix):
+    """Vector hand-off of the array path."""
+    return np.ascontiguousarray(matrix, dtype=np.float32)
+
+
+def measure_handoff(handoff, matrices) -> dict:
+    """Run the vector hand-off for every batch, tracking Python-level allocations."""
+    tracemalloc.start()
+    with Timer() as timer:
+        for matrix in matrices:
+            handoff(matrix)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": timer.elapsed, "peak traced MiB": peak / 2**20}
+
+
+async def measure(path, embedder, texts, batch_size: int) -> dict:
+    """Run a path over all batches, tracking Python-level allocations."""
+    tracemalloc.start()
+    with Timer() as timer:
+        for i in range(0, len(texts), batch_size):
+            await path(embedder, texts[i:i + batch_size])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": timer.elapsed, "peak traced MiB": peak / 2**20}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding vector allocations")
+    parser.add_argument("--docs", type=int, default=2000, help="Number of synthetic documents")
+    parser.add_argument("--pipeline-batch-size", type=int, default=100,
+                        help="Documents per pipeline batch (pipelines.default.batch_size)")
+    parser.add_argument("--config-path", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    os.environ["ICI_CONFIG_PATH"] = args.config_path
+
+    embedder = SentenceTransformerEmbedder()
+    await embedder.initialize()
+    # Measure the model, not the persistent embedding cache
+    embedder._cache = None
+
+    texts = synthetic_corpus(args.docs)
+
+    # Warm up the model so the first call's overhead is not measured
+    await embedder.embed_batch_array(texts[:8])
+
+    rows = []
+    for name, path in (("embed_batch() lists", list_path), ("embed_batch_array()", array_path)):
+        row = {"mode": name}
+        row.update(await measure(path, embedder, texts, args.pipeline_batch_size))
+        rows.append(row)
+
+    matrices = [
+        (await embedder.embed_batch_array(texts[i:i + args.pipeline_batch_size]))[0]
+        for i in range(0, len(texts), args.pipeline_batch_size)
+    ]
+    handoff_rows = []
+    for name, handoff in (("embed_batch() lists", handoff_lists), ("embed_batch_array()", handoff_array)):
+        row = {"mode": name}
+        row.update(measure_handoff(handoff, matrices))
+        handoff_rows.append(row)
+
+    print(f"Model: {embedder._model_name}  device: {embedder._device}  "
+          f"dimensions: {embedder.dimensions}  docs: {args.docs}  "
+          f"pipeline batch size: {args.pipeline_batch_size}")
+    print("\nEnd to end (embed + hand-off):")
+    print_table(rows)
+    print("\nVector hand-off only:")
+    print_table(handoff_rows)
+
+    await embedder.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Insert, query and cold-open benchmark for the vector store backends.
+
+Fills ChromaDBStore and NumpyVectorStore (flat and IVF) with the same
+clustered random unit vectors (chat topics) and chat-shaped metadata in
+temporary directories, then reports
+insert throughput, single-query and batched-query latency, the time to open
+an existing store and answer a first query, and recall@k against exact
+search. Embeddings are random, so the model is not needed.
+
+Usage:
+    python benchmarks/vector_store_backends.py [--docs N] [--dimensions D]
+                                               [--queries N] [--top-k K] [--nprobe N]
+                                               [--backends chroma,numpy,numpy-ivf]
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+
+from common import Timer, print_table, synthetic_corpus
+
+from ici.adapters.vector_stores.chroma import ChromaDBStore
+from ici.adapters.vector_stores.numpy_store import NumpyVectorStore
+
+
+class NullLogger:
+    """Discards log records; per-call logging would dominate the timings."""
+
+    def _discard(self, *args, **kwargs) -> None:
+        pass
+
+    debug = info = warning = error = _discard
+
+
+def backend_config(name: str, directory: str, args) -> dict:
+    """Per-backend settings pointing at a temporary directory."""
+    if name == "chroma":
+        return {"type": "chroma", "collection_name": "benchmark", "persist_directory": directory}
+    if name == "numpy-ivf":
+        nlist = max(1, int(np.sqrt(args.docs)))
+        return {"type": "numpy", "persist_directory": directory,
+                "index": {"type": "ivf", "nlist": nlist, "nprobe": args.nprobe,
+                          "min_train_size": min(args.docs, 10000)}}
+    return {"type": "numpy", "persist_directory": directory, "index": {"type": "flat"}}
+
+
+async def open_store(name: str, config: dict):
+    """Create and initialize a backend with its settings patched in."""
+    if name == "chroma":
+        store_class, module = ChromaDBStore, "ici.adapters.vector_stores.chroma"
+    else:
+        store_class, module = NumpyVectorStore, "ici.adapters.vector_stores.numpy_store"
+    with patch(f"{module}.get_component_config", return_value=config):
+        store = store_class(logger_name=f"benchmark.{name}")
+        store.logger = NullLogger()
+        await store.initialize()
+    return store
+
+
+def documents_for(texts):
+    return [
+        {"text": text, "metadata": {"source": "benchmark", "chat_id": f"chat_{i % 50}",
+                                    "message_id": i + 1, "timestamp": 1700000000 + i}}
+        for i, text in enumerate(texts)
+    ]
+
+
+def clustered_vectors(rng, count: int, dimensions: int, topics: int = 200) -> np.ndarray:
+    """Unit vectors scattered around topic centres, like embeddings of chat messages."""
+    centres = rng.standard_normal((topics, dimensions)).astype(np.float32)
+    vectors = centres[rng.integers(topics, size=count)] + 0.8 * rng.standard_normal(
+        (count, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def recall_at_k(results, exact_ids, k: int) -> float:
+    """Share of the exact top-k documents that a backend returned."""
+    hits = sum(
+        len({doc["metadata"]["message_id"] for doc in found[:k]} & expected)
+        for found, expected in zip(results, exact_ids)
+    )
+    return hits / (k * len(exact_ids))
+
+
+async def benchmark_backend(name, directory, documents, vectors, queries, args) -> dict:
+    config = backend_config(name, directory, args)
+    store = await open_store(name, config)
+
+    with Timer() as insert_timer:
+        for i in range(0, len(documents), args.batch_size):
+            store.add_documents(documents[i:i + args.batch_size], vectors[i:i + args.batch_size])
+    if isinstance(store, NumpyVectorStore):
+        store.close()
+    del store
+
+    # Cold open: a fresh instance on the existing directory answering its first query
+    with Timer() as open_timer:
+        store = await open_store(name, config)
+        store.search(queries[0].tolist(), num_results=args.top_k)
+
+    latencies = []
+    results = []
+    for query in queries:
+        with Timer() as query_timer:
+            found = store.search(query.tolist(), num_results=args.top_k)
+        latencies.append(query_timer.elapsed * 1000)
+        results.append(found)
+
+    with Timer() as batch_timer:
+        store.search_batch(queries, num_results=args.top_k)
+
+    if isinstance(store, NumpyVectorStore):
+        store.close()
+
+    return {
+        "backend": name,
+        "insert docs/sec": len(documents) / insert_timer.elapsed,
+        "cold open ms": open_timer.elapsed * 1000,
+        "query p50 ms": statistics.median(latencies),
+        "query p95 ms": float(np.percentile(latencies, 95)),
+        "batch queries/sec": len(queries) / batch_timer.elapsed,
+        "results": results,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector store backends")
+    parser.add_argument("--docs", type=int, default=20000, help="Number of documents")
+    parser.add_argument("--dimensions", type=int, default=384, help="Vector dimensions")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--batch-size", type=int, default=100, help="Documents per add_documents call")
+    parser.add_argument("--nprobe", type=int, default=8, help="IVF partitions scanned per query (numpy-ivf)")
+    parser.add_argument("--backends", default="chroma,numpy,numpy-ivf",
+                        help="Comma-separated backends: chroma, numpy, numpy-ivf")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = clustered_vectors(rng, args.docs, args.dimensions)
+    # Queries near stored vectors, like real questions near their answers
+    queries = vectors[rng.choice(args.docs, args.queries)] + 0.5 * rng.standard_normal(
+        (args.queries, args.dimensions)).astype(np.float32) / np.sqrt(args.dimensions)
+    documents = documents_for(synthetic_corpus(args.docs))
+
+    exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :args.top_k]
+    exact_ids = [{documents[i]["metadata"]["message_id"] for i in row} for row in exact]
+
+    rows = []
+    for name in [b for b in args.backends.split(",") if b]:
+        directory = tempfile.mkdtemp(prefix=f"ici-bench-{name}-")
+        try:
+            row = await benchmark_backend(name, directory, documents, vectors, queries, args)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        row[f"recall@{args.top_k}"] = recall_at_k(row.pop("results"), exact_ids, args.top_k)
+        rows.append(row)
+
+    print(f"docs: {args.docs}  dimensions: {args.dimensions}  queries: {args.queries}  top-k: {args.top_k}")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -151,11 +151,8 @@ class JSONChatHistoryManager(ChatHistoryManager):
         """
         try:
             async with self.lock:
-                if not os.path.exists(chat_path):
-                    raise ChatIDError(f"Chat file not found: {chat_path}")
-                    
-                with open(chat_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # File I/O runs in a worker thread so it does not block the event loop
+                return await asyncio.to_thread(self._read_chat_file, chat_path)
         except json.JSONDecodeError as e:
             raise ChatStorageError(f"Invalid JSON in chat file {chat_path}: {e}")
         except Exception as e:
@@ -174,22 +171,53 @@ class JSONChatHistoryManager(ChatHistoryManager):
         """
         try:
             async with self.lock:
-                # Ensure the directory exists
-                os.makedirs(os.path.dirname(chat_path), exist_ok=True)
-                
-                # Write to a temporary file first, then rename for atomicity
-                temp_path = f"{chat_path}.tmp"
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(chat_data, f, indent=2, ensure_ascii=False)
-                
-                # Set permissions before renaming
-                os.chmod(temp_path, self.file_permissions)
-                
-                # Rename (atomic operation on most filesystems)
-                os.replace(temp_path, chat_path)
+                # File I/O runs in a worker thread so it does not block the event loop
+                await asyncio.to_thread(self._write_chat_file, chat_data, chat_path)
         except Exception as e:
             raise ChatStorageError(f"Failed to save chat to {chat_path}: {e}")
     
+    @staticmethod
+    def _read_chat_file(chat_path: str) -> Dict[str, Any]:
+        """
+        Read a chat file (blocking).
+        
+        Args:
+            chat_path: Path to the chat file
+            
+        Returns:
+            Dict[str, Any]: The chat data
+            
+        Raises:
+            ChatIDError: If the file does not exist
+        """
+        if not os.path.exists(chat_path):
+            raise ChatIDError(f"Chat file not found: {chat_path}")
+            
+        with open(chat_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_chat_file(self, chat_data: Dict[str, Any], chat_path: str) -> None:
+        """
+        Write a chat file atomically (blocking).
+        
+        Args:
+            chat_data: The chat data to save
+            chat_path: Path to the chat file
+        """
+        # Ensure the directory exists
+        os.makedirs(os.path.dirname(chat_path), exist_ok=True)
+        
+        # Write to a temporary file first, then rename for atomicity
+        temp_path = f"{chat_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(chat_data, f, indent=2, ensure_ascii=False)
+        
+        # Set permissions before renaming
+        os.chmod(temp_path, self.file_permissions)
+        
+        # Rename (atomic operation on most filesystems)
+        os.replace(temp_path, chat_path)
+    
     async def _find_chat_file_by_id(self, chat_id: str) -> str:
         """
         Find a chat file by its ID.
@@ -205,12 +233,26 @@ class JSONChatHistoryManager(ChatHistoryManager):
         """
         # This could be optimized in a real implementation with indexing
         # For now, search through all files (inefficient but simple)
+        chat_path = await asyncio.to_thread(self._walk_for_chat_file, chat_id)
+        if chat_path is None:
+            raise ChatIDError(f"Chat ID not found: {chat_id}")
+        return chat_path
+    
+    def _walk_for_chat_file(self, chat_id: str) -> Optional[str]:
+        """
+        Walk base_path for a chat file (blocking).
+        
+        Args:
+            chat_id: The chat ID to find
+            
+        Returns:
+            Optional[str]: The path to the chat file, or None if there is none
+        """
         for root, dirs, files in os.walk(self.base_path):
             for file in files:
                 if file == f"{chat_id}.json" or file.endswith(f"_{chat_id}.json"):
                     return os.path.join(root, file)
-        
-        raise ChatIDError(f"Chat ID not found: {chat_id}")
+        return None
     
     async def create_chat(self, user_id: str) -> str:
         """
@@ -28,6 +28,7 @@ except ImportError as e:
 
 try:
     from ici.adapters.orchestrators import DefaultOrchestrator
+    from ici.core.exceptions import GenerationError
     # print("Successfully imported DefaultOrchestrator")
 except ImportError as e:
     print(f"Error importing DefaultOrchestrator: {e}")
@@ -84,6 +85,7 @@ async def command_line_controller():
                     
                 if user_input.lower() in ('exit', 'quit'):
                     print("Exiting...")
+                    await orchestrator.close()
                     break
                     
                 if user_input.lower() == 'help':
@@ -102,21 +104,30 @@ async def command_line_controller():
                         print(f"  - {component}: {health_str}")
                     continue
                     
+                if user_input.lower() == 'stats':
+                    print_stats(orchestrator.stats())
+                    continue
+                    
                 # Process the query
                 try:
                     print("Processing your query...")
                     # Set source to COMMAND_LINE and user_id to admin
                     additional_info = {"session_id": "cli-session"}
-                    response = await orchestrator.process_query(
+                    
+                    # Print the response as it is generated
+                    print("\nResponse:")
+                    async for chunk in orchestrator.process_query_stream(
                         source="cli",
                         user_id="admin",
                         query=user_input,
                         additional_info=additional_info
-                    )
+                    ):
+                        print(chunk, end="", flush=True)
+                    print()
                     
-                    # Print the response
-                    print("\nResponse:")
-                    print(response)
+                except GenerationError as e:
+                    # Part of the response was already printed
+                    print(f"\n[Response incomplete: {str(e)}]")
                     
                 except Exception as e:
                     print(f"\nError processing query: {str(e)}")
@@ -141,13 +152,42 @@ async def shutdown(orchestrator: DefaultOrchestrator):
     """
     print("\nShutting down... Please wait.")
     
-    # Perform any cleanup here if needed
-    # For now we just exit
+    # Stop background ingestion
+    await orchestrator.close()
     
     print("Shutdown complete.")
     sys.exit(0)
 
 
+def print_stats(stats: Dict[str, Any]):
+    """
+    Print per-stage latency percentiles.
+    
+    Args:
+        stats: Result of DefaultOrchestrator.stats()
+    """
+    spans = stats.get("spans", {})
+    if not spans:
+        print("\nNo stage latencies recorded yet.")
+        return
+    
+    print("\nStage latency (ms):")
+    print(f"  {'stage':<22} {'count':>7} {'errors':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for name, span in spans.items():
+        print(
+            f"  {name:<22} {span['count']:>7} {span['errors']:>7} "
+            f"{span['p50'] * 1000:>9.1f} {span['p95'] * 1000:>9.1f} "
+            f"{span['p99'] * 1000:>9.1f} {span['max'] * 1000:>9.1f}"
+        )
+    
+    export = stats.get("export")
+    if export:
+        print(
+            f"Metrics export: {export['format']} to {export['destination']} "
+            f"({export['exports']} exports, {export['failures']} failures)"
+        )
+
+
 def print_help():
     """
     Print available commands.
@@ -155,6 +195,7 @@ def print_help():
     print("\nAvailable commands:")
     print("  help    - Show this help message")
     print("  health  - Check the health of the system")
+    print("  stats   - Show per-stage latency percentiles")
     print("  exit    - Exit the application")
     print("  quit    - Exit the application")
     print("Any other input will be processed as a query to the system.")
\ No newline at end of file
@@ -7,5 +7,8 @@ providing embedding functionality for text data.
 
 # Import adapters
 from .sentence_transformer import SentenceTransformerEmbedder 
+from .cache import EmbeddingCache
+from .micro_batcher import MicroBatchingEmbedder
+from .factory import create_embedder
 
-__all__ = ["SentenceTransformerEmbedder"]
\ No newline at end of file
+__all__ = ["SentenceTransformerEmbedder", "EmbeddingCache", "MicroBatchingEmbedder", "create_embedder"]
\ No newline at end of file
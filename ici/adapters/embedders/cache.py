@@ -0,0 +1,275 @@
+"""
+Persistent embedding cache for Embedder implementations.
+
+This module provides an EmbeddingCache class that stores embedding vectors in
+a SQLite database keyed by (model_name, sha256(text)), so texts that were
+already embedded (overlapping chunks, re-syncs, repeated queries) don't need
+to go through the model again.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ici.adapters.loggers.structured_logger import StructuredLogger
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with size-bounded LRU eviction.
+    
+    Vectors are stored as float32 blobs. Every hit refreshes the entry's
+    last access time, and once the cache holds more than max_entries rows
+    the least recently used entries are evicted. Hit and miss counters are
+    kept in memory for monitoring.
+    """
+    
+    # SQLite limits the number of bound parameters per statement
+    _QUERY_CHUNK_SIZE = 500
+    
+    def __init__(self, db_path: str, max_entries: int = 100000, logger_name: str = "embedding_cache"):
+        """
+        Initialize the EmbeddingCache.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            max_entries: Maximum number of cached embeddings before LRU eviction
+            logger_name: Name for the logger
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = StructuredLogger(name=logger_name)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        # Every thread's connection, so close() can reach all of them
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._initialized = False
+        
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get a thread-local database connection.
+        
+        Returns:
+            sqlite3.Connection: A SQLite connection object for the current thread
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Each connection is only used by its own thread; check_same_thread is
+            # off so that close() can close it from whichever thread calls it
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+    
+    def initialize(self) -> None:
+        """
+        Create the cache database and table if they don't exist.
+        
+        Returns:
+            None
+            
+        Raises:
+            Exception: If database initialization fails
+        """
+        try:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            
+            connection = self._get_connection()
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute('''
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_name TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model_name, text_hash)
+            )
+            ''')
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)"
+            )
+            connection.commit()
+            self._initialized = True
+            
+            self.logger.info({
+                "action": "EMBEDDING_CACHE_INIT",
+                "message": "Embedding cache initialized",
+                "data": {"db_path": self.db_path, "max_entries": self.max_entries, "entries": self.count()}
+            })
+            
+        except Exception as e:
+            self.logger.error({
+                "action": "EMBEDDING_CACHE_INIT_ERROR",
+                "message": f"Failed to initialize embedding cache: {str(e)}",
+                "data": {"db_path": self.db_path, "error": str(e)}
+            })
+            raise
+    
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        Hash a text for use as a cache key.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            str: SHA-256 hex digest of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    
+    def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings for a list of texts.
+        
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts to look up
+            
+        Returns:
+            List[Optional[List[float]]]: The cached vector for each text, or None on a miss
+        """
+        return [
+            vector.tolist() if vector is not None else None
+            for vector in self.get_many_arrays(model_name, texts)
+        ]
+    
+    def get_many_arrays(self, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached embeddings for a list of texts as float32 arrays.
+        
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts to look up
+            
+        Returns:
+            List[Optional[np.ndarray]]: A read-only float32 vector for each text, or None on a miss
+        """
+        if not self._initialized:
+            raise RuntimeError("EmbeddingCache not initialized. Call initialize() first.")
+        
+        hashes = [self.hash_text(text) for text in texts]
+        found = {}
+        
+        connection = self._get_connection()
+        unique_hashes = list(dict.fromkeys(hashes))
+        for i in range(0, len(unique_hashes), self._QUERY_CHUNK_SIZE):
+            chunk = unique_hashes[i:i + self._QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model_name = ? AND text_hash IN ({placeholders})",
+                [model_name, *chunk]
+            ).fetchall()
+            for text_hash, blob in rows:
+                found[text_hash] = np.frombuffer(blob, dtype=np.float32)
+        
+        results = [found.get(text_hash) for text_hash in hashes]
+        hits = sum(1 for vector in results if vector is not None)
+        self._hits += hits
+        self._misses += len(results) - hits
+        
+        # Refresh recency of the entries that were used
+        if found:
+            now = time.time()
+            with self._write_lock:
+                connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE model_name = ? AND text_hash = ?",
+                    [(now, model_name, text_hash) for text_hash in found]
+                )
+                connection.commit()
+        
+        return results
+    
+    def put_many(self, model_name: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Store embeddings for a list of texts, evicting least recently used entries if needed.
+        
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts that were embedded
+            vectors: Embedding vector for each text (lists or rows of a float32 array)
+        """
+        if not self._initialized:
+            raise RuntimeError("EmbeddingCache not initialized. Call initialize() first.")
+        
+        if not texts:
+            return
+        
+        now = time.time()
+        rows = [
+            (model_name, self.hash_text(text), np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for text, vector in zip(texts, vectors)
+        ]
+        
+        connection = self._get_connection()
+        with self._write_lock:
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model_name, text_hash, vector, last_access) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            
+            overflow = self.count() - self.max_entries
+            if overflow > 0:
+                connection.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY last_access ASC, rowid ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self._evictions += overflow
+            
+            connection.commit()
+    
+    def count(self) -> int:
+        """
+        Count the cached embeddings.
+        
+        Returns:
+            int: Number of entries in the cache
+        """
+        return self._get_connection().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Hit/miss counters, hit rate, evictions and size
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "entries": self.count() if self._initialized else 0,
+            "max_entries": self.max_entries
+        }
+    
+    def close(self) -> None:
+        """
+        Close the database connections of all threads.
+        
+        Threads that use the object afterwards open new connections.
+        
+        Returns:
+            None
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
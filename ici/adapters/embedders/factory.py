@@ -0,0 +1,45 @@
+"""
+Factory for creating Embedder implementations.
+
+This module provides a factory function to create the configured
+Embedder, optionally wrapped in a MicroBatchingEmbedder.
+"""
+
+import os
+from typing import Optional
+
+from ici.core.interfaces.embedder import Embedder
+from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+from ici.adapters.embedders.micro_batcher import MicroBatchingEmbedder
+from ici.utils.config import get_component_config
+
+
+def create_embedder(logger_name: str = "embedder", config_path: Optional[str] = None) -> Embedder:
+    """
+    Creates the configured Embedder implementation.
+    
+    The returned embedder is not initialized; call initialize() on it.
+    
+    Args:
+        logger_name: Name to use for the logger
+        config_path: Path to the config file (defaults to ICI_CONFIG_PATH or config.yaml)
+        
+    Returns:
+        Embedder: A SentenceTransformerEmbedder, wrapped in a MicroBatchingEmbedder
+            when embedders.sentence_transformer.micro_batching.enabled is set
+    """
+    config_path = config_path or os.environ.get("ICI_CONFIG_PATH", "config.yaml")
+    embedder_config = get_component_config("embedders.sentence_transformer", config_path)
+    
+    embedder: Embedder = SentenceTransformerEmbedder(logger_name=logger_name)
+    
+    batching_config = embedder_config.get("micro_batching", {})
+    if batching_config.get("enabled", False):
+        embedder = MicroBatchingEmbedder(
+            embedder,
+            max_batch_size=int(batching_config.get("max_batch_size", 64)),
+            max_wait_ms=float(batching_config.get("max_wait_ms", 5)),
+            logger_name=f"{logger_name}.batcher"
+        )
+    
+    return embedder
@@ -0,0 +1,340 @@
+"""
+Micro-batching wrapper for Embedder implementations.
+
+This module provides a MicroBatchingEmbedder that coalesces concurrent embed
+requests (interactive queries and ingestion batches) into shared model calls,
+serving interactive queries ahead of ingestion traffic.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ici.core.interfaces.embedder import Embedder
+from ici.core.exceptions import EmbeddingError
+from ici.adapters.loggers.structured_logger import StructuredLogger
+
+
+class MicroBatchingEmbedder(Embedder):
+    """
+    Embedder that groups concurrent requests into batched calls of a wrapped embedder.
+
+    Requests are queued and flushed once max_batch_size texts are waiting or
+    max_wait_ms has elapsed since the first one arrived. embed() is treated as
+    interactive traffic and embed_batch() as bulk (ingestion) traffic; each
+    flushed batch takes interactive texts first, so a query never waits behind
+    more than the batch already in flight.
+    """
+
+    PRIORITY_QUERY = 0
+    PRIORITY_BULK = 1
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        logger_name: str = "micro_batcher"
+    ):
+        """
+        Initialize the MicroBatchingEmbedder.
+
+        Args:
+            embedder: The embedder that performs the actual encoding
+            max_batch_size: Maximum number of texts per call to the wrapped embedder
+            max_wait_ms: Maximum time to wait for more requests before flushing
+            logger_name: Name to use for the logger
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.logger = StructuredLogger(name=logger_name)
+        self._embedder = embedder
+        self._max_batch_size = max_batch_size
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+
+        # Pending (text, future) pairs per priority level
+        self._queues: Dict[int, Deque[Tuple[str, asyncio.Future]]] = {
+            self.PRIORITY_QUERY: deque(),
+            self.PRIORITY_BULK: deque()
+        }
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Counters
+        self._batches = 0
+        self._items = {self.PRIORITY_QUERY: 0, self.PRIORITY_BULK: 0}
+        self._largest_batch = 0
+
+    async def initialize(self) -> None:
+        """
+        Initialize the wrapped embedder.
+
+        Returns:
+            None
+
+        Raises:
+            EmbeddingError: If initialization of the wrapped embedder fails
+        """
+        await self._embedder.initialize()
+
+        self.logger.info({
+            "action": "MICRO_BATCHER_INIT",
+            "message": "Initialized micro-batching embedder",
+            "data": {
+                "embedder": type(self._embedder).__name__,
+                "max_batch_size": self._max_batch_size,
+                "max_wait_ms": self._max_wait * 1000
+            }
+        })
+
+    async def embed(self, text: str) -> Tuple[List[float], Optional[Dict[str, Any]]]:
+        """
+        Generates a vector embedding for an interactive query.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            Tuple[List[float], Optional[Dict[str, Any]]]: The embedding vector and its metadata
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        vector, metadata = await self._enqueue([text], self.PRIORITY_QUERY)[0]
+        return vector.tolist(), metadata
+
+    async def embed_batch(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict[str, Any]]]]:
+        """
+        Generates vector embeddings for bulk (ingestion) traffic.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List[Tuple[List[float], Optional[Dict[str, Any]]]]: One (vector, metadata) tuple per text
+
+        Raises:
+            EmbeddingError: If batch embedding generation fails
+        """
+        if not texts:
+            return []
+
+        results = await asyncio.gather(*self._enqueue(texts, self.PRIORITY_BULK))
+        return [(vector.tolist(), metadata) for vector, metadata in results]
+
+    async def embed_batch_array(self, texts: List[str]) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+        """
+        Generates vector embeddings for bulk (ingestion) traffic as one float32 matrix.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]: A (len(texts), dimensions)
+                float32 array and the metadata for each text
+
+        Raises:
+            EmbeddingError: If batch embedding generation fails
+        """
+        if not texts:
+            return np.empty((0, self.dimensions), dtype=np.float32), []
+
+        results = await asyncio.gather(*self._enqueue(texts, self.PRIORITY_BULK))
+        # Rows may come from several model batches; stack them into one array
+        vectors = np.stack([vector for vector, _ in results])
+        return vectors, [metadata for _, metadata in results]
+
+    def _enqueue(self, texts: List[str], priority: int) -> List[asyncio.Future]:
+        """
+        Queue texts for embedding and make sure the worker is running.
+
+        Args:
+            texts: Texts to embed
+            priority: PRIORITY_QUERY or PRIORITY_BULK
+
+        Returns:
+            List[asyncio.Future]: One future per text, resolved with (float32 row, metadata)
+        """
+        loop = asyncio.get_running_loop()
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run_worker())
+
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queues[priority].append((text, future))
+            futures.append(future)
+
+        self._wakeup.set()
+        return futures
+
+    def _pending_count(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _take_batch(self) -> List[Tuple[str, asyncio.Future, int]]:
+        """
+        Take up to max_batch_size pending requests, interactive ones first.
+
+        Returns:
+            List[Tuple[str, asyncio.Future, int]]: (text, future, priority) per request
+        """
+        batch = []
+        for priority in (self.PRIORITY_QUERY, self.PRIORITY_BULK):
+            queue = self._queues[priority]
+            while queue and len(batch) < self._max_batch_size:
+                text, future = queue.popleft()
+                # Skip requests whose caller has gone away
+                if not future.done():
+                    batch.append((text, future, priority))
+        return batch
+
+    async def _run_worker(self) -> None:
+        """
+        Collect pending requests into batches and dispatch them to the wrapped embedder.
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                await self._wakeup.wait()
+
+                # Give concurrent callers a short window to join the batch
+                deadline = loop.time() + self._max_wait
+                while self._pending_count() < self._max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                batch = self._take_batch()
+                # Keep the worker awake while requests remain queued
+                if self._pending_count():
+                    self._wakeup.set()
+                else:
+                    self._wakeup.clear()
+                if batch:
+                    await self._dispatch(batch)
+        except asyncio.CancelledError:
+            error = EmbeddingError("Micro-batching embedder closed")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            self._fail_pending(error)
+            raise
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future, int]]) -> None:
+        """
+        Embed one batch and resolve each caller's future.
+
+        Args:
+            batch: (text, future, priority) per request
+
+        Returns:
+            None
+        """
+        texts = [text for text, _, _ in batch]
+        try:
+            vectors, metadatas = await self._embedder.embed_batch_array(texts)
+        except Exception as e:
+            self.logger.error({
+                "action": "MICRO_BATCHER_BATCH_ERROR",
+                "message": f"Batched embedding failed: {str(e)}",
+                "data": {"batch_size": len(texts), "error": str(e), "error_type": type(e).__name__}
+            })
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, priority), vector, metadata in zip(batch, vectors, metadatas):
+            self._items[priority] += 1
+            if not future.done():
+                future.set_result((vector, metadata))
+
+        self._batches += 1
+        self._largest_batch = max(self._largest_batch, len(batch))
+
+        self.logger.debug({
+            "action": "MICRO_BATCHER_BATCH",
+            "message": "Dispatched embedding batch",
+            "data": {
+                "batch_size": len(batch),
+                "query_items": sum(1 for _, _, priority in batch if priority == self.PRIORITY_QUERY)
+            }
+        })
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every request that is still queued."""
+        for queue in self._queues.values():
+            while queue:
+                _, future = queue.popleft()
+                if not future.done():
+                    future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching statistics.
+
+        Returns:
+            Dict[str, Any]: Batch counts, item counts per priority and queue depth
+        """
+        total_items = sum(self._items.values())
+        return {
+            "batches": self._batches,
+            "query_items": self._items[self.PRIORITY_QUERY],
+            "bulk_items": self._items[self.PRIORITY_BULK],
+            "average_batch_size": total_items / self._batches if self._batches else 0.0,
+            "largest_batch": self._largest_batch,
+            "pending": self._pending_count(),
+            "max_batch_size": self._max_batch_size,
+            "max_wait_ms": self._max_wait * 1000
+        }
+
+    @property
+    def dimensions(self) -> int:
+        """
+        Returns the dimensionality of the wrapped embedder's vectors.
+
+        Returns:
+            int: The number of dimensions in the embedding vectors
+        """
+        return self._embedder.dimensions
+
+    async def healthcheck(self) -> Dict[str, Any]:
+        """
+        Check the wrapped embedder and report micro-batching statistics.
+
+        Returns:
+            Dict[str, Any]: Health status information
+        """
+        health_result = await self._embedder.healthcheck()
+        health_result.setdefault("details", {})["micro_batching"] = self.stats()
+        return health_result
+
+    async def close(self) -> None:
+        """
+        Stop the batching worker and close the wrapped embedder.
+
+        Returns:
+            None
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._fail_pending(EmbeddingError("Micro-batching embedder closed"))
+
+        if hasattr(self._embedder, "close"):
+            await self._embedder.close()
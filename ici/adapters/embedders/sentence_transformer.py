@@ -7,7 +7,9 @@ the sentence-transformers library for high-quality text embeddings.
 
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
@@ -15,6 +17,7 @@ from ici.core.interfaces.embedder import Embedder
 from ici.core.exceptions import EmbeddingError
 from ici.utils.config import get_component_config
 from ici.adapters.loggers.structured_logger import StructuredLogger
+from ici.adapters.embedders.cache import EmbeddingCache
 
 
 class SentenceTransformerEmbedder(Embedder):
@@ -25,6 +28,9 @@ class SentenceTransformerEmbedder(Embedder):
     using pre-trained sentence transformer models.
     """
     
+    # Supported values of embedders.sentence_transformer.backend
+    BACKENDS = ("torch", "onnx", "int8")
+    
     def __init__(self, logger_name: str = "embedder"):
         """
         Initialize the SentenceTransformerEmbedder.
@@ -35,6 +41,13 @@ class SentenceTransformerEmbedder(Embedder):
         self.logger = StructuredLogger(name=logger_name)
         self._model = None
         self._model_name = None
+        self._backend = "torch"
+        self._backend_cache_dir = "./db/embeddings/models"
+        self._batch_size = 32
+        self._cache = None
+        self._num_workers = 1
+        self._torch_threads = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._is_initialized = False
         self._config_path = os.environ.get("ICI_CONFIG_PATH", "config.yaml")
         self._device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -66,8 +79,39 @@ class SentenceTransformerEmbedder(Embedder):
                 "all-MiniLM-L6-v2"  # Default model: good balance of speed and quality
             )
             
+            # Number of texts passed through the model per forward pass
+            self._batch_size = int(embedder_config.get("batch_size", self._batch_size))
+            
+            # Encoding runs on a dedicated thread pool so it never blocks the event loop
+            self._num_workers = max(1, int(embedder_config.get("num_workers", self._num_workers)))
+            self._torch_threads = embedder_config.get("torch_threads", self._torch_threads)
+            if self._torch_threads:
+                torch.set_num_threads(int(self._torch_threads))
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._num_workers,
+                    thread_name_prefix="embedder"
+                )
+            
+            # Inference backend: eager torch, ONNX Runtime or int8 dynamically quantized torch
+            self._backend = embedder_config.get("backend", self._backend)
+            if self._backend not in self.BACKENDS:
+                raise EmbeddingError(
+                    f"Unsupported backend '{self._backend}', expected one of {', '.join(self.BACKENDS)}"
+                )
+            self._backend_cache_dir = embedder_config.get("backend_cache_dir", self._backend_cache_dir)
+            
             # Load the model
-            self._model = SentenceTransformer(self._model_name, device=self._device)
+            self._model = self._load_model()
+            
+            # Optional persistent cache in front of the model
+            cache_config = embedder_config.get("cache", {})
+            if cache_config.get("enabled", False):
+                self._cache = EmbeddingCache(
+                    db_path=cache_config.get("path", "./db/embeddings/embedding_cache.db"),
+                    max_entries=int(cache_config.get("max_entries", 100000))
+                )
+                self._cache.initialize()
             
             # Set initialization flag
             self._is_initialized = True
@@ -77,7 +121,12 @@ class SentenceTransformerEmbedder(Embedder):
                 "message": f"Successfully initialized SentenceTransformer embedder with model '{self._model_name}'",
                 "data": {
                     "model_name": self._model_name,
+                    "backend": self._backend,
                     "device": self._device,
+                    "batch_size": self._batch_size,
+                    "cache_enabled": self._cache is not None,
+                    "num_workers": self._num_workers,
+                    "torch_threads": self._torch_threads,
                     "embedding_dimensions": self.dimensions
                 }
             })
@@ -118,8 +167,9 @@ class SentenceTransformerEmbedder(Embedder):
                 # Return zero vector for empty/invalid inputs with warning metadata
                 return [0.0] * self.dimensions, {"warning": "Invalid or empty input"}
             
-            # Generate embedding
-            embedding = self._model.encode(text, convert_to_numpy=True).tolist()
+            # Generate embedding (served from the cache when possible)
+            embeddings, cached = await self._encode_async([text])
+            embedding = embeddings[0].tolist()
             
             self.logger.debug({
                 "action": "EMBEDDER_GENERATE",
@@ -133,7 +183,8 @@ class SentenceTransformerEmbedder(Embedder):
             # Return embedding vector and metadata
             metadata = {
                 "model": self._model_name,
-                "text_length": len(text)
+                "text_length": len(text),
+                "cached": cached[0]
             }
             
             return embedding, metadata
@@ -150,6 +201,9 @@ class SentenceTransformerEmbedder(Embedder):
         """
         Generates vector embeddings for multiple texts.
         
+        Compatibility wrapper around embed_batch_array() that converts each
+        vector to a list of floats.
+        
         Args:
             texts: List of texts to embed
             
@@ -159,6 +213,24 @@ class SentenceTransformerEmbedder(Embedder):
                 - A fixed-length vector of floats
                 - Optional metadata about the embedding
             
+        Raises:
+            EmbeddingError: If batch embedding generation fails
+        """
+        embeddings, metadatas = await self.embed_batch_array(texts)
+        return list(zip(embeddings.tolist(), metadatas))
+    
+    async def embed_batch_array(self, texts: List[str]) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+        """
+        Generates vector embeddings for multiple texts as one float32 matrix.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+                - A (len(texts), dimensions) C-contiguous float32 array
+                - Metadata for each text
+            
         Raises:
             EmbeddingError: If batch embedding generation fails
         """
@@ -171,7 +243,7 @@ class SentenceTransformerEmbedder(Embedder):
                     "action": "EMBEDDER_BATCH_EMPTY",
                     "message": "Empty batch for embedding"
                 })
-                return []
+                return np.empty((0, self.dimensions), dtype=np.float32), []
             
             # Process texts for embedding
             valid_texts = []
@@ -189,31 +261,32 @@ class SentenceTransformerEmbedder(Embedder):
                 else:
                     valid_texts.append(text)
             
-            # Generate embeddings in batch
-            embeddings = self._model.encode(valid_texts, convert_to_numpy=True).tolist()
+            # Generate embeddings in batch (served from the cache when possible)
+            embeddings, cached = await self._encode_async(valid_texts)
             
-            # Create result with metadata
-            results = []
-            for i, embedding in enumerate(embeddings):
+            # Create metadata for each text
+            metadatas = []
+            for i, text in enumerate(valid_texts):
                 if i in invalid_indices:
                     metadata = {"warning": "Invalid or empty input", "model": self._model_name}
                 else:
                     metadata = {
                         "model": self._model_name,
-                        "text_length": len(valid_texts[i])
+                        "text_length": len(text),
+                        "cached": cached[i]
                     }
-                results.append((embedding, metadata))
+                metadatas.append(metadata)
             
             self.logger.debug({
                 "action": "EMBEDDER_BATCH_GENERATE",
                 "message": "Generated batch embeddings",
                 "data": {
                     "batch_size": len(texts),
-                    "embedding_size": self.dimensions
+                    "embedding_size": embeddings.shape[1]
                 }
             })
             
-            return results
+            return embeddings, metadatas
             
         except Exception as e:
             self.logger.error({
@@ -223,6 +296,140 @@ class SentenceTransformerEmbedder(Embedder):
             })
             raise EmbeddingError(f"Batch embedding generation failed: {str(e)}") from e
     
+    def _load_model(self) -> SentenceTransformer:
+        """
+        Load the model for the configured backend.
+        
+        The ONNX export is written to backend_cache_dir on first use and loaded
+        from there afterwards. int8 quantizes the Linear layers of the fp32 model
+        with torch dynamic quantization, which is cheap enough to do at load time.
+        
+        The onnx backend needs the optional sentence-transformers[onnx] extra
+        (optimum and onnxruntime).
+        
+        Returns:
+            SentenceTransformer: The loaded model
+        """
+        if self._backend == "onnx":
+            export_path = os.path.join(
+                self._backend_cache_dir, f"{self._model_name.replace('/', '__')}-onnx"
+            )
+            if os.path.isdir(export_path):
+                return SentenceTransformer(export_path, device=self._device, backend="onnx")
+            
+            model = SentenceTransformer(self._model_name, device=self._device, backend="onnx")
+            os.makedirs(self._backend_cache_dir, exist_ok=True)
+            model.save_pretrained(export_path)
+            self.logger.info({
+                "action": "EMBEDDER_ONNX_EXPORTED",
+                "message": f"Exported ONNX model to {export_path}",
+                "data": {"model_name": self._model_name, "path": export_path}
+            })
+            return model
+        
+        if self._backend == "int8":
+            # Dynamic quantization kernels run on CPU only
+            self._device = "cpu"
+            model = SentenceTransformer(self._model_name, device=self._device)
+            return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        
+        return SentenceTransformer(self._model_name, device=self._device)
+    
+    @property
+    def _cache_model_key(self) -> str:
+        """Model key for the embedding cache; other backends produce slightly different vectors."""
+        if self._backend == "torch":
+            return self._model_name
+        return f"{self._model_name}:{self._backend}"
+    
+    async def _encode_async(self, texts: List[str]) -> Tuple[np.ndarray, List[bool]]:
+        """
+        Run _encode on the embedder's executor without blocking the event loop.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Tuple[np.ndarray, List[bool]]: See _encode
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._encode, texts)
+    
+    def _encode(self, texts: List[str]) -> Tuple[np.ndarray, List[bool]]:
+        """
+        Encode texts with the model, using the embedding cache when enabled.
+        
+        Only texts missing from the cache are sent to the model (each distinct
+        text once), and their embeddings are written back to the cache. Cache
+        errors are logged and fall back to the model.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Tuple[np.ndarray, List[bool]]: A (len(texts), dimensions) float32 array
+                of embeddings and whether each one was served from the cache
+        """
+        cached_vectors = [None] * len(texts)
+        if self._cache is not None:
+            try:
+                cached_vectors = self._cache.get_many_arrays(self._cache_model_key, texts)
+            except Exception as e:
+                self.logger.warning({
+                    "action": "EMBEDDER_CACHE_READ_ERROR",
+                    "message": f"Embedding cache lookup failed: {str(e)}",
+                    "data": {"error": str(e), "error_type": type(e).__name__}
+                })
+        cached = [vector is not None for vector in cached_vectors]
+        
+        missing_texts = list(dict.fromkeys(
+            text for text, vector in zip(texts, cached_vectors) if vector is None
+        ))
+        computed = None
+        if missing_texts:
+            computed = self._encode_texts(missing_texts)
+            
+            if self._cache is not None:
+                try:
+                    self._cache.put_many(self._cache_model_key, missing_texts, computed)
+                except Exception as e:
+                    self.logger.warning({
+                        "action": "EMBEDDER_CACHE_WRITE_ERROR",
+                        "message": f"Embedding cache update failed: {str(e)}",
+                        "data": {"error": str(e), "error_type": type(e).__name__}
+                    })
+            
+            # Every text was a distinct miss: the model output already is the result
+            if len(missing_texts) == len(texts):
+                return computed, cached
+        
+        dimensions = computed.shape[1] if computed is not None else cached_vectors[0].shape[0]
+        embeddings = np.empty((len(texts), dimensions), dtype=np.float32)
+        missing_rows = {text: row for row, text in enumerate(missing_texts)}
+        for i, (text, vector) in enumerate(zip(texts, cached_vectors)):
+            embeddings[i] = vector if vector is not None else computed[missing_rows[text]]
+        return embeddings, cached
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Run texts through the model in a single encode() call.
+        
+        SentenceTransformer.encode sorts its input by length before splitting it
+        into batch_size batches and restores the original order afterwards, so
+        texts of similar length already share a forward pass.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            np.ndarray: A (len(texts), dimensions) float32 array of embeddings
+        """
+        return np.asarray(self._model.encode(
+            texts,
+            batch_size=self._batch_size,
+            convert_to_numpy=True
+        ), dtype=np.float32)
+    
     @property
     def dimensions(self) -> int:
         """
@@ -254,6 +461,7 @@ class SentenceTransformerEmbedder(Embedder):
             "message": "SentenceTransformer embedder health check failed",
             "details": {
                 "model_name": self._model_name,
+                "backend": self._backend,
                 "device": self._device,
                 "initialized": self._model is not None
             }
@@ -279,6 +487,10 @@ class SentenceTransformerEmbedder(Embedder):
                 health_result["details"]["embedding_dimensions"] = self.dimensions
                 health_result["details"]["test_successful"] = True
             
+            health_result["details"]["num_workers"] = self._num_workers
+            if self._cache is not None:
+                health_result["details"]["cache"] = self._cache.stats()
+            
             return health_result
             
         except Exception as e:
@@ -290,4 +502,18 @@ class SentenceTransformerEmbedder(Embedder):
             health_result["details"]["error"] = str(e)
             health_result["details"]["error_type"] = type(e).__name__
             
-            return health_result 
\ No newline at end of file
+            return health_result
+    
+    async def close(self) -> None:
+        """
+        Shut down the encoding thread pool and close the embedding cache.
+        
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        if self._cache is not None:
+            self._cache.close()
@@ -8,8 +8,9 @@ that uses LangChain to generate responses with support for multiple LLM provider
 import os
 import time
 import asyncio
-from typing import Dict, Any, Optional, List, Union, cast
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple, Union, cast
 
+import httpx
 from langchain.chains import LLMChain
 from langchain.chains.conversation.memory import ConversationBufferMemory
 from langchain.prompts import PromptTemplate
@@ -21,6 +22,7 @@ from langchain.schema.output import LLMResult, Generation
 from ici.core.interfaces.generator import Generator
 from ici.core.exceptions import GenerationError
 from ici.utils.config import get_component_config
+from ici.utils.cache import TTLLRUCache
 from ici.adapters.loggers.structured_logger import StructuredLogger
 
 
@@ -31,6 +33,9 @@ class LangchainGenerator(Generator):
     Supports multiple model providers with configurable parameters and memory.
     """
     
+    # Generation options that are baked into an LLM client at construction time
+    _LLM_OPTION_KEYS = ("temperature", "max_tokens", "top_p")
+    
     def __init__(self, logger_name: str = "generator"):
         """
         Initialize the LangchainGenerator.
@@ -61,6 +66,15 @@ class LangchainGenerator(Generator):
         self._chain = None
         self._memory = None
         self._prompt_template = None
+        
+        # Configured (llm, chain) pairs keyed by (provider, model, effective options),
+        # so requests with option overrides reuse a client instead of building one
+        self._client_cache_size = 8
+        self._llm_cache: Optional[TTLLRUCache] = None
+        
+        # Pooled HTTP client shared by the OpenAI-compatible providers
+        self._http_pool_config: Dict[str, Any] = {}
+        self._http_async_client: Optional[httpx.AsyncClient] = None
     
     def _get_credentials(self):
         """
@@ -134,7 +148,7 @@ class LangchainGenerator(Generator):
             self._provider = generator_config.get("provider", self._provider)
             
             # Get credentials to verify they exist (but don't store them)
-            credentials = self._get_credentials()
+            self._get_credentials()
             
             # Extract model with default
             self._model = generator_config.get("model", self._model)
@@ -156,34 +170,13 @@ class LangchainGenerator(Generator):
                 k = memory_config.get("k", 5)
                 self._memory = ConversationBufferMemory(k=k)
             
+            # Client cache and HTTP connection pool configuration
+            self._http_pool_config = generator_config.get("http_pool", self._http_pool_config)
+            client_cache_size = generator_config.get("client_cache_size", self._client_cache_size)
+            self._llm_cache = TTLLRUCache(max_size=client_cache_size) if client_cache_size else None
+            
             # Initialize LLM based on provider
-            if self._provider == "openai":
-                self._llm = ChatOpenAI(
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use API key but don't store it as instance variable
-                )
-            elif self._provider == "ollama":
-                self._llm = OllamaLLM(
-                    model=self._model,
-                    base_url=credentials,  # Use base_url from credentials
-                    temperature=self._default_options.get("temperature", 0.7),
-                    # Add other Ollama-specific parameters as needed
-                    num_predict=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                )
-            elif self._provider == "openrouter":
-                self._llm = ChatOpenAI(
-                    base_url="https://openrouter.ai/api/v1",
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use API key but don't store it as instance variable
-                )
-            # Add additional providers here as elif blocks
+            self._llm = self._create_llm(self._default_options)
             
             # Set up prompt template
             template = "System: You are a helpful assistant.\n\nHuman: {prompt}\n\nAssistant:"
@@ -251,6 +244,9 @@ class LangchainGenerator(Generator):
             options.update(generation_options)
         
         try:
+            # Requests with option overrides use a cached client configured with them
+            chain = self._get_llm_and_chain(options)[1] if generation_options else self._chain
+            
             # Call LangChain with retries
             for attempt in range(self._max_retries):
                 try:
@@ -265,51 +261,7 @@ class LangchainGenerator(Generator):
                         }
                     })
                     
-                    # Update LLM parameters if needed
-                    if options:
-                        # Create new LLM instance with updated parameters
-                        temp_llm = None
-                        if self._provider == "openai":
-                            # Get credentials securely when needed
-                            credentials = self._get_credentials()
-                            temp_llm = ChatOpenAI(
-                                model_name=self._model,
-                                temperature=options.get("temperature", self._default_options.get("temperature")),
-                                max_tokens=options.get("max_tokens", self._default_options.get("max_tokens")),
-                                top_p=options.get("top_p", self._default_options.get("top_p")),
-                                api_key=credentials  # Use freshly retrieved credentials
-                            )
-                        elif self._provider == "ollama":
-                            # Get credentials (base_url) securely when needed
-                            credentials = self._get_credentials()
-                            temp_llm = OllamaLLM(
-                                model=self._model,
-                                base_url=credentials,
-                                temperature=options.get("temperature", self._default_options.get("temperature")),
-                                num_predict=options.get("max_tokens", self._default_options.get("max_tokens")),
-                                top_p=options.get("top_p", self._default_options.get("top_p")),
-                            )
-                        elif self._provider == "openrouter":
-                            # Get credentials securely when needed
-                            credentials = self._get_credentials()
-                            self._llm = ChatOpenAI(
-                                base_url="https://openrouter.ai/api/v1",
-                                model_name=self._model,
-                                temperature=self._default_options.get("temperature", 0.7),
-                                max_tokens=self._default_options.get("max_tokens", 1024),
-                                top_p=self._default_options.get("top_p", 1.0),
-                                api_key=credentials  # Use API key but don't store it as instance variable
-                            )
-                        
-                        # Use the temporary LLM for this request if created
-                        if temp_llm:
-                            chain = LLMChain(llm=temp_llm, prompt=self._prompt_template)
-                            response = await chain.ainvoke({"prompt": prompt})
-                        else:
-                            response = await self._chain.ainvoke({"prompt": prompt})
-                    else:
-                        # Use the default chain
-                        response = await self._chain.ainvoke({"prompt": prompt})
+                    response = await chain.ainvoke({"prompt": prompt})
                     
                     # Extract the generated text
                     generated_text = self.extract_text(response)
@@ -368,6 +320,211 @@ class LangchainGenerator(Generator):
             
             raise GenerationError(error_msg) from e
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the pooled HTTP client, creating it on first use.
+        
+        Returns:
+            httpx.AsyncClient: Client whose keep-alive connections are reused across requests
+        """
+        if self._http_async_client is None:
+            pool = self._http_pool_config
+            self._http_async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=pool.get("max_connections", 20),
+                    max_keepalive_connections=pool.get("max_keepalive_connections", 10),
+                    keepalive_expiry=pool.get("keepalive_expiry", 30.0)
+                )
+            )
+        return self._http_async_client
+    
+    def _get_llm_and_chain(self, options: Dict[str, Any]) -> Tuple[BaseLanguageModel, LLMChain]:
+        """
+        Returns an LLM client and chain configured with the given options, from the cache if possible.
+        
+        Args:
+            options: Effective generation options (defaults merged with overrides)
+            
+        Returns:
+            Tuple[BaseLanguageModel, LLMChain]: The LLM client and a chain using it
+        """
+        key = (
+            self._provider,
+            self._model,
+            tuple(options.get(name) for name in self._LLM_OPTION_KEYS)
+        )
+        
+        if self._llm_cache is not None:
+            entry = self._llm_cache.get(key)
+            if entry is not None:
+                return entry
+        
+        llm = self._create_llm(options)
+        entry = (llm, LLMChain(llm=llm, prompt=self._prompt_template))
+        
+        if self._llm_cache is not None:
+            self._llm_cache.set(key, entry)
+        
+        self.logger.debug({
+            "action": "GENERATOR_CLIENT_CREATED",
+            "message": f"Created {self._provider} client for model {self._model}",
+            "data": {"provider": self._provider, "model": self._model, "options": dict(zip(self._LLM_OPTION_KEYS, key[2]))}
+        })
+        
+        return entry
+    
+    def _create_llm(self, options: Dict[str, Any]) -> BaseLanguageModel:
+        """
+        Creates an LLM client for the configured provider with the given options.
+        
+        Args:
+            options: Effective generation options (defaults merged with overrides)
+            
+        Returns:
+            BaseLanguageModel: The configured LLM client
+            
+        Raises:
+            ValueError: If the provider is unsupported or credentials are missing
+        """
+        # Get credentials securely when needed
+        credentials = self._get_credentials()
+        
+        if self._provider == "openai":
+            return ChatOpenAI(
+                model_name=self._model,
+                temperature=options.get("temperature", 0.7),
+                max_tokens=options.get("max_tokens", 1024),
+                top_p=options.get("top_p", 1.0),
+                api_key=credentials,
+                http_async_client=self._get_http_client()
+            )
+        elif self._provider == "ollama":
+            return OllamaLLM(
+                model=self._model,
+                base_url=credentials,
+                temperature=options.get("temperature", 0.7),
+                num_predict=options.get("max_tokens", 1024),
+                top_p=options.get("top_p", 1.0),
+            )
+        elif self._provider == "openrouter":
+            return ChatOpenAI(
+                base_url="https://openrouter.ai/api/v1",
+                model_name=self._model,
+                temperature=options.get("temperature", 0.7),
+                max_tokens=options.get("max_tokens", 1024),
+                top_p=options.get("top_p", 1.0),
+                api_key=credentials,
+                http_async_client=self._get_http_client()
+            )
+        
+        raise ValueError(f"Unsupported provider: {self._provider}")
+    
+    async def generate_stream(
+        self, prompt: str, generation_options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generates text using LangChain, yielding chunks as the provider streams them.
+
+        Transient errors are retried only until the first chunk has been
+        yielded; after that a failure ends the stream with GenerationError.
+
+        Args:
+            prompt: The input prompt for the language model
+            generation_options: Optional parameters to override defaults
+
+        Yields:
+            str: Consecutive pieces of the generated text
+
+        Raises:
+            GenerationError: If text generation fails
+        """
+        if not self._is_initialized:
+            raise GenerationError("Generator not initialized. Call initialize() first.")
+        
+        # Combine default options with request-specific options
+        options = self._default_options.copy()
+        if generation_options:
+            options.update(generation_options)
+        
+        chunks: List[str] = []
+        
+        try:
+            llm = self._get_llm_and_chain(options)[0] if generation_options else self._llm
+            formatted_prompt = self._prompt_template.format(prompt=prompt)
+            
+            for attempt in range(self._max_retries):
+                try:
+                    self.logger.debug({
+                        "action": "GENERATOR_API_CALL",
+                        "message": f"Streaming from LangChain with {self._provider} model {self._model}",
+                        "data": {
+                            "provider": self._provider,
+                            "model": self._model,
+                            "options": options,
+                            "attempt": attempt + 1,
+                            "stream": True
+                        }
+                    })
+                    
+                    async for chunk in llm.astream(formatted_prompt):
+                        text = self.extract_text(chunk)
+                        if text:
+                            chunks.append(text)
+                            yield text
+                    break
+                    
+                except Exception as e:
+                    # Text already shown to the caller cannot be taken back, so only retry before the first chunk
+                    if not chunks and attempt < self._max_retries - 1:
+                        delay = self._base_retry_delay * (2 ** attempt)
+                        
+                        self.logger.warning({
+                            "action": "GENERATOR_RETRY",
+                            "message": f"API error, retrying in {delay} seconds",
+                            "data": {
+                                "error": str(e),
+                                "attempt": attempt + 1,
+                                "max_retries": self._max_retries,
+                                "delay": delay
+                            }
+                        })
+                        
+                        await asyncio.sleep(delay)
+                    else:
+                        raise
+            
+            generated_text = "".join(chunks)
+            if self._memory:
+                self._memory.save_context({"prompt": prompt}, {"text": generated_text})
+            
+            self.logger.info({
+                "action": "GENERATOR_SUCCESS",
+                "message": "Text streamed successfully",
+                "data": {
+                    "provider": self._provider,
+                    "model": self._model,
+                    "prompt_length": len(prompt),
+                    "response_length": len(generated_text)
+                }
+            })
+            
+        except Exception as e:
+            error_msg = f"Failed to stream text: {str(e)}"
+            
+            self.logger.error({
+                "action": "GENERATOR_ERROR",
+                "message": error_msg,
+                "data": {
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "provider": self._provider,
+                    "model": self._model,
+                    "prompt_length": len(prompt)
+                }
+            })
+            
+            raise GenerationError(error_msg) from e
+    
     async def set_model(self, model: str) -> None:
         """
         Sets the specific model to use for generation.
@@ -390,36 +547,7 @@ class LangchainGenerator(Generator):
             self._model = model
             
             # Re-initialize the LLM with the new model
-            if self._provider == "openai":
-                # Get credentials securely when needed
-                credentials = self._get_credentials()
-                self._llm = ChatOpenAI(
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use freshly retrieved credentials
-                )
-            elif self._provider == "ollama":
-                # Get credentials (base_url) securely when needed
-                credentials = self._get_credentials()
-                self._llm = OllamaLLM(
-                    model=self._model,
-                    base_url=credentials,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    num_predict=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                )
-            elif self._provider == "openrouter":
-                self._llm = ChatOpenAI(
-                    base_url="https://openrouter.ai/api/v1",
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use API key but don't store it as instance variable
-                )
-            # Add additional providers here as elif blocks
+            self._llm = self._create_llm(self._default_options)
             
             # Update the chain with the new LLM
             if self._memory:
@@ -483,37 +611,7 @@ class LangchainGenerator(Generator):
             self._default_options.update(options)
             
             # Update the LLM with new default options
-            if self._provider == "openai":
-                # Get credentials securely when needed
-                credentials = self._get_credentials()
-                self._llm = ChatOpenAI(
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use freshly retrieved credentials
-                )
-            elif self._provider == "ollama":
-                # Get credentials (base_url) securely when needed
-                credentials = self._get_credentials()
-                self._llm = OllamaLLM(
-                    model=self._model,
-                    base_url=credentials,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    num_predict=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                )
-            elif self._provider == "openrouter":
-                credentials = self._get_credentials()
-                self._llm = ChatOpenAI(
-                    base_url="https://openrouter.ai/api/v1",
-                    model_name=self._model,
-                    temperature=self._default_options.get("temperature", 0.7),
-                    max_tokens=self._default_options.get("max_tokens", 1024),
-                    top_p=self._default_options.get("top_p", 1.0),
-                    api_key=credentials  # Use API key but don't store it as instance variable
-                )
-            # Add additional providers here as elif blocks
+            self._llm = self._create_llm(self._default_options)
             
             # Update the chain with the new LLM
             if self._memory:
@@ -545,6 +643,20 @@ class LangchainGenerator(Generator):
             
             raise GenerationError(error_msg) from e
     
+    async def close(self) -> None:
+        """
+        Releases cached LLM clients and closes the pooled HTTP connections.
+        
+        Returns:
+            None
+        """
+        if self._llm_cache is not None:
+            self._llm_cache.clear()
+        
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+    
     async def healthcheck(self) -> Dict[str, Any]:
         """
         Checks if the generator is properly configured and can connect to the language model.
@@ -563,7 +675,8 @@ class LangchainGenerator(Generator):
                 "provider": self._provider,
                 "model": self._model,
                 "chain_type": self._chain_type,
-                "has_memory": self._memory is not None
+                "has_memory": self._memory is not None,
+                "client_cache": self._llm_cache.stats() if self._llm_cache else {"enabled": False}
             }
         }
         
@@ -8,7 +8,7 @@ that uses OpenAI's API to generate responses with models like GPT-4o.
 import os
 import time
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 
 import openai
 from openai import AsyncOpenAI
@@ -244,6 +244,126 @@ class OpenAIGenerator(Generator):
             
             raise GenerationError(error_msg) from e
     
+    async def generate_stream(
+        self, prompt: str, generation_options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generates text using OpenAI's streaming API, yielding content deltas as they arrive.
+
+        Transient errors are retried only until the first chunk has been
+        yielded; after that a failure ends the stream with GenerationError.
+
+        Args:
+            prompt: The input prompt for the language model
+            generation_options: Optional parameters to override defaults
+
+        Yields:
+            str: Consecutive pieces of the generated text
+
+        Raises:
+            GenerationError: If text generation fails
+        """
+        if not self._is_initialized:
+            raise GenerationError("Generator not initialized. Call initialize() first.")
+        
+        # Combine default options with request-specific options
+        options = self._default_options.copy()
+        if generation_options:
+            options.update(generation_options)
+        
+        messages = [{"role": "user", "content": prompt}]
+        response_length = 0
+        started = False
+        
+        try:
+            for attempt in range(self._max_retries):
+                try:
+                    self.logger.debug({
+                        "action": "GENERATOR_API_CALL",
+                        "message": f"Streaming from OpenAI API with model {self._model}",
+                        "data": {
+                            "model": self._model,
+                            "options": options,
+                            "attempt": attempt + 1,
+                            "stream": True
+                        }
+                    })
+                    
+                    stream = await self._client.chat.completions.create(
+                        model=self._model,
+                        messages=messages,
+                        temperature=options.get("temperature", 0.7),
+                        max_tokens=options.get("max_tokens", 1024),
+                        top_p=options.get("top_p", 1.0),
+                        frequency_penalty=options.get("frequency_penalty", 0.0),
+                        presence_penalty=options.get("presence_penalty", 0.0),
+                        timeout=30,  # 30 seconds timeout
+                        stream=True
+                    )
+                    
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        content = chunk.choices[0].delta.content
+                        if content:
+                            started = True
+                            response_length += len(content)
+                            yield content
+                    
+                    self.logger.info({
+                        "action": "GENERATOR_SUCCESS",
+                        "message": "Text streamed successfully",
+                        "data": {
+                            "model": self._model,
+                            "prompt_length": len(prompt),
+                            "response_length": response_length
+                        }
+                    })
+                    return
+                    
+                except openai.APIError as e:
+                    # Rate limits, timeouts/connection errors and server errors are transient
+                    status_code = getattr(e, "status_code", None)
+                    transient = status_code is None or status_code == 429 or status_code >= 500
+                    # Text already shown to the caller cannot be taken back, so only retry before the first chunk
+                    if not started and transient and attempt < self._max_retries - 1:
+                        delay = self._base_retry_delay * (2 ** attempt)
+                        
+                        self.logger.warning({
+                            "action": "GENERATOR_RETRY",
+                            "message": f"API error, retrying in {delay} seconds",
+                            "data": {
+                                "error": str(e),
+                                "status_code": status_code,
+                                "attempt": attempt + 1,
+                                "max_retries": self._max_retries,
+                                "delay": delay
+                            }
+                        })
+                        
+                        await asyncio.sleep(delay)
+                    else:
+                        raise
+            
+            raise GenerationError("All retry attempts failed")
+            
+        except Exception as e:
+            error_msg = f"Failed to stream text: {str(e)}"
+            
+            self.logger.error({
+                "action": "GENERATOR_ERROR",
+                "message": error_msg,
+                "data": {
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "model": self._model,
+                    "prompt_length": len(prompt),
+                    "response_length": response_length
+                }
+            })
+            
+            raise GenerationError(error_msg) from e
+    
     async def set_model(self, model: str) -> None:
         """
         Sets the specific OpenAI model to use for generation.
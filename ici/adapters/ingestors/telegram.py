@@ -11,7 +11,7 @@ import threading
 import json
 import traceback
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Iterator, List, Optional, cast, Generator, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast, Generator, Tuple
 
 from telethon import TelegramClient
 from telethon.tl.types import User, Chat, Dialog, Message, InputPeerUser
@@ -249,6 +249,68 @@ class TelegramIngestor(Ingestor):
         
         return result
     
+    async def fetch_full_data_stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch all available conversations, yielding one conversation at a time.
+        
+        Yields:
+            Dict[str, Any]: A single-conversation chunk in the fetch_full_data() format
+                {
+                    "conversations": {"chat_id": [messages]},
+                    "conversation_details": {"chat_id": {conversation metadata}}
+                }
+        """
+        self.logger.info({
+            "action": "FETCH_FULL_DATA_STREAM_START",
+            "message": "Streaming all available conversations and messages"
+        })
+        
+        conversation_count = 0
+        async for chunk in self._iter_conversations():
+            conversation_count += 1
+            yield chunk
+        
+        self.logger.info({
+            "action": "FETCH_FULL_DATA_STREAM_COMPLETE",
+            "message": f"Streamed {conversation_count} conversations",
+            "data": {"conversation_count": conversation_count}
+        })
+    
+    async def fetch_new_data_stream(self, since: Optional[datetime] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch new message data since the given timestamp, yielding one conversation at a time.
+        
+        Args:
+            since: Optional timestamp to fetch data from.
+                  If None, defaults to 24 hours ago.
+                  
+        Yields:
+            Dict[str, Any]: A single-conversation chunk in the fetch_new_data() format
+        """
+        # Default to last 24 hours if no timestamp provided
+        if since is None:
+            since = datetime.now(tz=timezone.utc) - timedelta(days=1)
+        
+        since_str = ensure_tz_aware(since).isoformat()
+        now_str = datetime.now(timezone.utc).isoformat()
+        
+        self.logger.info({
+            "action": "FETCH_NEW_DATA_STREAM_START",
+            "message": f"Streaming new data since {since_str}",
+            "data": {"since": since_str}
+        })
+        
+        conversation_count = 0
+        async for chunk in self._iter_conversations(since_str, now_str):
+            conversation_count += 1
+            yield chunk
+        
+        self.logger.info({
+            "action": "FETCH_NEW_DATA_STREAM_COMPLETE",
+            "message": f"Streamed {conversation_count} conversations since {since_str}",
+            "data": {"since": since_str, "conversation_count": conversation_count}
+        })
+    
     async def fetch_data_in_range(self, start: datetime, end: datetime) -> Dict[str, Any]:
         """
         Fetch message data within a specific date range.
@@ -486,18 +548,27 @@ class TelegramIngestor(Ingestor):
         finally:
             # Always disconnect the client
             if client:
-                try:
-                    await client.disconnect()
-                    self.logger.debug({
-                        "action": "CLIENT_DISCONNECTED",
-                        "message": "Disconnected Telegram client"
-                    })
-                except Exception as e:
-                    self.logger.warning({
-                        "action": "CLIENT_DISCONNECT_ERROR",
-                        "message": f"Error disconnecting client: {str(e)}",
-                        "data": {"error": str(e)}
-                    })
+                await self._disconnect_client(client)
+    
+    async def _disconnect_client(self, client: TelegramClient) -> None:
+        """
+        Disconnect a client, logging rather than raising on failure.
+        
+        Args:
+            client: The connected Telegram client
+        """
+        try:
+            await client.disconnect()
+            self.logger.debug({
+                "action": "CLIENT_DISCONNECTED",
+                "message": "Disconnected Telegram client"
+            })
+        except Exception as e:
+            self.logger.warning({
+                "action": "CLIENT_DISCONNECT_ERROR",
+                "message": f"Error disconnecting client: {str(e)}",
+                "data": {"error": str(e)}
+            })
     
     async def _test_connection(self) -> Dict[str, Any]:
         """
@@ -987,65 +1058,7 @@ class TelegramIngestor(Ingestor):
                     }
                 }
         """
-        async def fetch_operation(client):
-            # Structure similar to WhatsApp ingestor output
-            result = {
-                "conversations": {},  # Dictionary of conversation_id -> [messages]
-                "conversation_details": {}  # Dictionary of conversation metadata
-            }
-            
-            # Get all conversations
-            conversations = await self._get_conversations(client)
-
-            self.logger.info({
-                "action": "TELEGRAM_FETCH_CONVERSATIONS",
-                "message": f"Fetched {len(conversations)} conversations",
-                "data": {"conversation_count": len(conversations)}
-            })
-            
-            # Store conversation details for metadata access
-            for conversation in conversations:
-                chat_id = str(conversation["id"])
-                result["conversation_details"][chat_id] = conversation
-            
-            # Get messages from each conversation
-            for conversation in conversations:
-                conversation_id = conversation["id"]
-                
-                self.logger.info({
-                    "action": "TELEGRAM_FETCH_CONVERSATION",
-                    "message": f"Fetching messages from: {conversation['name']}",
-                    "data": {
-                        "conversation_id": conversation_id,
-                        "conversation_name": conversation["name"]
-                    }
-                })
-                
-                # Get messages from this conversation
-                messages = await self._get_messages(client, conversation_id)
-                
-                # Skip if no messages
-                if not messages:
-                    continue
-                
-                # Add conversation metadata to each message
-                for message in messages:
-                    message["conversation_name"] = conversation["name"]
-                    message["conversation_username"] = conversation.get("username")
-                    message["source"] = "telegram"
-                    message["is_group"] = conversation.get("is_group", False)
-                    message["chat_type"] = conversation.get("chat_type", "private")
-                
-                # Store messages organized by conversation ID - similar to WhatsApp structure
-                result["conversations"][str(conversation_id)] = messages
-                
-                # Add delay to avoid rate limiting
-                await asyncio.sleep(self._request_delay)
-            
-            return result
-        
-        # Execute with a fresh client
-        return await self._with_client(fetch_operation)
+        return await self._collect_conversations(self._iter_conversations())
     
     async def _fetch_conversations_in_range(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """
@@ -1070,13 +1083,58 @@ class TelegramIngestor(Ingestor):
                     }
                 }
         """
-        async def fetch_operation(client):
-            # Structure similar to WhatsApp ingestor output
-            result = {
-                "conversations": {},  # Dictionary of conversation_id -> [messages]
-                "conversation_details": {}  # Dictionary of conversation metadata
-            }
+        return await self._collect_conversations(self._iter_conversations(start_date, end_date))
+    
+    async def _collect_conversations(self, chunks: AsyncIterator[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge single-conversation chunks into one result dictionary.
+        
+        Args:
+            chunks: Async iterator of chunks from _iter_conversations
+            
+        Returns:
+            Dict[str, Any]: Dictionary with "conversations" and "conversation_details"
+        """
+        # Structure similar to WhatsApp ingestor output
+        result = {
+            "conversations": {},  # Dictionary of conversation_id -> [messages]
+            "conversation_details": {}  # Dictionary of conversation metadata
+        }
+        
+        async for chunk in chunks:
+            result["conversations"].update(chunk["conversations"])
+            result["conversation_details"].update(chunk["conversation_details"])
+        
+        return result
+    
+    async def _iter_conversations(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch conversations one at a time, yielding each as soon as its messages arrive.
+        
+        A single client connection is held open for the lifetime of the generator
+        and is disconnected when it is exhausted or closed.
+        
+        Args:
+            start_date: Optional start date in ISO format. When both dates are given,
+                        only messages within the range are fetched.
+            end_date: Optional end date in ISO format.
             
+        Yields:
+            Dict[str, Any]: Single-conversation chunk
+                {
+                    "conversations": {"chat_id": [messages]},
+                    "conversation_details": {"chat_id": {conversation metadata}}
+                }
+        """
+        in_range = start_date is not None and end_date is not None
+        
+        # Create and connect a fresh client
+        client = await self._create_client()
+        try:
             # Get all conversations
             conversations = await self._get_conversations(client)
 
@@ -1086,33 +1144,42 @@ class TelegramIngestor(Ingestor):
                 "data": {"conversation_count": len(conversations)}
             })
             
-            # Store conversation details for metadata access
-            for conversation in conversations:
-                chat_id = str(conversation["id"])
-                result["conversation_details"][chat_id] = conversation
-            
-            self.logger.info({
-                "action": "TELEGRAM_FETCH_DATE_RANGE",
-                "message": f"Fetching messages in date range: {start_date} to {end_date}",
-                "data": {
-                    "start_date": start_date,
-                    "end_date": end_date
-                }
-            })
+            if in_range:
+                self.logger.info({
+                    "action": "TELEGRAM_FETCH_DATE_RANGE",
+                    "message": f"Fetching messages in date range: {start_date} to {end_date}",
+                    "data": {
+                        "start_date": start_date,
+                        "end_date": end_date
+                    }
+                })
             
-            # Get messages from each conversation in the date range
+            # Get messages from each conversation
             for conversation in conversations:
                 conversation_id = conversation["id"]
                 
-                # Get messages in date range
-                messages = await self._get_messages_in_date_range(
-                    client, 
-                    conversation_id, 
-                    start_date, 
-                    end_date
-                )
+                if in_range:
+                    # Get messages in date range
+                    messages = await self._get_messages_in_date_range(
+                        client, 
+                        conversation_id, 
+                        start_date, 
+                        end_date
+                    )
+                else:
+                    self.logger.info({
+                        "action": "TELEGRAM_FETCH_CONVERSATION",
+                        "message": f"Fetching messages from: {conversation['name']}",
+                        "data": {
+                            "conversation_id": conversation_id,
+                            "conversation_name": conversation["name"]
+                        }
+                    })
+                    
+                    # Get messages from this conversation
+                    messages = await self._get_messages(client, conversation_id)
                 
-                # Skip if no messages in this range
+                # Skip if no messages
                 if not messages:
                     continue
                 
@@ -1124,16 +1191,17 @@ class TelegramIngestor(Ingestor):
                     message["is_group"] = conversation.get("is_group", False)
                     message["chat_type"] = conversation.get("chat_type", "private")
                 
-                # Store messages organized by conversation ID - similar to WhatsApp structure
-                result["conversations"][str(conversation_id)] = messages
+                chat_id = str(conversation_id)
+                yield {
+                    "conversations": {chat_id: messages},
+                    "conversation_details": {chat_id: conversation}
+                }
                 
                 # Add delay to avoid rate limiting
                 await asyncio.sleep(self._request_delay)
-            
-            return result
-            
-        # Execute with a fresh client
-        return await self._with_client(fetch_operation)
+        finally:
+            # Always disconnect the client
+            await self._disconnect_client(client)
 
     async def _fetch_messages_in_batches(self, client: TelegramClient, entity, total_limit: int) -> List[Any]:
         """
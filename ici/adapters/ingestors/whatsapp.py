@@ -6,7 +6,7 @@ import asyncio
 import os
 import time
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
 import aiohttp
 from ici.core.interfaces.ingestor import Ingestor
@@ -172,6 +172,49 @@ class WhatsAppIngestor(Ingestor):
         
         return result
     
+    async def fetch_full_data_stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch all WhatsApp messages, yielding one chat at a time.
+        
+        Yields:
+            Dict[str, Any]: A single-chat chunk in the fetch_full_data() format
+                {
+                    "conversations": {"chat_id": [messages]}
+                }
+                
+        Raises:
+            DataFetchError: If data fetch fails
+        """
+        async for chunk in self._iter_chat_data(log_prefix="FETCH_FULL_DATA_STREAM"):
+            yield chunk
+    
+    async def fetch_new_data_stream(self, since: Optional[datetime] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch new WhatsApp messages since a specified time, yielding one chat at a time.
+        
+        Args:
+            since: Timestamp to fetch messages from (defaults to last 24 hours)
+            
+        Yields:
+            Dict[str, Any]: A single-chat chunk in the fetch_new_data() format
+                
+        Raises:
+            DataFetchError: If data fetch fails
+        """
+        # If no since provided, default to last 24 hours
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=1)
+        
+        async def filter_since(chat_id):
+            return await self._fetch_chat_messages(chat_id, since)
+        
+        async for chunk in self._iter_chat_data(
+            message_filter=filter_since,
+            log_prefix="FETCH_NEW_DATA_STREAM",
+            additional_log_data={"since": since.isoformat()}
+        ):
+            yield chunk
+    
     async def fetch_data_in_range(self, start: datetime, end: datetime) -> Dict[str, Any]:
         """
         Fetch message data within a specific date range.
@@ -233,6 +276,37 @@ class WhatsAppIngestor(Ingestor):
         Returns:
             Dict with conversations organized by chat_id
             
+        Raises:
+            ConfigurationError: If ingestor is not initialized
+            DataFetchError: If data fetch fails
+        """
+        conversations = {}
+        
+        async for chunk in self._iter_chat_data(message_filter, log_prefix, additional_log_data):
+            conversations.update(chunk["conversations"])
+        
+        return {
+            "conversations": conversations
+        }
+    
+    async def _iter_chat_data(
+        self,
+        message_filter=None,
+        log_prefix="FETCH_DATA",
+        additional_log_data=None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch chat data one chat at a time with optional filtering.
+        
+        Args:
+            message_filter: Optional async function to filter messages
+                Should accept (chat_id) and return filtered messages
+            log_prefix: Prefix for log action names
+            additional_log_data: Optional additional data to include in logs
+            
+        Yields:
+            Dict with a single chat under "conversations"
+            
         Raises:
             ConfigurationError: If ingestor is not initialized
             DataFetchError: If data fetch fails
@@ -240,12 +314,12 @@ class WhatsAppIngestor(Ingestor):
         if not self._is_initialized:
             raise ConfigurationError("Ingestor not initialized. Call initialize() first.")
         
+        log_data = additional_log_data or {}
+        
         try:
             # Ensure session is connected
             await self._ensure_session()
             
-            log_data = additional_log_data or {}
-            
             self.logger.info({
                 "action": f"{log_prefix}_START",
                 "message": "Fetching WhatsApp messages",
@@ -255,65 +329,9 @@ class WhatsAppIngestor(Ingestor):
             # Fetch all chats
             chats = await self._fetch_chats()
             
-            # Fetch messages for each chat and organize by chat_id
-            conversations = {}
-            total_messages = 0
-            
-            for chat in chats:
-                chat_id = chat.get("id")
-                if not chat_id:
-                    continue
-                
-                try:
-                    # Fetch and filter messages
-                    if message_filter:
-                        messages = await message_filter(chat_id)
-                    else:
-                        messages = await self._fetch_chat_messages(chat_id)
-                    
-                    # Skip if no messages
-                    if not messages:
-                        continue
-                        
-                    # Add chat info to each message
-                    for msg in messages:
-                        msg["chatId"] = chat_id
-                        msg["chatName"] = chat.get("name")
-                        msg["isGroup"] = chat.get("isGroup", False)
-                    
-                    # Add to conversations
-                    conversations[chat_id] = messages
-                    total_messages += len(messages)
-                    
-                except Exception as e:
-                    self.logger.warning({
-                        "action": f"FETCH_CHAT_MESSAGES_ERROR",
-                        "message": f"Error fetching messages for chat {chat_id}: {str(e)}",
-                        "data": {"chat_id": chat_id, "error": str(e)}
-                    })
-            
-            # Combine log data with results
-            complete_log_data = {
-                "total_messages": total_messages,
-                "chat_count": len(conversations)
-            }
-            if additional_log_data:
-                complete_log_data.update(additional_log_data)
-            
-            self.logger.info({
-                "action": f"{log_prefix}_COMPLETE",
-                "message": f"Fetched {total_messages} messages from {len(conversations)} chats",
-                "data": complete_log_data
-            })
-            
-            return {
-                "conversations": conversations
-            }
-            
         except Exception as e:
             error_log_data = {"error": str(e), "error_type": type(e).__name__}
-            if additional_log_data:
-                error_log_data.update(additional_log_data)
+            error_log_data.update(log_data)
             
             self.logger.error({
                 "action": f"{log_prefix}_ERROR",
@@ -321,6 +339,60 @@ class WhatsAppIngestor(Ingestor):
                 "data": error_log_data
             })
             raise DataFetchError(f"Failed to fetch WhatsApp data: {str(e)}") from e
+        
+        # Fetch messages for each chat
+        chat_count = 0
+        total_messages = 0
+        
+        for chat in chats:
+            chat_id = chat.get("id")
+            if not chat_id:
+                continue
+            
+            try:
+                # Fetch and filter messages
+                if message_filter:
+                    messages = await message_filter(chat_id)
+                else:
+                    messages = await self._fetch_chat_messages(chat_id)
+                
+            except Exception as e:
+                self.logger.warning({
+                    "action": f"FETCH_CHAT_MESSAGES_ERROR",
+                    "message": f"Error fetching messages for chat {chat_id}: {str(e)}",
+                    "data": {"chat_id": chat_id, "error": str(e)}
+                })
+                continue
+            
+            # Skip if no messages
+            if not messages:
+                continue
+                
+            # Add chat info to each message
+            for msg in messages:
+                msg["chatId"] = chat_id
+                msg["chatName"] = chat.get("name")
+                msg["isGroup"] = chat.get("isGroup", False)
+            
+            chat_count += 1
+            total_messages += len(messages)
+            
+            yield {
+                "conversations": {chat_id: messages}
+            }
+        
+        # Combine log data with results
+        complete_log_data = {
+            "total_messages": total_messages,
+            "chat_count": chat_count
+        }
+        complete_log_data.update(log_data)
+        
+        self.logger.info({
+            "action": f"{log_prefix}_COMPLETE",
+            "message": f"Fetched {total_messages} messages from {chat_count} chats",
+            "data": complete_log_data
+        })
     
     async def healthcheck(self) -> Dict[str, Any]:
         """
@@ -6,9 +6,10 @@ that coordinates the processing of queries through validation,
 vector search, prompt building, and response generation.
 """
 
+import math
 import os
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 import asyncio
 import traceback
 import json
@@ -24,15 +25,20 @@ from ici.core.interfaces.user_id_generator import UserIDGenerator
 from ici.core.exceptions import (
     OrchestratorError, ValidationError, VectorStoreError, 
     PromptBuilderError, GenerationError, EmbeddingError,
-    ChatHistoryError, ChatIDError, UserIDError
+    ChatHistoryError, ChatIDError, UserIDError, ConfigurationError
 )
 from ici.utils.config import get_component_config, load_config
+from ici.utils.cache import TTLLRUCache
+from ici.utils.response_cache import SemanticResponseCache
+from ici.utils.query_filters import extract_query_constraints, build_metadata_filter
+from ici.utils.component_registry import get_component_registry
+from ici.utils.tracing import MetricsExporter, get_tracer
 from ici.core.interfaces.embedder import Embedder
 from ici.adapters.loggers.structured_logger import StructuredLogger
 from ici.adapters.validators.rule_based import RuleBasedValidator
 from ici.adapters.prompt_builders.basic_prompt_builder import BasicPromptBuilder
-from ici.adapters.vector_stores.chroma import ChromaDBStore
-from ici.adapters.embedders.sentence_transformer import SentenceTransformerEmbedder
+from ici.adapters.vector_stores import create_vector_store
+from ici.adapters.embedders import create_embedder
 from ici.adapters.pipelines.default import DefaultIngestionPipeline
 from ici.adapters.generators import create_generator
 from ici.adapters.chat import JSONChatHistoryManager
@@ -66,6 +72,9 @@ class DefaultOrchestrator(Orchestrator):
         self._pipeline: Optional[IngestionPipeline] = None
         self._embedder: Optional[Embedder] = None
         
+        # Embedder and vector store are shared with the pipeline via the component registry
+        self._components = get_component_registry().handle()
+        
         # Chat-specific components
         self._chat_history_manager: Optional[ChatHistoryManager] = None
         self._user_id_generator: Optional[UserIDGenerator] = None
@@ -73,6 +82,13 @@ class DefaultOrchestrator(Orchestrator):
         # Chat session mappings (user_id → current chat_id)
         self._active_chats: Dict[str, str] = {}
         
+        # Background chat history writes (chat_id → latest pending task)
+        self._persistence_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Per-stage latency spans, shared with the ingestion pipeline, and their optional exporter
+        self._tracer = get_tracer()
+        self._metrics_exporter: Optional[MetricsExporter] = None
+        
         # Special commands
         self._commands = {
             "/new": self._handle_new_chat_command,
@@ -89,6 +105,25 @@ class DefaultOrchestrator(Orchestrator):
             "no_documents": "I don't have information on that topic yet.",
             "generation_failed": "Sorry, I'm having trouble generating a response right now."
         }
+        
+        # Query embedding cache (query text -> vector), configured in initialize()
+        self._query_cache: Optional[TTLLRUCache] = TTLLRUCache(max_size=1024, ttl_seconds=3600)
+        
+        # Semantic response cache in front of the generator, configured in initialize()
+        self._response_cache: Optional[SemanticResponseCache] = None
+        
+        # Retrieval mode: "vector" or "hybrid" (vector + BM25 fused with reciprocal rank fusion)
+        self._retrieval_mode = "vector"
+        self._lexical_weight = 0.5
+        self._rrf_k = 60
+        
+        # Metadata filters extracted from queries, and adaptive over-fetching:
+        # the share of fetched results that pass the similarity threshold,
+        # tracked per filter shape, decides how many results to request
+        self._extract_filters = True
+        self._max_overfetch = 8
+        self._selectivity: Dict[str, float] = {}
+        self._selectivity_smoothing = 0.3
     
     async def initialize(self) -> None:
         """
@@ -128,12 +163,48 @@ class DefaultOrchestrator(Orchestrator):
             if "error_messages" in self._config:
                 self._error_messages.update(self._config.get("error_messages", {}))
             
+            # Configure the query embedding cache
+            query_cache_config = self._config.get("query_cache", {})
+            if query_cache_config.get("enabled", True):
+                self._query_cache = TTLLRUCache(
+                    max_size=query_cache_config.get("max_size", 1024),
+                    ttl_seconds=query_cache_config.get("ttl_seconds", 3600)
+                )
+            else:
+                self._query_cache = None
+            
+            self._configure_retrieval(self._config.get("retrieval", {}))
+            
+            # Configure the semantic response cache and restore saved responses
+            self._configure_response_cache(self._config.get("response_cache", {}))
+            if self._response_cache:
+                try:
+                    loaded = await asyncio.to_thread(self._response_cache.load)
+                    self.logger.info({
+                        "action": "ORCHESTRATOR_RESPONSE_CACHE_LOADED",
+                        "message": f"Loaded {loaded} cached responses",
+                        "data": {"path": self._response_cache.path, "entries": loaded}
+                    })
+                except Exception as e:
+                    self.logger.warning({
+                        "action": "ORCHESTRATOR_RESPONSE_CACHE_WARNING",
+                        "message": f"Failed to load cached responses: {str(e)}",
+                        "data": {"path": self._response_cache.path, "error": str(e)}
+                    })
+            
+            # Configure stage latency tracing and optional metrics export
+            self._configure_tracing()
+            
             # Initialize components
             await self._initialize_components()
             
             # Initialize chat components
             await self._initialize_chat_components()
             
+            # Start exporting only after setup succeeded, so a failure cannot leak the export task
+            if self._metrics_exporter:
+                self._metrics_exporter.start()
+            
             self._is_initialized = True
             
             # Start the pipeline if configured to do so
@@ -156,6 +227,16 @@ class DefaultOrchestrator(Orchestrator):
                         "message": f"Failed to start pipeline: {str(e)}",
                         "data": {"error": str(e), "error_type": type(e).__name__}
                     })
+                
+                # Keep ingesting in the background on each pipeline's schedule
+                try:
+                    await self._pipeline.start_scheduler()
+                except Exception as e:
+                    self.logger.error({
+                        "action": "ORCHESTRATOR_SCHEDULER_ERROR",
+                        "message": f"Failed to start ingestion scheduler: {str(e)}",
+                        "data": {"error": str(e), "error_type": type(e).__name__}
+                    })
             
             self.logger.info({
                 "action": "ORCHESTRATOR_INIT_SUCCESS",
@@ -224,12 +305,14 @@ class DefaultOrchestrator(Orchestrator):
             self._validator = RuleBasedValidator(logger_name="orchestrator.validator")
             await self._validator.initialize()
 
-            self._embedder = SentenceTransformerEmbedder(logger_name="orchestrator.embedder")
-            await self._embedder.initialize()
-            
-            # Initialize vector store
-            self._vector_store = ChromaDBStore(logger_name="orchestrator.vector_store")
-            await self._vector_store.initialize()
+            # Initialize the embedder and vector store through the component registry,
+            # so the ingestion pipeline reuses the same instances
+            self._embedder = await self._components.acquire(
+                DefaultIngestionPipeline.EMBEDDER_KEY, self._create_embedder
+            )
+            self._vector_store = await self._components.acquire(
+                DefaultIngestionPipeline.VECTOR_STORE_KEY, self._create_vector_store
+            )
             
             # Initialize prompt builder
             self._prompt_builder = BasicPromptBuilder(logger_name="orchestrator.prompt_builder")
@@ -274,6 +357,18 @@ class DefaultOrchestrator(Orchestrator):
             })
             raise OrchestratorError(f"Component initialization failed: {str(e)}") from e
     
+    async def _create_embedder(self) -> Embedder:
+        """Create and initialize the configured embedder."""
+        embedder = create_embedder(logger_name="orchestrator.embedder", config_path=self._config_path)
+        await embedder.initialize()
+        return embedder
+    
+    async def _create_vector_store(self) -> VectorStore:
+        """Create and initialize the configured vector store."""
+        vector_store = create_vector_store(logger_name="orchestrator.vector_store", config_path=self._config_path)
+        await vector_store.initialize()
+        return vector_store
+    
     async def process_query(self, source: str, user_id: str, query: str, additional_info: Dict[str, Any]) -> str:
         """
         Manages query processing from validation to generation.
@@ -293,59 +388,217 @@ class DefaultOrchestrator(Orchestrator):
         if not self._is_initialized:
             raise OrchestratorError("Orchestrator not initialized. Call initialize() first.")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Generate standard user ID
-            standard_user_id = await self._ensure_valid_user_id(source, user_id)
+            prepared = await self._prepare_query(source, user_id, query, additional_info)
+            if prepared["response"] is not None:
+                return prepared["response"]
             
-            # Check if query is a special command
-            if query.strip().startswith("/"):
-                command = query.strip().split()[0].lower()
-                if command in self._commands:
-                    self.logger.info({
-                        "action": "ORCHESTRATOR_COMMAND",
-                        "message": f"Processing command: {command}",
-                        "data": {"user_id": standard_user_id, "command": command}
-                    })
-                    return await self._commands[command](standard_user_id, query)
+            # Serve a cached response to a similar query with the same context
+            cached = await self._timed(prepared["timings"], "cache", self._lookup_cached_response(prepared, query))
+            if cached is not None:
+                await self._finalize_query(prepared, cached, start_time)
+                return cached
+            
+            # Step 6: Generate response
+            response = await self._timed(
+                prepared["timings"], "generate", self._generate_response(prepared["prompt"])
+            )
             
-            # Ensure user has an active chat
-            chat_id = await self._ensure_active_chat(standard_user_id)
+            if response != self._error_messages.get("generation_failed"):
+                self._cache_response(prepared, response)
+            await self._finalize_query(prepared, response, start_time)
+            return response
             
-            self.logger.info({
-                "action": "ORCHESTRATOR_PROCESS_QUERY",
-                "message": "Processing query with chat context",
+        except Exception as e:
+            elapsed_time = time.perf_counter() - start_time
+            self._tracer.record("query.total", elapsed_time, True)
+            self.logger.error({
+                "action": "ORCHESTRATOR_PROCESS_ERROR",
+                "message": f"Failed to process query: {str(e)}",
                 "data": {
-                    "source": source,
-                    "user_id": standard_user_id,
-                    "chat_id": chat_id,
-                    "query_length": len(query) if query else 0
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "elapsed_time": elapsed_time
                 }
             })
             
-            # Store user message in chat history
-            await self._chat_history_manager.add_message(
-                chat_id=chat_id,
-                content=query,
-                role="user"
-            )
-            
-            # Step 1: Build context for validation
-            context = await self.build_context(standard_user_id)
-            
-            # Add source to context
-            context["source"] = source
+            # Return a generic error message
+            return self._error_messages.get("generation_failed")
+    
+    async def process_query_stream(
+        self, source: str, user_id: str, query: str, additional_info: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Processes a query like process_query, yielding the response as it is generated.
+
+        Commands, validation failures and errors before the first chunk are
+        yielded as a single chunk. The complete response is stored in chat
+        history once generation ends. If generation fails after the first
+        chunk, or the consumer stops reading early, the partial response is
+        stored flagged as incomplete (metadata "incomplete": True) and the
+        error is re-raised, so the caller knows the answer was cut off.
+
+        Args:
+            source: The source of the query
+            user_id: Identifier for the user making the request
+            query: The user input/question to process
+            additional_info: Dictionary containing additional attributes and values
+
+        Yields:
+            str: Consecutive pieces of the final response
+
+        Raises:
+            OrchestratorError: If the orchestrator is not initialized
+            GenerationError: If generation fails after the first chunk was yielded
+        """
+        if not self._is_initialized:
+            raise OrchestratorError("Orchestrator not initialized. Call initialize() first.")
+        
+        start_time = time.perf_counter()
+        chunks: List[str] = []
+        complete = False
+        
+        try:
+            prepared = await self._prepare_query(source, user_id, query, additional_info)
+            if prepared["response"] is not None:
+                yield prepared["response"]
+                return
+            
+            # Serve a cached response to a similar query with the same context
+            cached = await self._timed(prepared["timings"], "cache", self._lookup_cached_response(prepared, query))
+            if cached is not None:
+                chunks.append(cached)
+                complete = True
+                yield cached
+                await self._finalize_query(prepared, cached, start_time)
+                return
+            
+            generation_started = time.perf_counter()
+            outcome: Dict[str, Any] = {}
+            async for chunk in self._generate_response_stream(prepared["prompt"], outcome):
+                if not chunks:
+                    prepared["timings"]["first_chunk"] = time.perf_counter() - generation_started
+                    self._tracer.record("query.first_chunk", prepared["timings"]["first_chunk"])
+                chunks.append(chunk)
+                yield chunk
+            complete = True
+            prepared["timings"]["generate"] = time.perf_counter() - generation_started
+            self._tracer.record("query.generate", prepared["timings"]["generate"])
+            
+            if outcome.get("complete"):
+                self._cache_response(prepared, "".join(chunks))
+            await self._finalize_query(prepared, "".join(chunks), start_time)
+            
+        except (asyncio.CancelledError, GeneratorExit):
+            # The consumer stopped reading before the response was complete
+            if chunks and not complete:
+                self._store_incomplete_response(prepared, chunks, "cancelled")
+            raise
             
-            # Add any additional info to context
-            if additional_info:
-                context.update(additional_info)
+        except Exception as e:
+            elapsed_time = time.perf_counter() - start_time
+            self._tracer.record("query.total", elapsed_time, True)
+            self.logger.error({
+                "action": "ORCHESTRATOR_PROCESS_ERROR",
+                "message": f"Failed to process query: {str(e)}",
+                "data": {
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "elapsed_time": elapsed_time
+                }
+            })
             
-            # Step 2: Get rules for validation
-            rules = self.get_rules(standard_user_id)
+            # Only replace the response if none of it has been shown yet
+            if not chunks:
+                yield self._error_messages.get("generation_failed")
+            elif not complete:
+                self._store_incomplete_response(prepared, chunks, "generation_failed")
+                raise
+    
+    async def _prepare_query(
+        self, source: str, user_id: str, query: str, additional_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Runs every query step up to (but excluding) generation.
+        
+        Steps without a data dependency on each other run concurrently:
+        storing the query in chat history and loading the history window
+        overlap with validation and then with query embedding and search.
+        Retrieval starts only once validation has passed, so rejected
+        queries are never embedded. If a step fails, the user message is
+        still stored.
+        
+        Args:
+            source: The source of the query
+            user_id: Identifier for the user making the request
+            query: The user input/question to process
+            additional_info: Dictionary containing additional attributes and values
             
-            # Step 3: Validate the query
-            is_valid, failure_reasons = await self._validate_query(query, context, rules)
+        Returns:
+            Dict[str, Any]: The user and chat IDs, documents, chat messages,
+                prompt and per-stage timings (seconds), plus "response", which
+                is set when the query was answered without generation
+                (commands and validation failures)
+        """
+        timings: Dict[str, float] = {}
+        prepared: Dict[str, Any] = {
+            "response": None,
+            "user_id": None,
+            "chat_id": None,
+            "documents": [],
+            "chat_messages": [],
+            "prompt": None,
+            "query_vector": None,
+            "cached": False,
+            "timings": timings
+        }
+        
+        # Generate standard user ID
+        standard_user_id = await self._timed(timings, "user_id", self._ensure_valid_user_id(source, user_id))
+        prepared["user_id"] = standard_user_id
+        
+        # Check if query is a special command
+        if query.strip().startswith("/"):
+            command = query.strip().split()[0].lower()
+            if command in self._commands:
+                self.logger.info({
+                    "action": "ORCHESTRATOR_COMMAND",
+                    "message": f"Processing command: {command}",
+                    "data": {"user_id": standard_user_id, "command": command}
+                })
+                prepared["response"] = await self._commands[command](standard_user_id, query)
+                return prepared
+        
+        # Ensure user has an active chat
+        chat_id = await self._timed(timings, "chat", self._ensure_active_chat(standard_user_id))
+        prepared["chat_id"] = chat_id
+        
+        self.logger.info({
+            "action": "ORCHESTRATOR_PROCESS_QUERY",
+            "message": "Processing query with chat context",
+            "data": {
+                "source": source,
+                "user_id": standard_user_id,
+                "chat_id": chat_id,
+                "query_length": len(query) if query else 0
+            }
+        })
+        
+        # Store user message in chat history and load the history window
+        history_task = asyncio.create_task(
+            self._timed(timings, "history", self._record_and_load_history(chat_id, query))
+        )
+        search_task: Optional[asyncio.Task] = None
+        
+        try:
+            # Steps 1-3: Build context, get rules and validate the query
+            is_valid, failure_reasons = await self._timed(
+                timings, "validate", self._check_query(standard_user_id, source, query, additional_info)
+            )
             
             if not is_valid:
                 self.logger.info({
@@ -357,14 +610,16 @@ class DefaultOrchestrator(Orchestrator):
                     }
                 })
                 
-                # Store system message about validation failure
+                # Store system message about validation failure after the user message
+                await history_task
                 error_message = self._error_messages.get("validation_failed")
                 await self._chat_history_manager.add_message(
                     chat_id=chat_id,
                     content=error_message,
                     role="assistant"
                 )
-                return error_message
+                prepared["response"] = error_message
+                return prepared
             
             self.logger.info({
                 "action": "ORCHESTRATOR_VALIDATION_SUCCESS",
@@ -372,66 +627,323 @@ class DefaultOrchestrator(Orchestrator):
                 "data": {"user_id": standard_user_id, "query": query}
             })
             
-            # Step 4: Search for relevant documents
-            documents = await self._search_documents(query, self._num_results)
-
-            self.logger.info({
-                "action": "ORCHESTRATOR_DOCUMENTS_FOUND",
-                "message": "Documents found",
-                "data": {"documents": documents, "query": query, "num_results": self._num_results}
-            })
-            
-            # Get chat history for context
-            chat_messages = await self._chat_history_manager.get_messages(chat_id)
+            # Step 4: Search for relevant documents while chat history is loading
+            filters = self._build_search_filters(query, additional_info)
+            search_task = asyncio.create_task(
+                self._timed(
+                    timings, "retrieve", self._search_documents(query, self._num_results, filters, prepared)
+                )
+            )
+            documents, chat_messages = await asyncio.gather(search_task, history_task)
             
-            # Step 5: Build prompt with documents, query, and chat history
-            prompt = await self._build_chat_prompt(query, documents, chat_messages)
+        except BaseException:
+            if search_task is not None and not search_task.done():
+                search_task.cancel()
+            # The user message is kept even when the query fails, so let the write finish
+            if not history_task.done():
+                try:
+                    await asyncio.shield(history_task)
+                except asyncio.CancelledError:
+                    # Cancelled again while waiting; the shielded write keeps running
+                    pass
+                except Exception:
+                    # The original error is the one to report
+                    pass
+            raise
+        
+        prepared["documents"] = documents
+        prepared["chat_messages"] = chat_messages
+
+        self.logger.info({
+            "action": "ORCHESTRATOR_DOCUMENTS_FOUND",
+            "message": "Documents found",
+            "data": {"documents": documents, "query": query, "num_results": self._num_results}
+        })
+        
+        # Step 5: Build prompt with documents, query, and chat history
+        prepared["prompt"] = await self._timed(
+            timings, "prompt", self._build_chat_prompt(query, documents, chat_messages)
+        )
+        
+        return prepared
+    
+    async def _check_query(
+        self, user_id: str, source: str, query: str, additional_info: Dict[str, Any]
+    ) -> Tuple[bool, List[str]]:
+        """
+        Builds the validation context and rules for a user and validates the query.
+        
+        Args:
+            user_id: The standardized user ID
+            source: The source of the query
+            query: The user input/question to validate
+            additional_info: Dictionary containing additional attributes and values
             
-            # Step 6: Generate response
-            response = await self._generate_response(prompt)
+        Returns:
+            Tuple[bool, List[str]]: Whether the query is valid, and the failure reasons
+        """
+        context = await self.build_context(user_id)
+        
+        # Add source and any additional info to context
+        context["source"] = source
+        if additional_info:
+            context.update(additional_info)
+        
+        rules = self.get_rules(user_id)
+        
+        return await self._validate_query(query, context, rules)
+    
+    async def _record_and_load_history(self, chat_id: str, query: str) -> List[Dict[str, Any]]:
+        """
+        Stores the user's query in chat history and returns the chat's messages.
+        
+        Waits for the previous response in the chat to be stored first, so
+        messages keep their order.
+        
+        Args:
+            chat_id: The active chat ID
+            query: The user query
             
-            # Store assistant response in chat history
-            await self._chat_history_manager.add_message(
-                chat_id=chat_id,
-                content=response,
-                role="assistant"
-            )
+        Returns:
+            List[Dict[str, Any]]: The chat messages, including the query
+        """
+        await self._wait_for_persistence(chat_id)
+        
+        await self._chat_history_manager.add_message(
+            chat_id=chat_id,
+            content=query,
+            role="user"
+        )
+        return await self._chat_history_manager.get_messages(chat_id)
+    
+    async def _timed(self, timings: Dict[str, float], stage: str, awaitable) -> Any:
+        """
+        Awaits a query stage and records its duration, both in timings and as a "query.<stage>" span.
+        
+        Args:
+            timings: Stage name to duration (seconds) mapping to update
+            stage: Name of the stage
+            awaitable: The stage's coroutine
             
-            # Try to generate a title for new chats
-            if len(chat_messages) <= 2:  # Only user's first message + system greeting
-                await self._chat_history_manager.generate_title(chat_id)
+        Returns:
+            Any: The stage's result
+        """
+        with self._tracer.span(f"query.{stage}"):
+            started = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                timings[stage] = time.perf_counter() - started
+    
+    async def _lookup_cached_response(self, prepared: Dict[str, Any], query: str) -> Optional[str]:
+        """
+        Looks up a cached response for the query and records its cache key in prepared.
+        
+        The key is the query embedding plus fingerprints of the retrieved
+        documents (IDs and text) and of the chat-history window before the
+        query. When ingestion changes what a query retrieves, the documents
+        fingerprint changes and the old response is no longer served.
+        
+        Args:
+            prepared: The result of _prepare_query for this query
+            query: The user query
             
-            # Log completion time
-            elapsed_time = time.time() - start_time
+        Returns:
+            Optional[str]: The cached response, or None on a miss or if caching is disabled
+        """
+        if self._response_cache is None:
+            return None
+        
+        # Reuse the embedding from retrieval; embed only if retrieval failed before it
+        query_vector = prepared.get("query_vector")
+        try:
+            if query_vector is None:
+                query_vector = await self._embed_query(query)
+        except Exception as e:
+            self.logger.warning({
+                "action": "ORCHESTRATOR_RESPONSE_CACHE_WARNING",
+                "message": f"Skipping response cache, query embedding failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            return None
+        
+        documents_fingerprint = SemanticResponseCache.fingerprint(
+            (doc.get("id"), doc.get("text", doc.get("content"))) for doc in prepared["documents"]
+        )
+        # The last message is the query itself, which the query vector already covers
+        history_fingerprint = SemanticResponseCache.fingerprint(
+            (msg.get("role"), msg.get("content"))
+            for msg in prepared["chat_messages"][:-1]
+            if msg.get("role", "").upper() != "SYSTEM"
+        )
+        prepared["cache_key"] = (query_vector, documents_fingerprint, history_fingerprint)
+        
+        response = self._response_cache.get(query_vector, documents_fingerprint, history_fingerprint)
+        if response is not None:
+            prepared["cached"] = True
             self.logger.info({
-                "action": "ORCHESTRATOR_QUERY_COMPLETE",
-                "message": "Query processed successfully",
-                "data": {
-                    "user_id": standard_user_id,
-                    "chat_id": chat_id,
-                    "elapsed_time": elapsed_time,
-                    "documents_found": len(documents),
-                    "response_length": len(response)
-                }
+                "action": "ORCHESTRATOR_RESPONSE_CACHE_HIT",
+                "message": "Using cached response",
+                "data": {"user_id": prepared["user_id"], "chat_id": prepared["chat_id"]}
             })
-            
-            return response
-            
+        return response
+    
+    def _cache_response(self, prepared: Dict[str, Any], response: str) -> None:
+        """
+        Stores a generated response under the cache key recorded by _lookup_cached_response.
+        
+        Args:
+            prepared: The result of _prepare_query for this query
+            response: The complete generated response
+        """
+        if self._response_cache is None or "cache_key" not in prepared or not response:
+            return
+        
+        query_vector, documents_fingerprint, history_fingerprint = prepared["cache_key"]
+        self._response_cache.set(query_vector, documents_fingerprint, history_fingerprint, response)
+    
+    async def _finalize_query(self, prepared: Dict[str, Any], response: str, start_time: float) -> None:
+        """
+        Schedules storing the response in chat history and logs completion.
+        
+        The response is stored (and a title generated for new chats) in the
+        background, so the caller gets the response without waiting for it.
+        
+        Args:
+            prepared: The result of _prepare_query for this query
+            response: The complete generated response
+            start_time: When query processing started (time.perf_counter())
+        """
+        chat_id = prepared["chat_id"]
+        
+        # Try to generate a title for new chats
+        generate_title = len(prepared["chat_messages"]) <= 2  # Only user's first message + system greeting
+        self._schedule_persistence(chat_id, response, generate_title)
+        
+        # Log completion time
+        elapsed_time = time.perf_counter() - start_time
+        self._tracer.record("query.total", elapsed_time)
+        self.logger.info({
+            "action": "ORCHESTRATOR_QUERY_COMPLETE",
+            "message": "Query processed successfully",
+            "data": {
+                "user_id": prepared["user_id"],
+                "chat_id": chat_id,
+                "elapsed_time": elapsed_time,
+                "stage_timings": prepared["timings"],
+                "documents_found": len(prepared["documents"]),
+                "response_length": len(response),
+                "cached": prepared["cached"]
+            }
+        })
+    
+    def _store_incomplete_response(self, prepared: Dict[str, Any], chunks: List[str], reason: str) -> None:
+        """
+        Schedules storing a partially streamed response, flagged as incomplete.
+        
+        Args:
+            prepared: The result of _prepare_query for this query
+            chunks: The chunks yielded before the stream ended
+            reason: Why the stream ended early ("generation_failed" or "cancelled")
+        """
+        self.logger.warning({
+            "action": "ORCHESTRATOR_INCOMPLETE_RESPONSE",
+            "message": "Response stream ended before the response was complete",
+            "data": {
+                "user_id": prepared["user_id"],
+                "chat_id": prepared["chat_id"],
+                "reason": reason,
+                "chunks": len(chunks)
+            }
+        })
+        self._schedule_persistence(
+            prepared["chat_id"], "".join(chunks), False, {"incomplete": True, "reason": reason}
+        )
+    
+    def _schedule_persistence(
+        self,
+        chat_id: str,
+        response: str,
+        generate_title: bool,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Starts storing a response in the background, after the chat's pending writes.
+        
+        Args:
+            chat_id: The chat the response belongs to
+            response: The assistant response
+            generate_title: Whether to generate a title for the chat afterwards
+            metadata: Optional metadata to store with the message
+        """
+        previous = self._persistence_tasks.get(chat_id)
+        task = asyncio.create_task(
+            self._persist_response(chat_id, response, generate_title, previous, metadata)
+        )
+        self._persistence_tasks[chat_id] = task
+        
+        def forget(done: asyncio.Task) -> None:
+            # A later query may already have queued another write for this chat
+            if self._persistence_tasks.get(chat_id) is done:
+                del self._persistence_tasks[chat_id]
+        
+        task.add_done_callback(forget)
+    
+    async def _persist_response(
+        self,
+        chat_id: str,
+        response: str,
+        generate_title: bool,
+        previous: Optional[asyncio.Task] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Stores an assistant response in chat history, after any earlier pending write for the chat.
+        
+        Args:
+            chat_id: The chat the response belongs to
+            response: The assistant response
+            generate_title: Whether to generate a title for the chat afterwards
+            previous: The chat's previous persistence task, if still pending
+            metadata: Optional metadata to store with the message
+        """
+        if previous is not None:
+            await asyncio.wait({previous})
+        
+        message = {"chat_id": chat_id, "content": response, "role": "assistant"}
+        if metadata:
+            message["metadata"] = metadata
+        
+        try:
+            with self._tracer.span("query.persist"):
+                # Store assistant response in chat history
+                await self._chat_history_manager.add_message(**message)
+                
+                if generate_title:
+                    await self._chat_history_manager.generate_title(chat_id)
+                
         except Exception as e:
-            elapsed_time = time.time() - start_time
             self.logger.error({
-                "action": "ORCHESTRATOR_PROCESS_ERROR",
-                "message": f"Failed to process query: {str(e)}",
-                "data": {
-                    "user_id": user_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "elapsed_time": elapsed_time
-                }
+                "action": "ORCHESTRATOR_PERSIST_ERROR",
+                "message": f"Failed to store response in chat history: {str(e)}",
+                "data": {"chat_id": chat_id, "error": str(e), "error_type": type(e).__name__}
             })
-            
-            # Return a generic error message
-            return self._error_messages.get("generation_failed")
+    
+    async def _wait_for_persistence(self, chat_id: Optional[str] = None) -> None:
+        """
+        Waits for pending background chat history writes.
+        
+        Args:
+            chat_id: Only wait for this chat's writes, or None to wait for all
+        """
+        if chat_id is None:
+            pending = set(self._persistence_tasks.values())
+        else:
+            task = self._persistence_tasks.get(chat_id)
+            pending = {task} if task is not None else set()
+        
+        if pending:
+            await asyncio.wait(pending)
     
     async def _ensure_valid_user_id(self, source: str, provided_user_id: str) -> str:
         """
@@ -709,6 +1221,7 @@ class DefaultOrchestrator(Orchestrator):
         
         # Store the help message in the active chat
         chat_id = await self._ensure_active_chat(user_id)
+        await self._wait_for_persistence(chat_id)
         await self._chat_history_manager.add_message(
             chat_id=chat_id,
             content=help_text,
@@ -745,13 +1258,52 @@ class DefaultOrchestrator(Orchestrator):
             })
             raise OrchestratorError(f"Validation failed: {str(e)}") from e
     
-    async def _search_documents(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+    async def _embed_query(self, query: str) -> List[float]:
+        """
+        Embeds a query, reusing cached vectors for repeated queries.
+        
+        Args:
+            query: The search query
+            
+        Returns:
+            List[float]: The query embedding vector
+        """
+        if self._query_cache is None:
+            query_vector, _ = await self._embedder.embed(query)
+            return query_vector
+        
+        # Normalize whitespace so trivially different queries share an entry
+        cache_key = " ".join(query.split())
+        query_vector = self._query_cache.get(cache_key)
+        if query_vector is not None:
+            self.logger.debug({
+                "action": "ORCHESTRATOR_QUERY_CACHE_HIT",
+                "message": "Using cached query embedding",
+                "data": {"query": cache_key}
+            })
+            return query_vector
+        
+        query_vector, _ = await self._embedder.embed(query)
+        self._query_cache.set(cache_key, query_vector)
+        return query_vector
+    
+    async def _search_documents(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+        prepared: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Searches for documents relevant to the query.
         
         Args:
             query: The search query
             top_k: Maximum number of documents to retrieve
+            filters: Optional metadata filters applied by the vector store
+            prepared: Optional _prepare_query result; the query embedding is
+                      stored in its "query_vector" so the response cache can
+                      reuse it instead of embedding the query again
             
         Returns:
             List[Dict[str, Any]]: List of relevant documents
@@ -767,8 +1319,11 @@ class DefaultOrchestrator(Orchestrator):
                 "data": {"query": query}
             })
             
-            # Get embedding from the embedder
-            query_vector, _ = await self._embedder.embed(query)
+            # Get embedding from the embedder (or the query cache)
+            with self._tracer.span("query.embed"):
+                query_vector = await self._embed_query(query)
+            if prepared is not None:
+                prepared["query_vector"] = query_vector
 
             self.logger.info({
                 "action": "ORCHESTRATOR_EMBEDDING_SUCCESS",
@@ -776,36 +1331,52 @@ class DefaultOrchestrator(Orchestrator):
                 "data": {"query_vector": query_vector}
             })
             
-            # Search for documents with the embedding vector
-            # Request more results than needed to apply similarity threshold filtering
-            search_results = self._vector_store.search(
-                query_vector=query_vector,
-                num_results=top_k * 2,  # Request more to filter by threshold
-                filters=None  # No filters for now
-            )
-
-            self.logger.info({
-                "action": "ORCHESTRATOR_SEARCH_RESULTS",
-                "message": "Search results",
-                "data": {"search_results": search_results}
-            })
-            
-            # Filter results by similarity threshold
-            if self._similarity_threshold > 0:
-                filtered_results = [
-                    doc for doc in search_results 
-                    if doc.get('score', 0) >= self._similarity_threshold
-                ]
-                search_results = filtered_results[:top_k]  # Limit to requested number
-            else:
-                # Just take the top_k if no threshold
-                search_results = search_results[:top_k]
+            # Search for documents with the embedding vector, filtering by
+            # metadata in the store and over-fetching only as much as the
+            # similarity threshold is expected to discard
+            candidates = top_k * 2 if self._retrieval_mode == "hybrid" else top_k
+            with self._tracer.span("query.search"):
+                # Store queries block, so they run in worker threads while the
+                # event loop serves other stages (e.g. chat history I/O)
+                vector_search = asyncio.to_thread(
+                    self._vector_store.search,
+                    query_vector=query_vector,
+                    num_results=self._fetch_size(candidates, filters),
+                    filters=filters
+                )
+                if self._retrieval_mode == "hybrid":
+                    # The BM25 search does not depend on the vector search, so both run at once
+                    search_results, lexical_results = await asyncio.gather(
+                        vector_search, self._lexical_search(query, candidates, filters)
+                    )
+                else:
+                    search_results = await vector_search
+                self._record_selectivity(search_results, filters)
+                
+                self.logger.info({
+                    "action": "ORCHESTRATOR_SEARCH_RESULTS",
+                    "message": "Search results",
+                    "data": {"search_results": search_results}
+                })
+                
+                if self._retrieval_mode == "hybrid":
+                    # Fuse the thresholded vector candidates with BM25 keyword matches
+                    vector_results = self._apply_similarity_threshold(search_results, candidates)
+                    search_results = self._fuse_results(vector_results, lexical_results, top_k)
+                else:
+                    # Filter results by similarity threshold
+                    search_results = self._apply_similarity_threshold(search_results, top_k)
             
             if not search_results:
                 self.logger.info({
                     "action": "ORCHESTRATOR_NO_DOCUMENTS",
                     "message": "No relevant documents found",
-                    "data": {"query": query, "top_k": top_k, "threshold": self._similarity_threshold}
+                    "data": {
+                        "query": query,
+                        "top_k": top_k,
+                        "threshold": self._similarity_threshold,
+                        "filters": filters
+                    }
                 })
             else:
                 self.logger.info({
@@ -814,7 +1385,8 @@ class DefaultOrchestrator(Orchestrator):
                     "data": {
                         "count": len(search_results), 
                         "top_k": top_k,
-                        "threshold": self._similarity_threshold
+                        "threshold": self._similarity_threshold,
+                        "filters": filters
                     }
                 })
             
@@ -830,6 +1402,424 @@ class DefaultOrchestrator(Orchestrator):
             # Return empty list on error
             return []
     
+    async def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embeds several queries, computing all cache misses in one batch.
+        
+        Args:
+            queries: The search queries
+            
+        Returns:
+            List[List[float]]: One embedding vector per query, in order
+        """
+        cache_keys = [" ".join(query.split()) for query in queries]
+        query_vectors: List[Optional[List[float]]] = [None] * len(queries)
+        
+        if self._query_cache is not None:
+            for i, cache_key in enumerate(cache_keys):
+                query_vectors[i] = self._query_cache.get(cache_key)
+        
+        # Embed each distinct uncached query once
+        missing: Dict[str, List[int]] = {}
+        for i, query_vector in enumerate(query_vectors):
+            if query_vector is None:
+                missing.setdefault(cache_keys[i], []).append(i)
+        
+        if missing:
+            vectors, _ = await self._embedder.embed_batch_array(list(missing))
+            for (cache_key, positions), vector in zip(missing.items(), vectors):
+                query_vector = vector.tolist()
+                if self._query_cache is not None:
+                    self._query_cache.set(cache_key, query_vector)
+                for i in positions:
+                    query_vectors[i] = query_vector
+        
+        self.logger.debug({
+            "action": "ORCHESTRATOR_EMBED_QUERIES",
+            "message": f"Embedded {len(queries)} queries",
+            "data": {"queries": len(queries), "embedded": len(missing)}
+        })
+        
+        return query_vectors
+    
+    async def search_documents_batch(
+        self, queries: List[str], top_k: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for documents relevant to each of several queries.
+        
+        The queries are embedded in one batch and searched with a single
+        vector store request (VectorStore.search_batch), instead of one
+        embedding and one search per query. Meant for query expansion,
+        multi-question prompts and offline retrieval evaluation. Results go
+        through the same similarity threshold and hybrid fusion as the
+        documents retrieved by process_query.
+        
+        Args:
+            queries: The search queries
+            top_k: Maximum number of documents to retrieve per query
+                   (defaults to the configured num_results)
+            filters: Optional metadata filters applied to every query
+            
+        Returns:
+            List[List[Dict[str, Any]]]: One list of relevant documents per query;
+                every list is empty if the search fails
+            
+        Raises:
+            OrchestratorError: If the orchestrator is not initialized
+        """
+        if not self._is_initialized:
+            raise OrchestratorError("Orchestrator not initialized. Call initialize() first.")
+        
+        if not queries:
+            return []
+        
+        top_k = self._num_results if top_k is None else top_k
+        
+        try:
+            query_vectors = await self._embed_queries(queries)
+            
+            candidates = top_k * 2 if self._retrieval_mode == "hybrid" else top_k
+            batch_search = asyncio.to_thread(
+                self._vector_store.search_batch,
+                query_vectors=query_vectors,
+                num_results=self._fetch_size(candidates, filters),
+                filters=filters
+            )
+            if self._retrieval_mode == "hybrid":
+                batch_results, *lexical_batch = await asyncio.gather(
+                    batch_search, *(self._lexical_search(query, candidates, filters) for query in queries)
+                )
+            else:
+                batch_results = await batch_search
+            for search_results in batch_results:
+                self._record_selectivity(search_results, filters)
+            
+            if self._retrieval_mode == "hybrid":
+                batch_results = [
+                    self._fuse_results(
+                        self._apply_similarity_threshold(search_results, candidates),
+                        lexical_results,
+                        top_k
+                    )
+                    for search_results, lexical_results in zip(batch_results, lexical_batch)
+                ]
+            else:
+                batch_results = [
+                    self._apply_similarity_threshold(search_results, top_k)
+                    for search_results in batch_results
+                ]
+            
+            self.logger.info({
+                "action": "ORCHESTRATOR_BATCH_DOCUMENTS_FOUND",
+                "message": f"Searched documents for {len(queries)} queries",
+                "data": {
+                    "queries": len(queries),
+                    "counts": [len(search_results) for search_results in batch_results],
+                    "top_k": top_k,
+                    "threshold": self._similarity_threshold
+                }
+            })
+            
+            return batch_results
+            
+        except Exception as e:
+            self.logger.error({
+                "action": "ORCHESTRATOR_BATCH_SEARCH_ERROR",
+                "message": f"Batch search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            
+            # Return empty results on error
+            return [[] for _ in queries]
+    
+    def _configure_retrieval(self, retrieval_config: Dict[str, Any]) -> None:
+        """
+        Applies the retrieval settings (mode, lexical_weight, rrf_k,
+        extract_filters, max_overfetch).
+        
+        Args:
+            retrieval_config: The orchestrator.retrieval config section
+            
+        Raises:
+            ConfigurationError: If the retrieval mode is unknown
+        """
+        mode = str(retrieval_config.get("mode", self._retrieval_mode)).lower()
+        if mode not in ("vector", "hybrid"):
+            raise ConfigurationError(f"Unknown retrieval mode '{mode}', expected 'vector' or 'hybrid'")
+        
+        self._retrieval_mode = mode
+        self._lexical_weight = min(1.0, max(0.0, float(retrieval_config.get("lexical_weight", self._lexical_weight))))
+        self._rrf_k = max(1, int(retrieval_config.get("rrf_k", self._rrf_k)))
+        self._extract_filters = bool(retrieval_config.get("extract_filters", self._extract_filters))
+        self._max_overfetch = max(1, int(retrieval_config.get("max_overfetch", self._max_overfetch)))
+    
+    def _configure_response_cache(self, cache_config: Dict[str, Any]) -> None:
+        """
+        Applies the response_cache settings (enabled, similarity_threshold,
+        max_size, ttl_seconds, path).
+        
+        Cached responses are tied to the configured generator provider, model
+        and generation options, so saved responses are not reused after any
+        of them changes.
+        
+        Args:
+            cache_config: The orchestrator.response_cache config section
+            
+        Raises:
+            ConfigurationError: If a setting is out of range
+        """
+        if not cache_config.get("enabled", False):
+            self._response_cache = None
+            return
+        
+        generator_config = self._config.get("generator", {})
+        namespace = SemanticResponseCache.fingerprint([
+            generator_config.get("provider"),
+            generator_config.get("model"),
+            self._config.get("generation_options", {})
+        ])
+        
+        try:
+            self._response_cache = SemanticResponseCache(
+                max_size=int(cache_config.get("max_size", 256)),
+                ttl_seconds=cache_config.get("ttl_seconds", 86400),
+                similarity_threshold=float(cache_config.get("similarity_threshold", 0.95)),
+                path=cache_config.get("path"),
+                namespace=namespace
+            )
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid response cache configuration: {str(e)}") from e
+    
+    def _configure_tracing(self) -> None:
+        """
+        Applies the system.tracing settings to the shared tracer and sets up the metrics exporter.
+        
+        Raises:
+            ConfigurationError: If the export settings are invalid
+        """
+        try:
+            tracing_config = get_component_config("system.tracing", self._config_path)
+        except Exception:
+            tracing_config = {}
+        
+        self._tracer.enabled = bool(tracing_config.get("enabled", True))
+        
+        export_config = tracing_config.get("export", {})
+        if not (self._tracer.enabled and export_config.get("enabled", False)):
+            return
+        
+        try:
+            self._metrics_exporter = MetricsExporter(
+                self._tracer,
+                format=export_config.get("format", "prometheus"),
+                path=export_config.get("path"),
+                endpoint=export_config.get("endpoint"),
+                interval_seconds=float(export_config.get("interval_seconds", 15)),
+                service_name=export_config.get("service_name", "ici-core")
+            )
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid tracing export configuration: {str(e)}") from e
+        
+        self.logger.info({
+            "action": "ORCHESTRATOR_METRICS_EXPORT",
+            "message": "Exporting stage latency metrics",
+            "data": self._metrics_exporter.status()
+        })
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns per-stage latency statistics for the query and ingestion paths.
+        
+        Returns:
+            Dict[str, Any]: "spans" maps span names (e.g. "query.embed",
+                "ingestion.store") to count, errors, mean, max, p50, p95 and p99
+                in seconds; "export" holds the metrics exporter's status, if any
+        """
+        return {
+            "spans": self._tracer.stats(),
+            "export": self._metrics_exporter.status() if self._metrics_exporter else None
+        }
+    
+    async def _lexical_search(
+        self, query: str, num_results: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs a BM25 keyword search in a worker thread, returning no results if it fails.
+        
+        Args:
+            query: The search query
+            num_results: Maximum number of documents to retrieve
+            filters: Optional metadata filters to apply
+            
+        Returns:
+            List[Dict[str, Any]]: Matching documents, best first
+        """
+        try:
+            results = await asyncio.to_thread(
+                self._vector_store.lexical_search, query, num_results=num_results, filters=filters
+            )
+            return list(results)
+        except Exception as e:
+            # Hybrid retrieval degrades to vector-only results
+            self.logger.warning({
+                "action": "ORCHESTRATOR_LEXICAL_SEARCH_ERROR",
+                "message": f"Lexical search failed, using vector results only: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            return []
+    
+    def _fuse_results(
+        self,
+        vector_results: List[Dict[str, Any]],
+        lexical_results: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Merges vector and lexical rankings with weighted reciprocal rank fusion.
+        
+        Each document scores (1 - lexical_weight) / (rrf_k + vector_rank) plus
+        lexical_weight / (rrf_k + lexical_rank), summed over the lists it
+        appears in, so documents found by both rank highest.
+        
+        Args:
+            vector_results: Vector search results, best first
+            lexical_results: Lexical search results, best first
+            top_k: Maximum number of documents to return
+            
+        Returns:
+            List[Dict[str, Any]]: Fused documents, best first, each with a 'fusion_score'
+        """
+        fused: Dict[str, Dict[str, Any]] = {}
+        weighted_lists = (
+            (vector_results, 1.0 - self._lexical_weight),
+            (lexical_results, self._lexical_weight),
+        )
+        for results, weight in weighted_lists:
+            for rank, doc in enumerate(results, start=1):
+                key = doc.get("id") or doc.get("text", "")
+                # Keep the first (vector) copy of documents found by both searches
+                entry = fused.setdefault(key, {"doc": doc, "fusion_score": 0.0})
+                entry["fusion_score"] += weight / (self._rrf_k + rank)
+        
+        ranked = sorted(fused.values(), key=lambda entry: entry["fusion_score"], reverse=True)
+        return [
+            {**entry["doc"], "fusion_score": entry["fusion_score"]}
+            for entry in ranked[:top_k]
+        ]
+    
+    def _build_search_filters(
+        self, query: str, additional_info: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Builds vector store metadata filters for a query.
+        
+        Constraints come from additional_info["filters"] and, when
+        retrieval.extract_filters is enabled, from the query text itself
+        (source, group or direct chats, and time phrases like "last week").
+        
+        Args:
+            query: The user's query
+            additional_info: Optional request attributes
+            
+        Returns:
+            Optional[Dict[str, Any]]: Metadata filters, or None for an unconstrained search
+        """
+        try:
+            constraints = extract_query_constraints(
+                query if self._extract_filters else "", additional_info
+            )
+            filters = build_metadata_filter(constraints)
+        except Exception as e:
+            self.logger.warning({
+                "action": "ORCHESTRATOR_FILTER_EXTRACTION_ERROR",
+                "message": f"Ignoring query constraints: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            return None
+        
+        if filters:
+            self.logger.info({
+                "action": "ORCHESTRATOR_QUERY_FILTERS",
+                "message": "Restricting search with query constraints",
+                "data": {"constraints": constraints, "filters": filters}
+            })
+        return filters
+    
+    @staticmethod
+    def _filter_shape(filters: Optional[Dict[str, Any]]) -> str:
+        """Names the metadata fields a filter constrains, ignoring their values."""
+        fields = set()
+        pending = [filters] if filters else []
+        while pending:
+            clause = pending.pop()
+            for key, value in clause.items():
+                if key in ("$and", "$or"):
+                    pending.extend(value)
+                else:
+                    fields.add(key)
+        return ",".join(sorted(fields))
+    
+    def _fetch_size(self, top_k: int, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Decides how many results to request so top_k survive the similarity threshold.
+        
+        Without a threshold exactly top_k are requested. Otherwise the request
+        is scaled by the measured share of results that passed the threshold
+        for searches with the same filter fields (initially half, matching
+        the former fixed 2x over-fetch), capped at max_overfetch times top_k.
+        
+        Args:
+            top_k: Number of results needed after thresholding
+            filters: The metadata filters of the search
+            
+        Returns:
+            int: Number of results to request from the vector store
+        """
+        if self._similarity_threshold <= 0:
+            return top_k
+        
+        kept_share = self._selectivity.get(self._filter_shape(filters), 0.5)
+        kept_share = max(kept_share, 1.0 / self._max_overfetch)
+        return min(top_k * self._max_overfetch, max(top_k, math.ceil(top_k / kept_share)))
+    
+    def _record_selectivity(
+        self, search_results: List[Dict[str, Any]], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Updates the running share of results that pass the similarity threshold.
+        
+        Args:
+            search_results: Results returned by the vector store, before thresholding
+            filters: The metadata filters of the search
+        """
+        if self._similarity_threshold <= 0 or not search_results:
+            return
+        
+        kept = sum(1 for doc in search_results if doc.get('score', 0) >= self._similarity_threshold)
+        shape = self._filter_shape(filters)
+        previous = self._selectivity.get(shape, 0.5)
+        alpha = self._selectivity_smoothing
+        self._selectivity[shape] = (1 - alpha) * previous + alpha * kept / len(search_results)
+    
+    def _apply_similarity_threshold(self, search_results: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        """
+        Drops results below the similarity threshold and keeps at most top_k.
+        
+        Args:
+            search_results: Results returned by the vector store
+            top_k: Maximum number of documents to keep
+            
+        Returns:
+            List[Dict[str, Any]]: The filtered results
+        """
+        if self._similarity_threshold > 0:
+            search_results = [
+                doc for doc in search_results
+                if doc.get('score', 0) >= self._similarity_threshold
+            ]
+        return search_results[:top_k]
+    
     async def _generate_response(self, prompt: str) -> str:
         """
         Generates a response using the generator component.
@@ -874,6 +1864,69 @@ class DefaultOrchestrator(Orchestrator):
             # Return fallback response
             return self._error_messages.get("generation_failed")
     
+    async def _generate_response_stream(
+        self, prompt: str, outcome: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streams a response from the generator component.
+        
+        If generation fails before anything was produced, the fallback
+        message is yielded instead; a failure mid-stream raises
+        GenerationError, so the partial response is not mistaken for a
+        complete one.
+        
+        Args:
+            prompt: The input prompt
+            outcome: Optional dict in which "complete" is set to True once the
+                whole response has been generated without errors
+            
+        Yields:
+            str: Consecutive pieces of the generated response
+            
+        Raises:
+            GenerationError: If generation fails after the first chunk
+        """
+        generation_options = self._config.get("generation_options", {})
+        started = False
+        first_chunk_time = None
+        start_time = time.time()
+        
+        self.logger.info({
+            "action": "ORCHESTRATOR_GENERATION_START",
+            "message": "Streaming response",
+            "data": {"prompt": prompt, "options": generation_options}
+        })
+        
+        try:
+            async for chunk in self._generator.generate_stream(prompt, generation_options):
+                if not started:
+                    started = True
+                    first_chunk_time = time.time() - start_time
+                yield chunk
+            
+            if outcome is not None:
+                outcome["complete"] = started
+            
+            self.logger.debug({
+                "action": "ORCHESTRATOR_GENERATION_SUCCESS",
+                "message": "Response streamed successfully",
+                "data": {
+                    "time_to_first_chunk": first_chunk_time,
+                    "elapsed_time": time.time() - start_time
+                }
+            })
+            
+        except Exception as e:
+            self.logger.error({
+                "action": "ORCHESTRATOR_GENERATION_ERROR",
+                "message": f"Failed to stream response: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__, "partial": started}
+            })
+            
+            if started:
+                raise GenerationError(f"Response stream failed after the first chunk: {str(e)}") from e
+            yield self._error_messages.get("generation_failed")
+    
     async def configure(self, config: Dict[str, Any]) -> None:
         """
         Configures the orchestrator with the provided settings.
@@ -901,6 +1954,9 @@ class DefaultOrchestrator(Orchestrator):
             if "error_messages" in config:
                 self._error_messages.update(config.get("error_messages", {}))
             
+            if "retrieval" in config:
+                self._configure_retrieval(config.get("retrieval", {}))
+            
             # Update internal config
             self._config.update(config)
             
@@ -1018,6 +2074,68 @@ class DefaultOrchestrator(Orchestrator):
             # Return minimal context on error
             return {"user_id": user_id, "timestamp": time.time()}
     
+    async def close(self) -> None:
+        """
+        Stop background ingestion and release pipeline and shared component resources.
+        
+        Returns:
+            None
+        """
+        # Let pending chat history writes finish
+        await self._wait_for_persistence()
+        
+        # Stop the metrics exporter after a final export
+        if self._metrics_exporter:
+            try:
+                await self._metrics_exporter.stop()
+            except Exception as e:
+                self.logger.error({
+                    "action": "ORCHESTRATOR_CLOSE_ERROR",
+                    "message": f"Failed to export final metrics: {str(e)}",
+                    "data": {"error": str(e), "error_type": type(e).__name__}
+                })
+        
+        if self._pipeline:
+            try:
+                await self._pipeline.close()
+            except Exception as e:
+                self.logger.error({
+                    "action": "ORCHESTRATOR_CLOSE_ERROR",
+                    "message": f"Failed to close pipeline: {str(e)}",
+                    "data": {"error": str(e), "error_type": type(e).__name__}
+                })
+        
+        # Keep cached responses for the next run
+        if self._response_cache:
+            try:
+                await asyncio.to_thread(self._response_cache.save)
+            except Exception as e:
+                self.logger.error({
+                    "action": "ORCHESTRATOR_CLOSE_ERROR",
+                    "message": f"Failed to save cached responses: {str(e)}",
+                    "data": {"error": str(e), "error_type": type(e).__name__}
+                })
+        
+        # Close pooled generator connections
+        if self._generator and hasattr(self._generator, "close"):
+            try:
+                await self._generator.close()
+            except Exception as e:
+                self.logger.error({
+                    "action": "ORCHESTRATOR_CLOSE_ERROR",
+                    "message": f"Failed to close generator: {str(e)}",
+                    "data": {"error": str(e), "error_type": type(e).__name__}
+                })
+        
+        # Release shared components (closed once the pipeline has released them too)
+        release_errors = await self._components.release_all()
+        for key, e in release_errors.items():
+            self.logger.error({
+                "action": "ORCHESTRATOR_CLOSE_ERROR",
+                "message": f"Failed to release component {key}: {str(e)}",
+                "data": {"component": key, "error": str(e), "error_type": type(e).__name__}
+            })
+    
     async def healthcheck(self) -> Dict[str, Any]:
         """
         Checks if the orchestrator and all its components are properly configured and functioning.
@@ -1092,7 +2210,12 @@ class DefaultOrchestrator(Orchestrator):
                 "rules_source": self._rules_source,
                 "component_count": len(health_result["components"]),
                 "active_chats_count": len(self._active_chats),
-                "supported_commands": list(self._commands.keys())
+                "supported_commands": list(self._commands.keys()),
+                "query_cache": self._query_cache.stats() if self._query_cache else {"enabled": False},
+                "response_cache": self._response_cache.stats() if self._response_cache else {"enabled": False},
+                "retrieval_selectivity": dict(self._selectivity),
+                "latency": self._tracer.stats(),
+                "metrics_export": self._metrics_exporter.status() if self._metrics_exporter else {"enabled": False}
             })
             
             return health_result
@@ -8,9 +8,14 @@ registry system.
 
 import asyncio
 import os
+import random
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from ici.core.interfaces import IngestionPipeline
 from ici.core.interfaces.embedder import Embedder
 from ici.core.interfaces.vector_store import VectorStore
@@ -18,12 +23,15 @@ from ici.adapters.ingestors import TelegramIngestor, WhatsAppIngestor
 from ici.adapters.preprocessors import TelegramPreprocessor, WhatsAppPreprocessor
 from ici.adapters.loggers import StructuredLogger
 from ici.utils.config import get_component_config, load_config
+from ici.utils.component_registry import get_component_registry
+from ici.utils.tracing import get_tracer
 from ici.core.exceptions import (
     IngestionPipelineError, ConfigurationError, DataFetchError, 
     PreprocessorError, EmbeddingError, VectorStoreError
 )
 from ici.utils.datetime_utils import from_timestamp, ensure_tz_aware
 from ici.utils.state_manager import StateManager
+from ici.utils.document_id import generate_document_id
 
 
 class DefaultIngestionPipeline(IngestionPipeline):
@@ -39,6 +47,13 @@ class DefaultIngestionPipeline(IngestionPipeline):
     - WhatsApp
     """
     
+    TELEGRAM_INGESTOR_ID = "@user/telegram_ingestor"
+    WHATSAPP_INGESTOR_ID = "@user/whatsapp_ingestor"
+    
+    # Config sections of the shared components, also used as component registry keys
+    EMBEDDER_KEY = "embedders.sentence_transformer"
+    VECTOR_STORE_KEY = "vector_stores"
+    
     def __init__(self, logger_name: str = "default_ingestion_pipeline"):
         """
         Initialize the DefaultIngestionPipeline.
@@ -55,12 +70,36 @@ class DefaultIngestionPipeline(IngestionPipeline):
         self._vector_store = None
         self._state_manager = None
         
+        # Shared embedder/vector store instances held by this pipeline
+        self._components = get_component_registry().handle()
+        
         # Ingestor registry - maps ingestor IDs to their components
         self._ingestors = {}
         
+        # Per-ingestor timeout overrides in seconds, keyed by ingestor ID
+        self._ingestor_timeouts = {}
+        
+        # Serializes writes to the shared vector store across concurrent ingestors
+        self._vector_store_lock = threading.Lock()
+        
+        # Shared tracer recording ingestion.* stage latencies
+        self._tracer = get_tracer()
+        
+        # Scheduler state
+        self._ingestor_intervals = {}  # Per-ingestor interval overrides in minutes
+        self._scheduler_tasks = {}  # Maps ingestor IDs to their background schedule loops
+        self._running_ingestors = set()  # Ingestors with an ingestion run in progress
+        
         # Configuration
         self._batch_size = 100
         self._schedule_interval_minutes = 60
+        self._streaming_enabled = False
+        self._stream_queue_size = 4
+        self._max_concurrent_ingestors = 2
+        self._ingestor_timeout_seconds = 0  # 0 disables the timeout
+        self._schedule_enabled = True
+        self._schedule_jitter_ratio = 0.1
+        self._schedule_max_backoff_minutes = 60
     
     async def initialize(self) -> None:
         """
@@ -97,18 +136,38 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 if "batch_size" in pipeline_config:
                     self._batch_size = int(pipeline_config["batch_size"])
                 
-                if "schedule" in pipeline_config and "interval_minutes" in pipeline_config["schedule"]:
-                    self._schedule_interval_minutes = int(pipeline_config["schedule"]["interval_minutes"])
+                schedule_config = pipeline_config.get("schedule", {})
+                if "interval_minutes" in schedule_config:
+                    self._schedule_interval_minutes = float(schedule_config["interval_minutes"])
+                self._schedule_enabled = bool(schedule_config.get("enabled", self._schedule_enabled))
+                self._schedule_jitter_ratio = float(schedule_config.get("jitter_ratio", self._schedule_jitter_ratio))
+                self._schedule_max_backoff_minutes = float(
+                    schedule_config.get("max_backoff_minutes", self._schedule_max_backoff_minutes)
+                )
+                
+                streaming_config = pipeline_config.get("streaming", {})
+                self._streaming_enabled = bool(streaming_config.get("enabled", self._streaming_enabled))
+                self._stream_queue_size = int(streaming_config.get("queue_size", self._stream_queue_size))
+                
+                if "max_concurrent_ingestors" in pipeline_config:
+                    self._max_concurrent_ingestors = max(1, int(pipeline_config["max_concurrent_ingestors"]))
+                
+                if "ingestor_timeout_seconds" in pipeline_config:
+                    self._ingestor_timeout_seconds = float(pipeline_config["ingestor_timeout_seconds"])
             
             # Initialize shared components
             
-            # 1. Embedder - Use the one from config
-            embedder_config = get_component_config("embedders.sentence_transformer", self._config_path)
-            self._embedder = await self._load_embedder(embedder_config)
+            # 1. Embedder - Use the one from config, shared with the orchestrator if it already exists
+            embedder_config = get_component_config(self.EMBEDDER_KEY, self._config_path)
+            self._embedder = await self._components.acquire(
+                self.EMBEDDER_KEY, lambda: self._load_embedder(embedder_config)
+            )
             
-            # 2. Vector Store - Use ChromaDB from config
-            vector_store_config = get_component_config("vector_stores.chroma", self._config_path)
-            self._vector_store = await self._load_vector_store(vector_store_config)
+            # 2. Vector Store - Use the configured backend, shared the same way
+            vector_store_config = get_component_config(self.VECTOR_STORE_KEY, self._config_path)
+            self._vector_store = await self._components.acquire(
+                self.VECTOR_STORE_KEY, lambda: self._load_vector_store(vector_store_config)
+            )
             
             # 3. State Manager
             state_manager_config = get_component_config("state_manager", self._config_path)
@@ -127,6 +186,10 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 telegram_ingestor_config = get_component_config("pipelines.telegram.ingestor.telegram", self._config_path)
                 if telegram_ingestor_config:
                     await self._initialize_telegram_ingestor(telegram_ingestor_config)
+                if "timeout_seconds" in telegram_pipeline_config:
+                    self._ingestor_timeouts[self.TELEGRAM_INGESTOR_ID] = float(telegram_pipeline_config["timeout_seconds"])
+                if "interval_minutes" in telegram_pipeline_config.get("schedule", {}):
+                    self._ingestor_intervals[self.TELEGRAM_INGESTOR_ID] = float(telegram_pipeline_config["schedule"]["interval_minutes"])
             
             # For whatsapp pipeline
             whatsapp_pipeline_config = get_component_config("pipelines.whatsapp", self._config_path)
@@ -134,6 +197,10 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 whatsapp_ingestor_config = get_component_config("pipelines.whatsapp.ingestor.whatsapp", self._config_path)
                 if whatsapp_ingestor_config:
                     await self._initialize_whatsapp_ingestor(whatsapp_ingestor_config)
+                if "timeout_seconds" in whatsapp_pipeline_config:
+                    self._ingestor_timeouts[self.WHATSAPP_INGESTOR_ID] = float(whatsapp_pipeline_config["timeout_seconds"])
+                if "interval_minutes" in whatsapp_pipeline_config.get("schedule", {}):
+                    self._ingestor_intervals[self.WHATSAPP_INGESTOR_ID] = float(whatsapp_pipeline_config["schedule"]["interval_minutes"])
             
             self.logger.info({
                 "action": "PIPELINE_INITIALIZED",
@@ -141,6 +208,11 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 "data": {
                     "batch_size": self._batch_size,
                     "schedule_interval_minutes": self._schedule_interval_minutes,
+                    "ingestor_intervals_minutes": self._ingestor_intervals,
+                    "streaming_enabled": self._streaming_enabled,
+                    "stream_queue_size": self._stream_queue_size,
+                    "max_concurrent_ingestors": self._max_concurrent_ingestors,
+                    "ingestor_timeout_seconds": self._ingestor_timeout_seconds,
                     "registered_ingestors": list(self._ingestors.keys())
                 }
             })
@@ -174,7 +246,7 @@ class DefaultIngestionPipeline(IngestionPipeline):
             await telegram_preprocessor.initialize()
             
             # Register the Telegram ingestor with a unique ID
-            ingestor_id = "@user/telegram_ingestor"
+            ingestor_id = self.TELEGRAM_INGESTOR_ID
             self.register_ingestor(
                 ingestor_id=ingestor_id,
                 ingestor=telegram_ingestor,
@@ -215,7 +287,7 @@ class DefaultIngestionPipeline(IngestionPipeline):
             await whatsapp_preprocessor.initialize()
             
             # Register the WhatsApp ingestor with a unique ID
-            ingestor_id = "@user/whatsapp_ingestor"
+            ingestor_id = self.WHATSAPP_INGESTOR_ID
             self.register_ingestor(
                 ingestor_id=ingestor_id,
                 ingestor=whatsapp_ingestor,
@@ -249,10 +321,10 @@ class DefaultIngestionPipeline(IngestionPipeline):
         Raises:
             ConfigurationError: If embedder loading fails
         """
-        from ici.adapters.embedders import SentenceTransformerEmbedder
+        from ici.adapters.embedders import create_embedder
         
         try:
-            embedder = SentenceTransformerEmbedder()
+            embedder = create_embedder(logger_name="pipeline.embedder", config_path=self._config_path)
             # Initialize the embedder asynchronously with await
             await embedder.initialize()
             return embedder
@@ -278,10 +350,10 @@ class DefaultIngestionPipeline(IngestionPipeline):
         Raises:
             ConfigurationError: If vector store loading fails
         """
-        from ici.adapters.vector_stores import ChromaDBStore
+        from ici.adapters.vector_stores import create_vector_store
         
         try:
-            vector_store = ChromaDBStore()
+            vector_store = create_vector_store(logger_name="pipeline.vector_store", config_path=self._config_path)
             await vector_store.initialize()
             return vector_store
         except Exception as e:
@@ -378,6 +450,25 @@ class DefaultIngestionPipeline(IngestionPipeline):
         if ingestor_id not in self._ingestors:
             raise IngestionPipelineError(f"Unknown ingestor ID: {ingestor_id}")
         
+        self._running_ingestors.add(ingestor_id)
+        try:
+            return await self._run_ingestion(ingestor_id)
+        finally:
+            self._running_ingestors.discard(ingestor_id)
+    
+    async def _run_ingestion(self, ingestor_id: str) -> Dict[str, Any]:
+        """
+        Execute the ingestion pipeline for a specific ingestor.
+        
+        See run_ingestion(), which tracks the run so the scheduler can skip
+        ingestors that are still running.
+        
+        Args:
+            ingestor_id: Unique identifier for the ingestor
+            
+        Returns:
+            Dict[str, Any]: Summary of the ingestion run
+        """
         start_time = datetime.now(timezone.utc)
         results = {
             "success": False,
@@ -436,21 +527,14 @@ class DefaultIngestionPipeline(IngestionPipeline):
                         results["message"] = "Authentication timeout"
                         return self._finalize_results(results, start_time)
             
-            # Fetch data based on ingestor type and state
-            raw_data = None
-            
-            # Determine fetch mode based on state
-            if last_timestamp == 0:
-                # First run - fetch all historical data
-                raw_data = await ingestor.fetch_full_data()
+            # Fetch, preprocess, embed and store
+            if self._streaming_enabled:
+                stats = await self._run_streaming_ingestion(ingestor, preprocessor, last_timestamp, results)
             else:
-                # Incremental run - fetch new data since last timestamp
-                # Convert timestamp to timezone-aware datetime
-                last_datetime = datetime.fromtimestamp(last_timestamp, tz=timezone.utc)
-                raw_data = await ingestor.fetch_new_data(since=last_datetime)
+                stats = await self._run_batch_ingestion(ingestor, preprocessor, last_timestamp, results)
             
             # Check if data was retrieved
-            if not raw_data or not (raw_data.get("messages") or raw_data.get("conversations")):
+            if stats["message_count"] == 0:
                 self.logger.info({
                     "action": "PIPELINE_NO_DATA",
                     "message": "No new data to process"
@@ -459,10 +543,7 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 results["message"] = "No new data to process"
                 return self._finalize_results(results, start_time)
             
-            # Process messages - preprocessor handles the specific ingestor's data format
-            documents = await preprocessor.preprocess(raw_data)
-            
-            if not documents:
+            if stats["documents_generated"] == 0:
                 self.logger.info({
                     "action": "PIPELINE_NO_DOCUMENTS",
                     "message": "No documents generated from preprocessing"
@@ -471,73 +552,15 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 results["message"] = "No documents generated"
                 return self._finalize_results(results, start_time)
             
-            total_documents = len(documents)
-            self.logger.info({
-                "action": "PREPROCESSING_COMPLETE",
-                "message": f"Generated {total_documents} documents from raw data",
-                "data": {"document_count": total_documents}
-            })
-            
-            # Process documents in batches
-            total_documents_processed = 0
-            latest_timestamp = last_timestamp
-            
-            # Find messages sorted by timestamp for state tracking
-            messages = raw_data.get("messages", [])
-            if messages:
-                sorted_messages = sorted(messages, key=lambda m: m.get("timestamp", 0))
-                
-                # Get timestamp from latest message
-                latest_message = sorted_messages[-1]
-                # Convert to seconds if needed (WhatsApp uses milliseconds)
-                message_timestamp = latest_message.get("timestamp", 0)
-                if message_timestamp > 1600000000000:  # Likely milliseconds
-                    message_timestamp = message_timestamp / 1000
-                
-                if message_timestamp > latest_timestamp:
-                    latest_timestamp = message_timestamp
-            
-            # Process documents in batches
-            for i in range(0, len(documents), self._batch_size):
-                batch = documents[i:i + self._batch_size]
-                
-                try:
-                    # Generate embeddings and store documents
-                    document_list = []
-                    vectors_list = []
-                    
-                    for doc in batch:
-                        # Generate embeddings for the text
-                        embedding, _ = await self._embedder.embed(doc["text"])
-                        
-                        # Add to document and vectors lists
-                        document_list.append({
-                            "text": doc["text"],
-                            "metadata": doc["metadata"]
-                        })
-                        vectors_list.append(embedding)
-                    
-                    # Add to vector store
-                    self._vector_store.add_documents(documents=document_list, vectors=vectors_list)
-                    
-                    # Update count
-                    total_documents_processed += len(batch)
-                    
-                except Exception as e:
-                    error_message = f"Error processing batch: {str(e)}"
-                    self.logger.error({
-                        "action": "BATCH_PROCESSING_ERROR",
-                        "message": error_message,
-                        "data": {"error": str(e), "batch_size": len(batch)}
-                    })
-                    results["errors"].append(error_message)
+            total_documents_processed = stats["documents_processed"]
+            latest_timestamp = stats["latest_timestamp"]
             
             # Update state with latest timestamp if newer messages were processed
             if latest_timestamp > last_timestamp and total_documents_processed > 0:
                 # Update metadata with processing stats
                 new_metadata = metadata.copy()
                 new_metadata["last_run"] = datetime.now(timezone.utc).isoformat()
-                new_metadata["total_messages_processed"] = metadata.get("total_messages_processed", 0) + len(messages)
+                new_metadata["total_messages_processed"] = metadata.get("total_messages_processed", 0) + stats["message_count"]
                 new_metadata["total_documents_processed"] = metadata.get("total_documents_processed", 0) + total_documents_processed
                 
                 # Set state with new timestamp and metadata
@@ -578,6 +601,293 @@ class DefaultIngestionPipeline(IngestionPipeline):
             results["errors"].append(error_message)
             return self._finalize_results(results, start_time)
     
+    async def _run_batch_ingestion(
+        self,
+        ingestor: Any,
+        preprocessor: Any,
+        last_timestamp: float,
+        results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Fetch all data, preprocess it, then embed and store it batch by batch.
+        
+        Args:
+            ingestor: Ingestor to fetch data from
+            preprocessor: Preprocessor paired with the ingestor
+            last_timestamp: Last processed timestamp from the ingestor state
+            results: Run results; batch errors are appended to results["errors"]
+            
+        Returns:
+            Dict[str, Any]: Run statistics with message_count, latest_timestamp,
+                documents_generated and documents_processed
+        """
+        stats = {
+            "message_count": 0,
+            "latest_timestamp": last_timestamp,
+            "documents_generated": 0,
+            "documents_processed": 0
+        }
+        
+        # Determine fetch mode based on state
+        with self._tracer.span("ingestion.fetch"):
+            if last_timestamp == 0:
+                # First run - fetch all historical data
+                raw_data = await ingestor.fetch_full_data()
+            else:
+                # Incremental run - fetch new data since last timestamp
+                # Convert timestamp to timezone-aware datetime
+                last_datetime = datetime.fromtimestamp(last_timestamp, tz=timezone.utc)
+                raw_data = await ingestor.fetch_new_data(since=last_datetime)
+        
+        if not raw_data:
+            return stats
+        
+        self._update_message_stats(stats, raw_data)
+        if stats["message_count"] == 0:
+            return stats
+        
+        # Process messages - preprocessor handles the specific ingestor's data format
+        with self._tracer.span("ingestion.preprocess"):
+            documents = await preprocessor.preprocess(raw_data)
+        stats["documents_generated"] = len(documents)
+        
+        if not documents:
+            return stats
+        
+        self.logger.info({
+            "action": "PREPROCESSING_COMPLETE",
+            "message": f"Generated {len(documents)} documents from raw data",
+            "data": {"document_count": len(documents)}
+        })
+        
+        # Process documents in batches
+        for i in range(0, len(documents), self._batch_size):
+            batch = documents[i:i + self._batch_size]
+            stats["documents_processed"] += await self._store_batch(batch, results)
+        
+        return stats
+    
+    async def _run_streaming_ingestion(
+        self,
+        ingestor: Any,
+        preprocessor: Any,
+        last_timestamp: float,
+        results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Stream data through fetch, preprocess and embed/store stages concurrently.
+        
+        The ingestor yields chunks (one conversation at a time for Telegram and
+        WhatsApp), which flow through bounded queues so that fetching,
+        preprocessing and embedding overlap. Memory use is capped by the queue
+        depth rather than by the size of the fetched history. A None sentinel
+        marks the end of each queue.
+        
+        The fetch and preprocess stages are each recorded as one span per run,
+        excluding the time spent blocked on the queues, so back-pressure from
+        a slower stage is not attributed to them.
+        
+        Args:
+            ingestor: Ingestor to fetch data from
+            preprocessor: Preprocessor paired with the ingestor
+            last_timestamp: Last processed timestamp from the ingestor state
+            results: Run results; batch errors are appended to results["errors"]
+            
+        Returns:
+            Dict[str, Any]: Run statistics with message_count, latest_timestamp,
+                documents_generated and documents_processed
+        """
+        stats = {
+            "message_count": 0,
+            "latest_timestamp": last_timestamp,
+            "documents_generated": 0,
+            "documents_processed": 0
+        }
+        
+        raw_queue = asyncio.Queue(maxsize=self._stream_queue_size)
+        batch_queue = asyncio.Queue(maxsize=self._stream_queue_size)
+        
+        # Determine fetch mode based on state
+        if last_timestamp == 0:
+            raw_chunks = ingestor.fetch_full_data_stream()
+        else:
+            last_datetime = datetime.fromtimestamp(last_timestamp, tz=timezone.utc)
+            raw_chunks = ingestor.fetch_new_data_stream(since=last_datetime)
+        
+        self.logger.info({
+            "action": "PIPELINE_STREAMING_START",
+            "message": "Running streaming ingestion",
+            "data": {"queue_size": self._stream_queue_size, "batch_size": self._batch_size}
+        })
+        
+        # Seconds the fetch and preprocess stages spent blocked on a queue
+        queue_waits = {"fetch": 0.0, "preprocess": 0.0}
+        
+        async def wait_on_queue(stage: str, awaitable):
+            started = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                queue_waits[stage] += time.perf_counter() - started
+        
+        def record_stage(stage: str, started: float, error: bool) -> None:
+            elapsed = time.perf_counter() - started - queue_waits[stage]
+            self._tracer.record(f"ingestion.{stage}", max(elapsed, 0.0), error)
+        
+        async def drain(queue: asyncio.Queue, stage: Optional[str] = None):
+            while True:
+                item = await (wait_on_queue(stage, queue.get()) if stage else queue.get())
+                if item is None:
+                    return
+                yield item
+        
+        async def fetch_stage():
+            started = time.perf_counter()
+            error = False
+            try:
+                async for raw_data in raw_chunks:
+                    if not raw_data:
+                        continue
+                    self._update_message_stats(stats, raw_data)
+                    await wait_on_queue("fetch", raw_queue.put(raw_data))
+            except BaseException:
+                error = True
+                raise
+            finally:
+                await raw_chunks.aclose()
+                record_stage("fetch", started, error)
+            await raw_queue.put(None)
+        
+        async def preprocess_stage():
+            # Re-batch documents so the embedder always sees full batches
+            started = time.perf_counter()
+            error = False
+            try:
+                pending = []
+                async for documents in preprocessor.preprocess_stream(drain(raw_queue, "preprocess")):
+                    stats["documents_generated"] += len(documents)
+                    pending.extend(documents)
+                    while len(pending) >= self._batch_size:
+                        await wait_on_queue("preprocess", batch_queue.put(pending[:self._batch_size]))
+                        pending = pending[self._batch_size:]
+                if pending:
+                    await wait_on_queue("preprocess", batch_queue.put(pending))
+            except BaseException:
+                error = True
+                raise
+            finally:
+                record_stage("preprocess", started, error)
+            await batch_queue.put(None)
+        
+        async def store_stage():
+            async for batch in drain(batch_queue):
+                stats["documents_processed"] += await self._store_batch(batch, results)
+        
+        tasks = [
+            asyncio.ensure_future(fetch_stage()),
+            asyncio.ensure_future(preprocess_stage()),
+            asyncio.ensure_future(store_stage())
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would leave the others blocked on their queues
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        self.logger.info({
+            "action": "PIPELINE_STREAMING_COMPLETE",
+            "message": f"Streamed {stats['message_count']} messages into {stats['documents_generated']} documents",
+            "data": stats
+        })
+        
+        return stats
+    
+    async def _store_batch(self, batch: List[Dict[str, Any]], results: Dict[str, Any]) -> int:
+        """
+        Embed a batch of documents and add them to the vector store.
+        
+        Errors are logged and recorded in results["errors"] so that one failing
+        batch does not abort the rest of the run.
+        
+        Args:
+            batch: Preprocessed documents with 'text' and 'metadata'
+            results: Run results to record errors in
+            
+        Returns:
+            int: Number of documents stored (0 if the batch failed)
+        """
+        try:
+            # Generate embeddings for the whole batch in a single call, as one float32 array
+            with self._tracer.span("ingestion.embed"):
+                vectors, _ = await self._embedder.embed_batch_array([doc["text"] for doc in batch])
+
+            document_list = [
+                {"id": doc.get("id") or generate_document_id(doc), "text": doc["text"], "metadata": doc["metadata"]}
+                for doc in batch
+            ]
+
+            # Add to vector store off the event loop so other ingestors keep running
+            with self._tracer.span("ingestion.store"):
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._add_to_vector_store, document_list, vectors
+                )
+            
+            return len(batch)
+            
+        except Exception as e:
+            error_message = f"Error processing batch: {str(e)}"
+            self.logger.error({
+                "action": "BATCH_PROCESSING_ERROR",
+                "message": error_message,
+                "data": {"error": str(e), "batch_size": len(batch)}
+            })
+            results["errors"].append(error_message)
+            return 0
+    
+    def _add_to_vector_store(self, documents: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        """
+        Add documents to the shared vector store, one writer at a time.
+        
+        Runs in a worker thread. The lock is taken inside the thread so writes
+        stay serialized even if the awaiting ingestion run is cancelled.
+        
+        Args:
+            documents: Documents with 'text' and 'metadata'
+            vectors: (len(documents), dimensions) float32 array of embeddings
+        """
+        with self._vector_store_lock:
+            self._vector_store.add_documents(documents=documents, vectors=vectors)
+    
+    def _update_message_stats(self, stats: Dict[str, Any], raw_data: Dict[str, Any]) -> None:
+        """
+        Add the message count and latest message timestamp of raw data to run stats.
+        
+        Handles both the flat 'messages' list and the 'conversations' dict
+        mapping chat_ids to message lists.
+        
+        Args:
+            stats: Run statistics to update in place
+            raw_data: Raw data returned by an ingestor
+        """
+        if isinstance(raw_data.get("conversations"), dict):
+            message_lists = raw_data["conversations"].values()
+        else:
+            message_lists = [raw_data.get("messages") or []]
+        
+        for messages in message_lists:
+            stats["message_count"] += len(messages)
+            for message in messages:
+                # Convert to seconds if needed (WhatsApp uses milliseconds)
+                message_timestamp = message.get("timestamp") or 0
+                if message_timestamp > 1600000000000:  # Likely milliseconds
+                    message_timestamp = message_timestamp / 1000
+                
+                if message_timestamp > stats["latest_timestamp"]:
+                    stats["latest_timestamp"] = message_timestamp
+    
     def _finalize_results(self, results: Dict[str, Any], start_time: datetime) -> Dict[str, Any]:
         """
         Finalize the results dictionary with timing information.
@@ -592,6 +902,10 @@ class DefaultIngestionPipeline(IngestionPipeline):
         end_time = datetime.now(timezone.utc)
         results["end_time"] = end_time
         results["duration"] = (end_time - start_time).total_seconds()
+        results["documents_per_second"] = (
+            results["documents_processed"] / results["duration"] if results["duration"] > 0 else 0.0
+        )
+        self._tracer.record("ingestion.total", results["duration"], error=not results["success"])
         return results
     
     def get_ingestor_state(self, ingestor_id: str) -> Dict[str, Any]:
@@ -656,14 +970,18 @@ class DefaultIngestionPipeline(IngestionPipeline):
             })
             raise IngestionPipelineError(f"Failed to set ingestor state: {str(e)}") from e
     
-    async def start(self) -> None:
+    async def start(self) -> Dict[str, Dict[str, Any]]:
         """
         Start the ingestion process for all registered ingestors.
         
-        This method runs ingestion for all registered ingestors in sequence.
+        Ingestors run concurrently, at most max_concurrent_ingestors at a time,
+        sharing the pipeline's embedder and vector store. Each run is bounded by
+        its timeout (pipelines.<name>.timeout_seconds, falling back to
+        ingestor_timeout_seconds) and failures are isolated per ingestor.
         
         Returns:
-            None
+            Dict[str, Dict[str, Any]]: Results keyed by ingestor ID, each including
+                its wall-clock duration and documents_per_second
             
         Raises:
             IngestionPipelineError: If starting the ingestion process fails
@@ -676,46 +994,187 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 "action": "PIPELINE_NO_INGESTORS",
                 "message": "No ingestors registered, nothing to run"
             })
-            return
+            return {}
         
         self.logger.info({
             "action": "PIPELINE_START",
-            "message": f"Starting ingestion for {len(self._ingestors)} registered ingestors"
+            "message": f"Starting ingestion for {len(self._ingestors)} registered ingestors",
+            "data": {"max_concurrent_ingestors": self._max_concurrent_ingestors}
         })
         
-        results = {}
+        semaphore = asyncio.Semaphore(self._max_concurrent_ingestors)
+        start_time = time.perf_counter()
         
-        for ingestor_id in self._ingestors.keys():
-            try:
-                result = await self.run_ingestion(ingestor_id)
-                results[ingestor_id] = result
-            except Exception as e:
-                self.logger.error({
-                    "action": "INGESTOR_RUN_ERROR",
-                    "message": f"Error running ingestion for {ingestor_id}: {str(e)}",
-                    "data": {"ingestor_id": ingestor_id, "error": str(e)}
-                })
-                results[ingestor_id] = {
-                    "success": False,
-                    "error": str(e)
-                }
+        async def run_with_limits(ingestor_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                timeout = self._ingestor_timeouts.get(ingestor_id, self._ingestor_timeout_seconds)
+                run_start = time.perf_counter()
+                try:
+                    return await asyncio.wait_for(self.run_ingestion(ingestor_id), timeout=timeout or None)
+                except asyncio.TimeoutError:
+                    error_message = f"Ingestion for {ingestor_id} timed out after {timeout} seconds"
+                    self.logger.error({
+                        "action": "INGESTOR_RUN_TIMEOUT",
+                        "message": error_message,
+                        "data": {"ingestor_id": ingestor_id, "timeout_seconds": timeout}
+                    })
+                    return {
+                        "success": False,
+                        "error": error_message,
+                        "timed_out": True,
+                        "duration": time.perf_counter() - run_start
+                    }
+                except Exception as e:
+                    self.logger.error({
+                        "action": "INGESTOR_RUN_ERROR",
+                        "message": f"Error running ingestion for {ingestor_id}: {str(e)}",
+                        "data": {"ingestor_id": ingestor_id, "error": str(e)}
+                    })
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "duration": time.perf_counter() - run_start
+                    }
+        
+        ingestor_ids = list(self._ingestors.keys())
+        run_results = await asyncio.gather(*(run_with_limits(ingestor_id) for ingestor_id in ingestor_ids))
+        results = dict(zip(ingestor_ids, run_results))
         
         self.logger.info({
             "action": "PIPELINE_COMPLETE",
             "message": "Completed ingestion for all registered ingestors",
-            "data": {"results": results}
+            "data": {
+                "results": results,
+                "wall_clock_seconds": time.perf_counter() - start_time
+            }
         })
+        
+        return results
+    
+    async def start_scheduler(self) -> None:
+        """
+        Start background ingestion for every registered ingestor.
+        
+        Each ingestor runs on its own interval (pipelines.<name>.schedule.interval_minutes,
+        falling back to pipelines.default.schedule.interval_minutes). The loops run
+        as asyncio tasks, so the caller (e.g. the CLI) keeps serving requests.
+        Call stop() to cancel them.
+        
+        Returns:
+            None
+            
+        Raises:
+            IngestionPipelineError: If the pipeline is not initialized
+        """
+        if not self._is_initialized:
+            raise IngestionPipelineError("Pipeline not initialized. Call initialize() first.")
+        
+        if not self._schedule_enabled:
+            self.logger.info({
+                "action": "SCHEDULER_DISABLED",
+                "message": "Scheduled ingestion is disabled"
+            })
+            return
+        
+        for ingestor_id in self._ingestors:
+            task = self._scheduler_tasks.get(ingestor_id)
+            if task and not task.done():
+                continue
+            
+            interval_minutes = self._ingestor_intervals.get(ingestor_id, self._schedule_interval_minutes)
+            self._scheduler_tasks[ingestor_id] = asyncio.create_task(
+                self._schedule_loop(ingestor_id, interval_minutes * 60)
+            )
+        
+        self.logger.info({
+            "action": "SCHEDULER_STARTED",
+            "message": f"Scheduled ingestion for {len(self._scheduler_tasks)} ingestors",
+            "data": {
+                "intervals_minutes": {
+                    ingestor_id: self._ingestor_intervals.get(ingestor_id, self._schedule_interval_minutes)
+                    for ingestor_id in self._scheduler_tasks
+                }
+            }
+        })
+    
+    async def _schedule_loop(self, ingestor_id: str, interval_seconds: float) -> None:
+        """
+        Run ingestion for one ingestor on a fixed interval until cancelled.
+        
+        - Jitter: each wait is extended by a random fraction (jitter_ratio) of the
+          interval so ingestors sharing an interval don't fire in lockstep.
+        - Skip-if-running: a tick is skipped while a run of the same ingestor
+          (e.g. from start()) is still in progress.
+        - Backoff: after consecutive failures the wait doubles per failure, capped
+          at max_backoff_minutes, and resets after a successful run.
+        
+        Args:
+            ingestor_id: Unique identifier for the ingestor
+            interval_seconds: Base interval between runs
+        """
+        consecutive_failures = 0
+        max_backoff_seconds = max(self._schedule_max_backoff_minutes * 60, interval_seconds)
+        
+        while True:
+            delay = min(interval_seconds * (2 ** consecutive_failures), max_backoff_seconds)
+            delay += random.uniform(0, self._schedule_jitter_ratio * interval_seconds)
+            await asyncio.sleep(delay)
+            
+            if ingestor_id in self._running_ingestors:
+                self.logger.info({
+                    "action": "SCHEDULED_RUN_SKIPPED",
+                    "message": f"Skipping scheduled ingestion for {ingestor_id}: previous run still in progress",
+                    "data": {"ingestor_id": ingestor_id}
+                })
+                continue
+            
+            try:
+                result = await self.run_ingestion(ingestor_id)
+                succeeded = bool(result.get("success"))
+            except Exception as e:
+                succeeded = False
+                self.logger.error({
+                    "action": "SCHEDULED_RUN_ERROR",
+                    "message": f"Scheduled ingestion for {ingestor_id} failed: {str(e)}",
+                    "data": {"ingestor_id": ingestor_id, "error": str(e), "error_type": type(e).__name__}
+                })
+            
+            if succeeded:
+                consecutive_failures = 0
+            else:
+                consecutive_failures += 1
+                self.logger.warning({
+                    "action": "SCHEDULED_RUN_BACKOFF",
+                    "message": f"Backing off scheduled ingestion for {ingestor_id}",
+                    "data": {
+                        "ingestor_id": ingestor_id,
+                        "consecutive_failures": consecutive_failures,
+                        "next_delay_seconds": min(interval_seconds * (2 ** consecutive_failures), max_backoff_seconds)
+                    }
+                })
     
     def stop(self) -> None:
         """
-        Stop the ingestion process.
+        Stop the ingestion scheduler.
         
-        This method currently does nothing as we don't have a continuous process.
+        Cancels the background schedule loops. A run in progress is cancelled
+        along with its loop; ingestor state is only advanced after a run
+        completes, so the next run picks up where the last completed one ended.
         
         Returns:
             None
         """
-        pass
+        if not self._scheduler_tasks:
+            return
+        
+        for task in self._scheduler_tasks.values():
+            task.cancel()
+        
+        self.logger.info({
+            "action": "SCHEDULER_STOPPED",
+            "message": f"Stopped scheduled ingestion for {len(self._scheduler_tasks)} ingestors"
+        })
+        self._scheduler_tasks = {}
     
     async def close(self) -> None:
         """
@@ -735,6 +1194,12 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 "message": "Closing default ingestion pipeline"
             })
             
+            # Cancel scheduled runs and wait for them to unwind
+            scheduler_tasks = list(self._scheduler_tasks.values())
+            self.stop()
+            if scheduler_tasks:
+                await asyncio.gather(*scheduler_tasks, return_exceptions=True)
+            
             # Close all ingestors
             for ingestor_id, components in self._ingestors.items():
                 ingestor = components["ingestor"]
@@ -748,6 +1213,15 @@ class DefaultIngestionPipeline(IngestionPipeline):
                             "data": {"ingestor_id": ingestor_id, "error": str(e)}
                         })
             
+            # Release shared components (closed once no other component uses them)
+            release_errors = await self._components.release_all()
+            for key, e in release_errors.items():
+                self.logger.warning({
+                    "action": "COMPONENT_RELEASE_ERROR",
+                    "message": f"Error releasing component {key}: {str(e)}",
+                    "data": {"component": key, "error": str(e)}
+                })
+            
             # Close other components if needed
             # (Most components don't need explicit cleanup)
             
@@ -805,6 +1279,18 @@ class DefaultIngestionPipeline(IngestionPipeline):
                 health_info["components"]["state_manager"] = {"status": "error", "message": str(e)}
                 health_info["status"] = "degraded"
             
+            # Scheduler status
+            health_info["scheduler"] = {
+                "enabled": self._schedule_enabled,
+                "scheduled_ingestors": [
+                    ingestor_id for ingestor_id, task in self._scheduler_tasks.items() if not task.done()
+                ],
+                "running_ingestors": sorted(self._running_ingestors)
+            }
+            
+            # Per-stage latency (seconds) across ingestion runs
+            health_info["latency"] = self._tracer.stats("ingestion.")
+            
             # Check ingestors
             for ingestor_id, components in self._ingestors.items():
                 ingestor = components["ingestor"]
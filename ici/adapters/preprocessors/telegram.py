@@ -8,7 +8,6 @@ handling message grouping, chunking, and metadata extraction.
 import os
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
-import uuid
 import asyncio
 import json
 import re
@@ -17,6 +16,7 @@ from ici.core.interfaces.preprocessor import Preprocessor
 from ici.core.exceptions import PreprocessorError
 from ici.adapters.loggers import StructuredLogger
 from ici.utils.config import get_component_config
+from ici.utils.document_id import generate_document_id
 
 
 class TelegramPreprocessor(Preprocessor):
@@ -178,12 +178,12 @@ class TelegramPreprocessor(Preprocessor):
                     # Extract metadata
                     metadata = self._create_metadata(chunk)
                     
-                    # Create standardized document with UUID-based ID
+                    # Create standardized document with a deterministic ID
                     document = {
-                        "id": str(uuid.uuid4()),
                         "text": conversation_text,
                         "metadata": metadata
                     }
+                    document["id"] = generate_document_id(document)
                     
                     documents.append(document)
             
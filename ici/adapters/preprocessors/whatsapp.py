@@ -7,7 +7,7 @@ import re
 import json
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 
 from ici.core.interfaces.preprocessor import Preprocessor
 from ici.adapters.loggers import StructuredLogger
@@ -114,6 +114,41 @@ class WhatsAppPreprocessor(Preprocessor):
         Returns:
             List[Dict[str, Any]]: List of standardized documents with 'text' and 'metadata'
             
+        Raises:
+            PreprocessorError: If preprocessing fails
+        """
+        return await self._preprocess(raw_data, export_full_data=True)
+    
+    async def preprocess_stream(self, raw_chunks: AsyncIterator[Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Transform a stream of per-chat WhatsApp chunks into standardized documents.
+        
+        Each chunk only holds part of the data, so the complete chat_export.json
+        snapshot is not rewritten here; per-chat history files are still updated.
+        
+        Args:
+            raw_chunks: Async iterator of chunks from WhatsAppIngestor.fetch_*_stream()
+            
+        Yields:
+            List[Dict[str, Any]]: Standardized documents for each chunk
+            
+        Raises:
+            PreprocessorError: If preprocessing fails
+        """
+        async for raw_data in raw_chunks:
+            yield await self._preprocess(raw_data, export_full_data=False)
+    
+    async def _preprocess(self, raw_data: Any, export_full_data: bool) -> List[Dict[str, Any]]:
+        """
+        Transform raw WhatsApp data into standardized documents.
+        
+        Args:
+            raw_data: Dict with 'conversations' mapping chat_ids to message lists
+            export_full_data: Whether to save raw_data as the complete chat export
+            
+        Returns:
+            List[Dict[str, Any]]: List of standardized documents with 'text' and 'metadata'
+            
         Raises:
             PreprocessorError: If preprocessing fails
         """
@@ -130,8 +165,9 @@ class WhatsAppPreprocessor(Preprocessor):
                 return []
             
             # Save complete export
-            with open("db/whatsapp_chats/chat_export.json", "w", encoding="utf-8") as f:
-                json.dump(raw_data, f, indent=2, ensure_ascii=False)
+            if export_full_data:
+                with open("db/whatsapp_chats/chat_export.json", "w", encoding="utf-8") as f:
+                    json.dump(raw_data, f, indent=2, ensure_ascii=False)
             
             # Process each chat
             documents = []
@@ -6,8 +6,15 @@ for different vector database technologies.
 
 Available implementations:
 - ChromaDBStore: Vector store implementation using ChromaDB
+- NumpyVectorStore: In-process vector store on a memory-mapped NumPy matrix
+- LexicalIndex: Persistent BM25 index used by the stores for lexical_search()
+- SearchResultCache: Generation-versioned cache of search results
 """
 
+from ici.adapters.vector_stores.lexical_index import LexicalIndex
+from ici.adapters.vector_stores.result_cache import SearchResultCache
 from ici.adapters.vector_stores.chroma import ChromaDBStore
+from ici.adapters.vector_stores.numpy_store import NumpyVectorStore
+from ici.adapters.vector_stores.factory import create_vector_store
 
-__all__ = ["ChromaDBStore"] 
\ No newline at end of file
+__all__ = ["ChromaDBStore", "NumpyVectorStore", "LexicalIndex", "SearchResultCache", "create_vector_store"] 
@@ -6,17 +6,21 @@ using ChromaDB as the underlying vector database technology.
 """
 
 import os
-import uuid
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Union
 
+import numpy as np
 import chromadb
 from chromadb.api.models.Collection import Collection
 from chromadb.config import Settings
 
 from ici.adapters.loggers import StructuredLogger
 from ici.core.interfaces.vector_store import VectorStore
+from ici.adapters.vector_stores.lexical_index import LexicalIndex
+from ici.adapters.vector_stores.result_cache import SearchResultCache
 from ici.core.exceptions import VectorStoreError, ConfigurationError
 from ici.utils.config import get_component_config
+from ici.utils.document_id import generate_document_id
 
 
 class ChromaDBStore(VectorStore):
@@ -28,6 +32,20 @@ class ChromaDBStore(VectorStore):
     on pre-computed embeddings.
     """
     
+    # Number of IDs fetched per page when counting or deleting by filter
+    _ID_PAGE_SIZE = 10000
+    
+    # HNSW settings accepted under vector_stores.chroma.hnsw; only the
+    # mutable ones can change on an existing collection, the rest need rebuild()
+    _HNSW_SETTINGS = (
+        "space", "ef_construction", "max_neighbors", "ef_search",
+        "num_threads", "batch_size", "sync_threshold", "resize_factor",
+    )
+    _HNSW_MUTABLE_SETTINGS = ("ef_search", "num_threads", "batch_size", "sync_threshold", "resize_factor")
+    _HNSW_SPACES = ("l2", "cosine", "ip")
+    # Suffix of the temporary collection rebuild() copies documents into
+    _REBUILD_SUFFIX = "__rebuild"
+    
     def __init__(self, logger_name: str = "vector_store.chroma"):
         """
         Initialize the ChromaDB vector store.
@@ -38,6 +56,10 @@ class ChromaDBStore(VectorStore):
         self.logger = StructuredLogger(name=logger_name)
         self._client = None
         self._collection = None
+        self._collection_name: Optional[str] = None
+        self._hnsw_config: Dict[str, Any] = {}
+        self._lexical_index: Optional[LexicalIndex] = None
+        self._result_cache: Optional[SearchResultCache] = None
         self._is_initialized = False
         self._config_path = os.environ.get("ICI_CONFIG_PATH", "config.yaml")
     
@@ -75,6 +97,7 @@ class ChromaDBStore(VectorStore):
             # Extract parameters with defaults
             collection_name = vector_store_config.get("collection_name", "default_collection")
             persist_directory = vector_store_config.get("persist_directory")
+            hnsw_config = self._parse_hnsw_config(vector_store_config.get("hnsw", {}))
 
             self.logger.info({
                 "action": "VECTOR_STORE_CONFIG_VALIDATED",
@@ -100,9 +123,26 @@ class ChromaDBStore(VectorStore):
                 })
             
             # Create or get collection (without embedding function)
+            self._collection_name = collection_name
+            self._recover_interrupted_rebuild()
             self._collection = self._client.get_or_create_collection(
-                name=collection_name
+                name=collection_name,
+                configuration={"hnsw": hnsw_config} if hnsw_config else None
             )
+            self._apply_hnsw_config(hnsw_config)
+            
+            # Optional BM25 index for lexical_search()
+            lexical_config = vector_store_config.get("lexical_index", {})
+            if lexical_config.get("enabled", False):
+                self._init_lexical_index(lexical_config, persist_directory)
+            
+            # Optional cache of search results, invalidated by every write
+            result_cache_config = vector_store_config.get("result_cache", {})
+            if result_cache_config.get("enabled", False):
+                self._result_cache = SearchResultCache(
+                    max_size=result_cache_config.get("max_size", 1024),
+                    ttl_seconds=result_cache_config.get("ttl_seconds", 600)
+                )
             
             self._is_initialized = True
             
@@ -111,7 +151,10 @@ class ChromaDBStore(VectorStore):
                 "message": f"ChromaDB vector store initialized with collection '{collection_name}'",
                 "data": {
                     "collection": collection_name,
-                    "persistent": persist_directory is not None
+                    "persistent": persist_directory is not None,
+                    "lexical_index": self._lexical_index is not None,
+                    "result_cache": self._result_cache is not None,
+                    "hnsw": self._hnsw_config
                 }
             })
             
@@ -131,17 +174,24 @@ class ChromaDBStore(VectorStore):
             raise VectorStoreError(f"Vector store initialization failed: {str(e)}") from e
     
     def add_documents(
-        self, documents: List[Dict[str, Any]], vectors: List[List[float]]
+        self, documents: List[Dict[str, Any]], vectors: Union[List[List[float]], np.ndarray]
     ) -> List[str]:
         """
         Store documents with their vector embeddings.
         
+        Documents are upserted under deterministic IDs (the document's 'id' if
+        present, otherwise one derived from its source, chat and message IDs),
+        so storing the same documents again replaces them instead of adding
+        duplicates.
+        
         Args:
-            documents: List of documents, each containing 'text' and optional 'metadata'
-            vectors: List of vector embeddings for the documents
+            documents: List of documents, each containing 'text', optional 'metadata'
+                       and optional 'id'
+            vectors: (len(documents), dimensions) float32 array of embeddings, or a
+                     list of float lists (converted to an array)
             
         Returns:
-            List[str]: List of document IDs
+            List[str]: List of document IDs, in the same order as documents
             
         Raises:
             VectorStoreError: If document storage fails
@@ -155,31 +205,45 @@ class ChromaDBStore(VectorStore):
             )
         
         try:
-            # Extract document texts and metadata
-            texts = []
-            metadatas = []
+            # Use deterministic IDs so re-ingestion is idempotent
+            ids = [doc.get("id") or generate_document_id(doc) for doc in documents]
+            
+            # Chroma rejects duplicate IDs within one call; the last occurrence wins
+            unique_positions = {doc_id: position for position, doc_id in enumerate(ids)}
+            positions = sorted(unique_positions.values())
             
-            for doc in documents:
-                texts.append(doc.get("text", ""))
-                metadatas.append(doc.get("metadata", {}))
+            unique_ids = [ids[position] for position in positions]
+            texts = [documents[position].get("text", "") for position in positions]
+            metadatas = [documents[position].get("metadata", {}) for position in positions]
             
-            # Generate IDs if not already present
-            ids = [str(uuid.uuid4()) for _ in range(len(documents))]
+            # Hand Chroma one contiguous float32 array (no copy if it already is one)
+            embeddings = np.ascontiguousarray(vectors, dtype=np.float32)
+            if len(positions) != len(ids):
+                embeddings = embeddings[positions]
 
             self.logger.info({
                 "action": "VECTOR_STORE_ADD",
                 "message": f"Adding {len(documents)} documents to vector store",
-                "data": {"ids": ids, "documents": texts, "vectors": vectors, "this_is_metadata": metadatas}
+                "data": {
+                    "ids": unique_ids,
+                    "documents": texts,
+                    "dimensions": embeddings.shape[1] if embeddings.ndim == 2 else None,
+                    "this_is_metadata": metadatas
+                }
             })
             
-            # Add to collection
-            self._collection.add(
-                embeddings=vectors,
+            # Upsert into collection
+            self._collection.upsert(
+                embeddings=embeddings,
                 documents=texts,
                 metadatas=metadatas,
-                ids=ids
+                ids=unique_ids
             )
             
+            if self._lexical_index is not None:
+                self._lexical_index.add_many(unique_ids, texts)
+            self._invalidate_results()
+            
             # self.logger.info({
             #     "action": "VECTOR_STORE_ADD",
             #     "message": f"Added {len(documents)} documents to vector store",
@@ -220,6 +284,11 @@ class ChromaDBStore(VectorStore):
             raise VectorStoreError("Vector store not initialized. Call initialize() first.")
         
         try:
+            cache_key = self._cache_key("vector", query_vector, num_results, filters)
+            cached_results = self._cached_results(cache_key)
+            if cached_results is not None:
+                return cached_results
+            
             # Query the collection using the query vector
             results = self._collection.query(
                 query_embeddings=[query_vector],
@@ -228,15 +297,8 @@ class ChromaDBStore(VectorStore):
             )
             
             # Format the results according to the interface
-            formatted_results = []
-            
-            if results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    formatted_results.append({
-                        "text": doc,
-                        "metadata": results["metadatas"][0][i] if results["metadatas"][0] else {},
-                        "score": results["distances"][0][i] if "distances" in results and results["distances"][0] else None
-                    })
+            formatted_results = self._format_query_results(results, 0)
+            self._cache_results(cache_key, formatted_results)
             
             self.logger.info({
                 "action": "VECTOR_STORE_SEARCH",
@@ -254,6 +316,422 @@ class ChromaDBStore(VectorStore):
             })
             raise VectorStoreError(f"Search operation failed: {str(e)}") from e
     
+    def search_batch(
+        self,
+        query_vectors: Union[List[List[float]], np.ndarray],
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve the most similar documents for several query vectors in one query.
+        
+        Args:
+            query_vectors: Vector embeddings of the queries, as a
+                           (num_queries, dimensions) array or a list of float lists
+            num_results: Maximum number of results to return per query
+            filters: Optional metadata filters applied to every query
+            
+        Returns:
+            One list of documents with similarity scores per query vector
+            
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+        
+        if len(query_vectors) == 0:
+            return []
+        
+        try:
+            query_array = np.ascontiguousarray(query_vectors, dtype=np.float32)
+            cache_keys = [
+                self._cache_key("vector", query_vector, num_results, filters)
+                for query_vector in query_array
+            ]
+            batch_results = [self._cached_results(cache_key) for cache_key in cache_keys]
+            missing = [index for index, results in enumerate(batch_results) if results is None]
+            
+            if missing:
+                # Chroma answers every uncached query embedding in a single request
+                results = self._collection.query(
+                    query_embeddings=query_array[missing],
+                    n_results=num_results,
+                    where=filters
+                )
+                for position, index in enumerate(missing):
+                    batch_results[index] = self._format_query_results(results, position)
+                    self._cache_results(cache_keys[index], batch_results[index])
+            
+            self.logger.info({
+                "action": "VECTOR_STORE_SEARCH_BATCH",
+                "message": f"Batch search returned results for {len(batch_results)} queries",
+                "data": {
+                    "num_queries": len(batch_results),
+                    "queried": len(missing),
+                    "query_results": sum(len(results) for results in batch_results),
+                    "num_requested": num_results
+                }
+            })
+            
+            return batch_results
+            
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_SEARCH_BATCH_ERROR",
+                "message": f"Batch search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Batch search operation failed: {str(e)}") from e
+    
+    def _format_query_results(self, results: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+        """
+        Format one query's results from a Chroma query response.
+        
+        Args:
+            results: Response of Collection.query()
+            index: Position of the query in the request
+            
+        Returns:
+            List of documents with ID, text, metadata and score
+        """
+        documents = results["documents"][index] if results["documents"] else None
+        if not documents:
+            return []
+        
+        ids = results["ids"][index]
+        metadatas = results["metadatas"][index] if results.get("metadatas") else None
+        distances = results["distances"][index] if results.get("distances") else None
+        
+        return [
+            {
+                "id": ids[i],
+                "text": doc,
+                "metadata": metadatas[i] if metadatas else {},
+                "score": distances[i] if distances else None
+            }
+            for i, doc in enumerate(documents)
+        ]
+    
+    def lexical_search(
+        self,
+        query: str,
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve documents by BM25 keyword relevance to the query text.
+        
+        With filters, a larger page of BM25 candidates is fetched and
+        narrowed down with Chroma's metadata filtering.
+        
+        Args:
+            query: The query text
+            num_results: Maximum number of results to return
+            filters: Optional metadata filters
+            
+        Returns:
+            List of documents with BM25 scores, best match first (empty
+            when the lexical index is disabled)
+            
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+        
+        if self._lexical_index is None:
+            return []
+        
+        try:
+            cache_key = self._cache_key("lexical", query, num_results, filters)
+            cached_results = self._cached_results(cache_key)
+            if cached_results is not None:
+                return cached_results
+            
+            candidate_count = num_results if not filters else max(num_results * 10, 100)
+            hits = self._lexical_index.search(query, candidate_count)
+            if not hits:
+                return []
+            
+            # Fetch text and metadata for the hits in one call
+            records = self._collection.get(
+                ids=[doc_id for doc_id, _ in hits],
+                where=filters,
+                include=["documents", "metadatas"]
+            )
+            found = {
+                doc_id: (text, metadata or {})
+                for doc_id, text, metadata in zip(records["ids"], records["documents"], records["metadatas"])
+            }
+            
+            formatted_results = [
+                {"id": doc_id, "text": found[doc_id][0], "metadata": found[doc_id][1], "score": score}
+                for doc_id, score in hits
+                if doc_id in found
+            ][:num_results]
+            self._cache_results(cache_key, formatted_results)
+            
+            self.logger.info({
+                "action": "VECTOR_STORE_LEXICAL_SEARCH",
+                "message": f"Lexical search returned {len(formatted_results)} results",
+                "data": {"query_results": len(formatted_results), "num_requested": num_results}
+            })
+            
+            return formatted_results
+            
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_LEXICAL_SEARCH_ERROR",
+                "message": f"Lexical search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Lexical search operation failed: {str(e)}") from e
+    
+    def _cache_key(
+        self, kind: str, query: Any, num_results: int, filters: Optional[Dict[str, Any]]
+    ) -> Optional[tuple]:
+        """Build a result cache key, or None when the cache is disabled."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.key(kind, query, num_results, filters)
+    
+    def _cached_results(self, cache_key: Optional[tuple]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for the key, or None on a miss."""
+        if cache_key is None:
+            return None
+        results = self._result_cache.get(cache_key)
+        if results is not None:
+            self.logger.debug({
+                "action": "VECTOR_STORE_RESULT_CACHE_HIT",
+                "message": "Using cached search results",
+                "data": {"kind": cache_key[1], "num_requested": cache_key[3]}
+            })
+        return results
+    
+    def _cache_results(self, cache_key: Optional[tuple], results: List[Dict[str, Any]]) -> None:
+        """Cache the results of a search started with cache_key."""
+        if cache_key is not None:
+            self._result_cache.set(cache_key, results)
+    
+    def _invalidate_results(self) -> None:
+        """Start a new result cache generation after a write."""
+        if self._result_cache is not None:
+            self._result_cache.invalidate()
+    
+    def _init_lexical_index(self, lexical_config: Dict[str, Any], persist_directory: Optional[str]) -> None:
+        """
+        Open the BM25 index and index documents stored before it existed.
+        
+        Args:
+            lexical_config: The lexical_index config section
+            persist_directory: Chroma's persist directory, used for the default path
+        """
+        default_path = (
+            os.path.join(os.path.dirname(os.path.abspath(persist_directory)), "lexical_index.db")
+            if persist_directory else None
+        )
+        db_path = lexical_config.get("path", default_path)
+        if not db_path:
+            self.logger.warning({
+                "action": "VECTOR_STORE_LEXICAL_INDEX_DISABLED",
+                "message": "Lexical index needs a path when ChromaDB is not persistent",
+                "data": {}
+            })
+            return
+        
+        self._lexical_index = LexicalIndex(db_path=db_path, logger_name=f"{self.logger.name}.lexical")
+        self._lexical_index.initialize()
+        
+        # Backfill collections that were filled before the index was enabled
+        if self._lexical_index.count() == 0:
+            offset = 0
+            while True:
+                page = self._collection.get(include=["documents"], limit=self._ID_PAGE_SIZE, offset=offset)
+                self._lexical_index.add_many(page["ids"], page["documents"])
+                if len(page["ids"]) < self._ID_PAGE_SIZE:
+                    break
+                offset += self._ID_PAGE_SIZE
+    
+    def _parse_hnsw_config(self, hnsw_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the hnsw config section.
+        
+        Args:
+            hnsw_config: The vector_stores.chroma.hnsw section; 'M' is accepted
+                         as an alias for max_neighbors
+            
+        Returns:
+            Dict[str, Any]: Chroma HNSW configuration with the configured settings
+            
+        Raises:
+            ConfigurationError: If a setting is unknown or invalid
+        """
+        settings = dict(hnsw_config or {})
+        if "M" in settings:
+            settings.setdefault("max_neighbors", settings.pop("M"))
+        
+        unknown = set(settings) - set(self._HNSW_SETTINGS)
+        if unknown:
+            raise ConfigurationError(f"Unknown HNSW settings: {', '.join(sorted(unknown))}")
+        
+        parsed = {}
+        for key, value in settings.items():
+            if value is None:
+                continue
+            if key == "space":
+                value = str(value).lower()
+                if value not in self._HNSW_SPACES:
+                    raise ConfigurationError(
+                        f"Unknown HNSW space '{value}', expected one of {', '.join(self._HNSW_SPACES)}"
+                    )
+            elif key == "resize_factor":
+                value = float(value)
+            else:
+                value = int(value)
+                if value <= 0:
+                    raise ConfigurationError(f"HNSW setting '{key}' must be positive")
+            parsed[key] = value
+        return parsed
+    
+    def _current_hnsw_config(self) -> Dict[str, Any]:
+        """Read the HNSW settings the collection was built with."""
+        configuration = self._collection.configuration or {}
+        hnsw = configuration.get("hnsw") or {}
+        return {key: value for key, value in hnsw.items() if key in self._HNSW_SETTINGS and value is not None}
+    
+    def _apply_hnsw_config(self, hnsw_config: Dict[str, Any]) -> None:
+        """
+        Bring an existing collection in line with the configured HNSW settings.
+        
+        Chroma ignores the configuration of get_or_create_collection() for
+        collections that already exist, so search-time settings are applied
+        with modify() and build-time differences are reported.
+        
+        Args:
+            hnsw_config: Settings returned by _parse_hnsw_config()
+        """
+        current = self._current_hnsw_config()
+        changed = {
+            key: value for key, value in hnsw_config.items()
+            if key in self._HNSW_MUTABLE_SETTINGS and current.get(key) != value
+        }
+        if changed:
+            self._collection.modify(configuration={"hnsw": changed})
+            current.update(changed)
+        
+        stale = {
+            key: {"configured": value, "collection": current.get(key)}
+            for key, value in hnsw_config.items()
+            if key not in self._HNSW_MUTABLE_SETTINGS and current.get(key) != value
+        }
+        if stale:
+            self.logger.warning({
+                "action": "VECTOR_STORE_HNSW_REBUILD_NEEDED",
+                "message": "Collection was built with different HNSW settings; run the rebuild command to apply them",
+                "data": {"collection": self._collection_name, "settings": stale}
+            })
+        
+        self._hnsw_config = current
+    
+    def _recover_interrupted_rebuild(self) -> None:
+        """Restore a collection whose rebuild stopped after the original was dropped."""
+        rebuild_name = f"{self._collection_name}{self._REBUILD_SUFFIX}"
+        names = {collection.name for collection in self._client.list_collections()}
+        if rebuild_name in names and self._collection_name not in names:
+            self._client.get_collection(rebuild_name).modify(name=self._collection_name)
+            self.logger.warning({
+                "action": "VECTOR_STORE_REBUILD_RECOVERED",
+                "message": "Recovered collection from an interrupted rebuild",
+                "data": {"collection": self._collection_name}
+            })
+    
+    def rebuild(self, hnsw_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Rebuild the collection's HNSW index with new settings.
+        
+        Copies every document's stored vector, text and metadata into a new
+        collection created with the merged settings, then swaps it in under
+        the original name. Nothing is re-embedded, and deleted entries left
+        in the old index are dropped, which also compacts it. IDs are kept,
+        so the lexical index stays valid. Run it while nothing else writes
+        to the collection.
+        
+        Args:
+            hnsw_config: HNSW settings to change; unspecified settings keep
+                         their current values
+            
+        Returns:
+            Dict[str, Any]: The number of documents copied, the new HNSW
+                settings and the elapsed seconds
+            
+        Raises:
+            VectorStoreError: If the rebuild fails; the original collection
+                is left in place
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized")
+        
+        start_time = time.time()
+        settings = {**self._current_hnsw_config(), **self._parse_hnsw_config(hnsw_config or {})}
+        rebuild_name = f"{self._collection_name}{self._REBUILD_SUFFIX}"
+        
+        try:
+            # Discard leftovers of an earlier rebuild that did not finish
+            if rebuild_name in {collection.name for collection in self._client.list_collections()}:
+                self._client.delete_collection(rebuild_name)
+            target = self._client.create_collection(name=rebuild_name, configuration={"hnsw": settings})
+            
+            page_size = min(self._ID_PAGE_SIZE, self._client.get_max_batch_size())
+            copied = 0
+            while True:
+                page = self._collection.get(
+                    include=["embeddings", "documents", "metadatas"], limit=page_size, offset=copied
+                )
+                if not page["ids"]:
+                    break
+                target.add(
+                    ids=page["ids"],
+                    embeddings=page["embeddings"],
+                    documents=page["documents"],
+                    metadatas=page["metadatas"]
+                )
+                copied += len(page["ids"])
+                if len(page["ids"]) < page_size:
+                    break
+            
+            if target.count() != self._collection.count():
+                self._client.delete_collection(rebuild_name)
+                raise VectorStoreError("Rebuilt collection does not contain every document")
+            
+            self._client.delete_collection(self._collection_name)
+            target.modify(name=self._collection_name)
+            self._collection = self._client.get_collection(self._collection_name)
+            self._hnsw_config = self._current_hnsw_config()
+            self._invalidate_results()
+            
+            result = {
+                "documents": copied,
+                "hnsw": self._hnsw_config,
+                "seconds": time.time() - start_time
+            }
+            self.logger.info({
+                "action": "VECTOR_STORE_REBUILD",
+                "message": f"Rebuilt collection '{self._collection_name}' with {copied} documents",
+                "data": result
+            })
+            return result
+            
+        except VectorStoreError:
+            raise
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_REBUILD_ERROR",
+                "message": f"Failed to rebuild collection: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Rebuild failed: {str(e)}") from e
+    
     def delete(
         self,
         document_ids: Optional[List[str]] = None,
@@ -279,20 +757,22 @@ class ChromaDBStore(VectorStore):
             raise VectorStoreError("Either document_ids or filters must be provided")
         
         try:
-            # Record the initial count to determine how many were deleted
-            initial_count = self.count()
-            
-            # Delete by ID if provided
+            # Resolve the IDs that actually exist (IDs only, no documents or embeddings)
             if document_ids:
-                self._collection.delete(ids=document_ids)
-                
-            # Delete by filter if provided
-            elif filters:
-                self._collection.delete(where=filters)
+                matching_ids = self._collection.get(ids=document_ids, include=[])["ids"]
+            else:
+                matching_ids = self._get_ids(filters)
+            
+            # Delete exactly those IDs, in pages to stay within Chroma's batch limits
+            for start in range(0, len(matching_ids), self._ID_PAGE_SIZE):
+                self._collection.delete(ids=matching_ids[start:start + self._ID_PAGE_SIZE])
             
-            # Calculate number of deleted documents
-            final_count = self.count()
-            deleted_count = initial_count - final_count
+            if self._lexical_index is not None:
+                self._lexical_index.delete_many(matching_ids)
+            if matching_ids:
+                self._invalidate_results()
+            
+            deleted_count = len(matching_ids)
             
             self.logger.info({
                 "action": "VECTOR_STORE_DELETE",
@@ -332,13 +812,11 @@ class ChromaDBStore(VectorStore):
         
         try:
             if filters:
-                # For filtered count, we need to get all IDs that match the filter
-                result = self._collection.get(where=filters)
-                count = len(result["ids"]) if result["ids"] else 0
+                # Filtered count pages through matching IDs only
+                count = len(self._get_ids(filters))
             else:
-                # Get all document IDs (unfiltered count)
-                result = self._collection.get()
-                count = len(result["ids"]) if result["ids"] else 0
+                # Unfiltered count is answered natively without reading records
+                count = self._collection.count()
             
             self.logger.debug({
                 "action": "VECTOR_STORE_COUNT",
@@ -356,6 +834,32 @@ class ChromaDBStore(VectorStore):
             })
             raise VectorStoreError(f"Count operation failed: {str(e)}") from e
     
+    def _get_ids(self, filters: Dict[str, Any]) -> List[str]:
+        """
+        Get the IDs of all documents matching a metadata filter.
+        
+        Fetches IDs only (no documents, metadata or embeddings), one page at a time.
+        
+        Args:
+            filters: Metadata filters
+            
+        Returns:
+            List[str]: Matching document IDs
+        """
+        ids: List[str] = []
+        offset = 0
+        while True:
+            page = self._collection.get(
+                where=filters,
+                include=[],
+                limit=self._ID_PAGE_SIZE,
+                offset=offset
+            )["ids"]
+            ids.extend(page)
+            if len(page) < self._ID_PAGE_SIZE:
+                return ids
+            offset += self._ID_PAGE_SIZE
+    
     def healthcheck(self) -> Dict[str, Any]:
         """
         Check if the vector store is properly configured and functioning.
@@ -402,8 +906,13 @@ class ChromaDBStore(VectorStore):
             health_result["details"] = {
                 "collection": collection_name,
                 "document_count": count,
-                "persistent": is_persistent
+                "persistent": is_persistent,
+                "hnsw": self._hnsw_config
             }
+            if self._lexical_index is not None:
+                health_result["details"]["lexical_index"] = self._lexical_index.stats()
+            if self._result_cache is not None:
+                health_result["details"]["result_cache"] = self._result_cache.stats()
             
             self.logger.info({
                 "action": "VECTOR_STORE_HEALTH_CHECK",
@@ -426,6 +935,16 @@ class ChromaDBStore(VectorStore):
         
         return health_result
     
+    def close(self) -> None:
+        """
+        Close the lexical index connection.
+        
+        Returns:
+            None
+        """
+        if self._lexical_index is not None:
+            self._lexical_index.close()
+    
     # This method is intentionally not implemented as it's being deprecated
     def store_documents(self, documents: List[Dict[str, Any]]) -> None:
         """
@@ -0,0 +1,83 @@
+"""
+Offline maintenance command for the ChromaDB collection.
+
+Shows the collection's HNSW settings or rebuilds its index with new ones,
+copying the stored vectors so nothing is re-embedded. Stop the application
+before rebuilding; the command opens the collection configured under
+vector_stores.chroma in config.yaml.
+
+Usage:
+    python -m ici.adapters.vector_stores.chroma_maintenance show
+    python -m ici.adapters.vector_stores.chroma_maintenance rebuild [--space cosine]
+        [--ef-construction N] [--ef-search N] [--max-neighbors N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import List, Optional
+
+from ici.adapters.vector_stores.chroma import ChromaDBStore
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Inspect or rebuild the ChromaDB collection's HNSW index")
+    parser.add_argument("--config", default=os.environ.get("ICI_CONFIG_PATH", "config.yaml"),
+                        help="Path to config.yaml")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("show", help="Print the document count and HNSW settings")
+
+    rebuild = commands.add_parser(
+        "rebuild", help="Copy the collection into a new HNSW index (also compacts deleted entries)"
+    )
+    rebuild.add_argument("--space", choices=ChromaDBStore._HNSW_SPACES, help="Distance function")
+    rebuild.add_argument("--ef-construction", type=int, help="Candidate list size while building")
+    rebuild.add_argument("--ef-search", type=int, help="Candidate list size while searching")
+    rebuild.add_argument("--max-neighbors", type=int, help="Graph degree (M)")
+    rebuild.add_argument("--from-config", action="store_true",
+                         help="Use the hnsw settings in config.yaml for unspecified options")
+    return parser
+
+
+async def run(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    store = ChromaDBStore(logger_name="vector_store.chroma.maintenance")
+    store._config_path = args.config
+    await store.initialize()
+
+    try:
+        if args.command == "show":
+            print(json.dumps({
+                "collection": store._collection_name,
+                "documents": store.count(),
+                "hnsw": store._hnsw_config
+            }, indent=2))
+            return 0
+
+        settings = {}
+        if args.from_config:
+            from ici.utils.config import get_component_config
+            settings.update(get_component_config("vector_stores.chroma", args.config).get("hnsw", {}))
+        overrides = {
+            "space": args.space,
+            "ef_construction": args.ef_construction,
+            "ef_search": args.ef_search,
+            "max_neighbors": args.max_neighbors,
+        }
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+
+        result = store.rebuild(settings)
+        print(f"Rebuilt '{store._collection_name}': {result['documents']} documents "
+              f"in {result['seconds']:.1f}s")
+        print(json.dumps(result["hnsw"], indent=2))
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,52 @@
+"""
+Factory for creating VectorStore implementations.
+
+This module provides a factory function to create the vector store backend
+selected in the configuration.
+"""
+
+import os
+from typing import Dict, Optional, Type
+
+from ici.core.interfaces.vector_store import VectorStore
+from ici.core.exceptions import ConfigurationError
+from ici.adapters.vector_stores.chroma import ChromaDBStore
+from ici.adapters.vector_stores.numpy_store import NumpyVectorStore
+from ici.utils.config import get_component_config
+
+
+# Backend name (the vector_stores.<name> config section) -> implementation
+VECTOR_STORES: Dict[str, Type[VectorStore]] = {
+    "chroma": ChromaDBStore,
+    "numpy": NumpyVectorStore,
+}
+
+
+def create_vector_store(logger_name: str = "vector_store", config_path: Optional[str] = None) -> VectorStore:
+    """
+    Creates the configured VectorStore implementation.
+    
+    The backend is chosen by vector_stores.backend (default 'chroma') and
+    reads its settings from the vector_stores.<backend> section. The returned
+    store is not initialized; call initialize() on it.
+    
+    Args:
+        logger_name: Name to use for the logger
+        config_path: Path to the config file (defaults to ICI_CONFIG_PATH or config.yaml)
+        
+    Returns:
+        VectorStore: The configured vector store
+        
+    Raises:
+        ConfigurationError: If the configured backend is unknown
+    """
+    config_path = config_path or os.environ.get("ICI_CONFIG_PATH", "config.yaml")
+    vector_stores_config = get_component_config("vector_stores", config_path)
+    
+    backend = str(vector_stores_config.get("backend", "chroma")).lower()
+    if backend not in VECTOR_STORES:
+        raise ConfigurationError(
+            f"Unknown vector store backend '{backend}'. Available: {', '.join(VECTOR_STORES)}"
+        )
+    
+    return VECTOR_STORES[backend](logger_name=f"{logger_name}.{backend}")
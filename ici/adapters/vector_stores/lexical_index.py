@@ -0,0 +1,265 @@
+"""
+Persistent BM25 lexical index for VectorStore implementations.
+
+This module provides a LexicalIndex class that keeps an inverted index of
+document texts in a SQLite FTS5 table next to the vector store, so exact
+terms that embeddings match poorly (names, handles, URLs, numbers) can be
+retrieved by BM25 keyword ranking. The index is updated incrementally as
+documents are added and deleted.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ici.adapters.loggers.structured_logger import StructuredLogger
+
+
+class LexicalIndex:
+    """
+    SQLite FTS5-backed BM25 index keyed by document ID.
+
+    Each document ID maps to one FTS row, so upserts replace the previous
+    text and deletes remove it; neither rebuilds the index. Queries are
+    split into terms that are OR-ed together and ranked with FTS5's bm25().
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    _QUERY_CHUNK_SIZE = 500
+    # Query terms: runs of letters/digits, matching the unicode61 tokenizer
+    _TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, db_path: str, logger_name: str = "lexical_index"):
+        """
+        Initialize the LexicalIndex.
+
+        Args:
+            db_path: Path to the SQLite database file
+            logger_name: Name for the logger
+        """
+        self.db_path = db_path
+        self.logger = StructuredLogger(name=logger_name)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        # Every thread's connection, so close() can reach all of them
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._initialized = False
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get a thread-local database connection.
+
+        Returns:
+            sqlite3.Connection: A SQLite connection object for the current thread
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Each connection is only used by its own thread; check_same_thread is
+            # off so that close() can close it from whichever thread calls it
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def initialize(self) -> None:
+        """
+        Create the index database and tables if they don't exist.
+
+        Returns:
+            None
+
+        Raises:
+            Exception: If database initialization fails (e.g. SQLite built without FTS5)
+        """
+        try:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+
+            connection = self._get_connection()
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Document IDs get stable integer rowids shared with the FTS table
+            connection.execute('''
+            CREATE TABLE IF NOT EXISTS lexical_documents (
+                rowid INTEGER PRIMARY KEY,
+                doc_id TEXT NOT NULL UNIQUE
+            )
+            ''')
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS lexical_fts "
+                "USING fts5(text, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            connection.commit()
+            self._initialized = True
+
+            self.logger.info({
+                "action": "LEXICAL_INDEX_INIT",
+                "message": "Lexical index initialized",
+                "data": {"db_path": self.db_path, "documents": self.count()}
+            })
+
+        except Exception as e:
+            self.logger.error({
+                "action": "LEXICAL_INDEX_INIT_ERROR",
+                "message": f"Failed to initialize lexical index: {str(e)}",
+                "data": {"db_path": self.db_path, "error": str(e)}
+            })
+            raise
+
+    def add_many(self, doc_ids: Sequence[str], texts: Sequence[str]) -> None:
+        """
+        Index documents, replacing the text of IDs that are already indexed.
+
+        Args:
+            doc_ids: Document IDs
+            texts: Text of each document
+        """
+        if not self._initialized:
+            raise RuntimeError("LexicalIndex not initialized. Call initialize() first.")
+
+        if not doc_ids:
+            return
+
+        # Later occurrences of an ID win, as in the vector stores
+        documents = dict(zip(doc_ids, texts))
+
+        connection = self._get_connection()
+        with self._write_lock:
+            connection.executemany(
+                "INSERT OR IGNORE INTO lexical_documents (doc_id) VALUES (?)",
+                [(doc_id,) for doc_id in documents]
+            )
+            rowids = self._rowids(connection, list(documents))
+            connection.executemany(
+                "DELETE FROM lexical_fts WHERE rowid = ?",
+                [(rowid,) for rowid in rowids.values()]
+            )
+            connection.executemany(
+                "INSERT INTO lexical_fts (rowid, text) VALUES (?, ?)",
+                [(rowids[doc_id], text or "") for doc_id, text in documents.items()]
+            )
+            connection.commit()
+
+    def delete_many(self, doc_ids: Sequence[str]) -> int:
+        """
+        Remove documents from the index.
+
+        Args:
+            doc_ids: Document IDs to remove
+
+        Returns:
+            int: Number of indexed documents removed
+        """
+        if not self._initialized:
+            raise RuntimeError("LexicalIndex not initialized. Call initialize() first.")
+
+        if not doc_ids:
+            return 0
+
+        connection = self._get_connection()
+        with self._write_lock:
+            rowids = list(self._rowids(connection, list(dict.fromkeys(doc_ids))).values())
+            connection.executemany("DELETE FROM lexical_fts WHERE rowid = ?", [(rowid,) for rowid in rowids])
+            connection.executemany("DELETE FROM lexical_documents WHERE rowid = ?", [(rowid,) for rowid in rowids])
+            connection.commit()
+        return len(rowids)
+
+    def search(self, query: str, num_results: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the documents that best match the query terms.
+
+        Args:
+            query: Free-text query; punctuation is ignored
+            num_results: Maximum number of results
+
+        Returns:
+            List[Tuple[str, float]]: (document ID, BM25 score) pairs, best first;
+                higher scores are better
+        """
+        if not self._initialized:
+            raise RuntimeError("LexicalIndex not initialized. Call initialize() first.")
+
+        match = self.build_match_query(query)
+        if not match or num_results <= 0:
+            return []
+
+        rows = self._get_connection().execute(
+            "SELECT d.doc_id, bm25(lexical_fts) AS score "
+            "FROM lexical_fts JOIN lexical_documents d ON d.rowid = lexical_fts.rowid "
+            "WHERE lexical_fts MATCH ? ORDER BY score LIMIT ?",
+            (match, num_results)
+        ).fetchall()
+
+        # FTS5's bm25() is lower-is-better; flip it so higher is more relevant
+        return [(doc_id, -score) for doc_id, score in rows]
+
+    @classmethod
+    def build_match_query(cls, query: str) -> str:
+        """
+        Turn free text into an FTS5 MATCH expression.
+
+        Every term is quoted (so FTS5 operators and punctuation in chat text
+        cannot break the query) and the terms are OR-ed, letting BM25 rank
+        documents that match more and rarer terms first.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            str: MATCH expression, or an empty string if the query has no terms
+        """
+        terms = dict.fromkeys(term.lower() for term in cls._TERM_PATTERN.findall(query))
+        return " OR ".join(f'"{term}"' for term in terms)
+
+    def count(self) -> int:
+        """
+        Count the indexed documents.
+
+        Returns:
+            int: Number of indexed documents
+        """
+        return self._get_connection().execute("SELECT COUNT(*) FROM lexical_documents").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict[str, Any]: Database path and number of indexed documents
+        """
+        return {
+            "db_path": self.db_path,
+            "documents": self.count() if self._initialized else 0
+        }
+
+    def close(self) -> None:
+        """
+        Close the database connections of all threads.
+
+        Threads that use the object afterwards open new connections.
+
+        Returns:
+            None
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def _rowids(self, connection: sqlite3.Connection, doc_ids: List[str]) -> Dict[str, int]:
+        """Look up the rowids of indexed document IDs."""
+        rowids = {}
+        for i in range(0, len(doc_ids), self._QUERY_CHUNK_SIZE):
+            chunk = doc_ids[i:i + self._QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT doc_id, rowid FROM lexical_documents WHERE doc_id IN ({placeholders})",
+                chunk
+            ).fetchall()
+            rowids.update(rows)
+        return rowids
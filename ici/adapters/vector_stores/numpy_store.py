@@ -0,0 +1,1350 @@
+"""
+In-process NumPy implementation of the VectorStore interface.
+
+This module provides a lightweight VectorStore for small-to-medium personal
+corpora. Vectors are kept L2-normalized in a memory-mapped float32 matrix and
+searched by cosine similarity with a vectorized matrix product and
+argpartition top-k, optionally restricted to a few k-means partitions (IVF)
+for larger collections. Document text and metadata live in a columnar
+sidecar used for metadata filtering.
+
+On-disk layout (persist_directory):
+- vectors.npy: float32 matrix of shape (capacity, dimensions), memory-mapped;
+  compaction writes vectors.<generation>.npy and the snapshot names the
+  current file
+- metadata.json: columnar snapshot of IDs, texts and metadata columns
+- metadata.log.jsonl: upserts and deletes since the last snapshot, headed by
+  the snapshot generation it applies to; the store compacts itself once the
+  log reaches max_log_entries records
+- ivf.npz: IVF centroids and row assignments (IVF mode only)
+- lexical_index.db: BM25 index for lexical_search() (when enabled)
+"""
+
+import json
+import operator
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ici.adapters.loggers import StructuredLogger
+from ici.core.interfaces.vector_store import VectorStore
+from ici.adapters.vector_stores.lexical_index import LexicalIndex
+from ici.core.exceptions import VectorStoreError, ConfigurationError
+from ici.utils.config import get_component_config
+from ici.utils.document_id import generate_document_id
+
+
+# Metadata filter operators, accepted with or without a leading '$'
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    NumPy implementation of the VectorStore interface.
+
+    Keeps every vector in one contiguous float32 matrix (memory-mapped when
+    persistent, in memory otherwise). Search is exact ("flat") by default;
+    with index type "ivf" the collection is partitioned with spherical
+    k-means once it reaches min_train_size documents, and queries only scan
+    the nprobe closest partitions. Scores are cosine similarities (higher
+    is more similar).
+    """
+
+    VECTORS_FILE = "vectors.npy"
+    SNAPSHOT_FILE = "metadata.json"
+    LOG_FILE = "metadata.log.jsonl"
+    IVF_FILE = "ivf.npz"
+
+    _INITIAL_CAPACITY = 1024
+    _MAX_LOG_ENTRIES = 10000
+    # Rows scored per matrix product when assigning rows to IVF partitions
+    _ASSIGN_CHUNK_SIZE = 65536
+
+    def __init__(self, logger_name: str = "vector_store.numpy"):
+        """
+        Initialize the NumPy vector store.
+
+        Args:
+            logger_name: Name for the logger instance
+        """
+        self.logger = StructuredLogger(name=logger_name)
+        self._is_initialized = False
+        self._config_path = os.environ.get("ICI_CONFIG_PATH", "config.yaml")
+        self._persist_directory: Optional[str] = None
+
+        # Row storage: rows [0, _size) are in use, deleted rows are tombstoned
+        self._dimensions: Optional[int] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._ids: List[Optional[str]] = []
+        self._texts: List[Optional[str]] = []
+        self._columns: Dict[str, List[Any]] = {}
+        self._id_to_row: Dict[str, int] = {}
+        self._column_cache: Dict[str, np.ndarray] = {}
+        self._log_entries = 0
+        self._max_log_entries = self._MAX_LOG_ENTRIES
+        # Bumped by every snapshot; the change log only applies to its own generation
+        self._generation = 0
+        self._vectors_file = self.VECTORS_FILE
+
+        # Guards all row storage: writes swap several arrays that readers use together
+        self._lock = threading.RLock()
+
+        self._lexical_index: Optional[LexicalIndex] = None
+
+        # IVF index
+        self._index_type = "flat"
+        self._nlist = 256
+        self._nprobe = 8
+        self._min_train_size = 50000
+        self._train_iterations = 10
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        # Rows grouped by partition (order, offsets), rebuilt after writes
+        self._partition_index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    async def initialize(self) -> None:
+        """
+        Initialize the vector store with configuration parameters.
+
+        Loads configuration from config.yaml and, when a persist_directory is
+        configured, opens the existing matrix and sidecar files.
+
+        Returns:
+            None
+
+        Raises:
+            VectorStoreError: If initialization fails
+        """
+        try:
+            self.logger.info({
+                "action": "VECTOR_STORE_INIT_START",
+                "message": "Initializing NumPy vector store",
+                "data": {"config_path": self._config_path}
+            })
+
+            vector_store_config = get_component_config("vector_stores.numpy", self._config_path)
+
+            self._persist_directory = vector_store_config.get("persist_directory")
+            self._max_log_entries = max(1, int(vector_store_config.get("max_log_entries", self._max_log_entries)))
+
+            index_config = vector_store_config.get("index", {}) or {}
+            self._index_type = str(index_config.get("type", "flat")).lower()
+            if self._index_type not in ("flat", "ivf"):
+                raise ConfigurationError(
+                    f"Unknown index type '{self._index_type}', expected 'flat' or 'ivf'"
+                )
+            self._nlist = max(1, int(index_config.get("nlist", self._nlist)))
+            self._nprobe = max(1, int(index_config.get("nprobe", self._nprobe)))
+            self._min_train_size = max(1, int(index_config.get("min_train_size", self._min_train_size)))
+            self._train_iterations = max(1, int(index_config.get("train_iterations", self._train_iterations)))
+
+            with self._lock:
+                if self._persist_directory:
+                    os.makedirs(self._persist_directory, exist_ok=True)
+                    self._load()
+
+                # Optional BM25 index for lexical_search()
+                lexical_config = vector_store_config.get("lexical_index", {}) or {}
+                if lexical_config.get("enabled", False):
+                    self._init_lexical_index(lexical_config)
+
+            self._is_initialized = True
+
+            self.logger.info({
+                "action": "VECTOR_STORE_INIT_SUCCESS",
+                "message": "NumPy vector store initialized",
+                "data": {
+                    "persist_directory": self._persist_directory,
+                    "documents": len(self._id_to_row),
+                    "dimensions": self._dimensions,
+                    "index_type": self._index_type,
+                    "lexical_index": self._lexical_index is not None
+                }
+            })
+
+        except ConfigurationError as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_CONFIG_ERROR",
+                "message": f"Configuration error: {str(e)}",
+                "data": {"error": str(e)}
+            })
+            raise VectorStoreError(f"Vector store configuration error: {str(e)}") from e
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_INIT_ERROR",
+                "message": f"Failed to initialize NumPy vector store: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Vector store initialization failed: {str(e)}") from e
+
+    def add_documents(
+        self, documents: List[Dict[str, Any]], vectors: Union[List[List[float]], np.ndarray]
+    ) -> List[str]:
+        """
+        Store documents with their vector embeddings.
+
+        Documents are upserted under deterministic IDs (the document's 'id' if
+        present, otherwise one derived from its source, chat and message IDs),
+        so storing the same documents again replaces them in place.
+
+        Args:
+            documents: List of documents, each containing 'text', optional 'metadata'
+                       and optional 'id'
+            vectors: (len(documents), dimensions) float32 array of embeddings, or a
+                     list of float lists (converted to an array)
+
+        Returns:
+            List[str]: List of document IDs, in the same order as documents
+
+        Raises:
+            VectorStoreError: If document storage fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        if len(documents) != len(vectors):
+            raise VectorStoreError(
+                f"Number of documents ({len(documents)}) does not match number of vectors ({len(vectors)})"
+            )
+
+        if not documents:
+            return []
+
+        try:
+            with self._lock:
+                embeddings = self._normalize(np.asarray(vectors, dtype=np.float32))
+                if embeddings.ndim != 2:
+                    raise ValueError(f"Expected a 2-D vector matrix, got shape {embeddings.shape}")
+                if self._dimensions is None:
+                    self._dimensions = embeddings.shape[1]
+                elif embeddings.shape[1] != self._dimensions:
+                    raise ValueError(
+                        f"Vector dimensions ({embeddings.shape[1]}) do not match the store ({self._dimensions})"
+                    )
+
+                ids = [doc.get("id") or generate_document_id(doc) for doc in documents]
+
+                # Assign rows: existing IDs are overwritten in place, new IDs are appended
+                rows = np.empty(len(ids), dtype=np.int64)
+                new_rows = 0
+                for position, doc_id in enumerate(ids):
+                    row = self._id_to_row.get(doc_id)
+                    if row is None:
+                        row = self._size + new_rows
+                        self._id_to_row[doc_id] = row
+                        new_rows += 1
+                    rows[position] = row
+
+                self._ensure_capacity(self._size + new_rows)
+                self._vectors[rows] = embeddings
+
+                log_records = []
+                for position, (doc_id, row) in enumerate(zip(ids, rows)):
+                    document = documents[position]
+                    self._set_row(int(row), doc_id, document.get("text", ""), document.get("metadata") or {})
+                    log_records.append({
+                        "op": "upsert",
+                        "id": doc_id,
+                        "text": document.get("text", ""),
+                        "metadata": document.get("metadata") or {}
+                    })
+                self._size += new_rows
+
+                if self._centroids is not None:
+                    self._assignments[rows] = self._assign(embeddings)
+                    self._partition_index = None
+                self._maybe_train()
+
+                self._persist(log_records)
+
+                if self._lexical_index is not None:
+                    self._lexical_index.add_many(ids, [document.get("text", "") for document in documents])
+
+                self.logger.info({
+                    "action": "VECTOR_STORE_ADD",
+                    "message": f"Adding {len(documents)} documents to vector store",
+                    "data": {
+                        "ids": ids,
+                        "new_documents": new_rows,
+                        "dimensions": self._dimensions
+                    }
+                })
+
+                return ids
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_ADD_ERROR",
+                "message": f"Failed to add documents: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Document storage failed: {str(e)}") from e
+
+    def search(
+        self,
+        query_vector: List[float],
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the most similar documents based on the query vector.
+
+        Args:
+            query_vector: Vector embedding of the query
+            num_results: Maximum number of results to return
+            filters: Optional metadata filters
+
+        Returns:
+            List of documents with cosine similarity scores
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        try:
+            with self._lock:
+                formatted_results = self._search_many(
+                    np.asarray([query_vector], dtype=np.float32), num_results, filters
+                )[0]
+
+            self.logger.info({
+                "action": "VECTOR_STORE_SEARCH",
+                "message": f"Search returned {len(formatted_results)} results",
+                "data": {"query_results": len(formatted_results), "num_requested": num_results}
+            })
+
+            return formatted_results
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_SEARCH_ERROR",
+                "message": f"Search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Search operation failed: {str(e)}") from e
+
+    def search_batch(
+        self,
+        query_vectors: Union[List[List[float]], np.ndarray],
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve the most similar documents for several query vectors at once.
+
+        Args:
+            query_vectors: Vector embeddings of the queries, as a
+                           (num_queries, dimensions) array or a list of float lists
+            num_results: Maximum number of results to return per query
+            filters: Optional metadata filters applied to every query
+
+        Returns:
+            One list of documents with cosine similarity scores per query vector
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        if len(query_vectors) == 0:
+            return []
+
+        try:
+            with self._lock:
+                batch_results = self._search_many(
+                    np.asarray(query_vectors, dtype=np.float32), num_results, filters
+                )
+
+            self.logger.info({
+                "action": "VECTOR_STORE_SEARCH_BATCH",
+                "message": f"Batch search returned results for {len(batch_results)} queries",
+                "data": {
+                    "num_queries": len(batch_results),
+                    "query_results": sum(len(results) for results in batch_results),
+                    "num_requested": num_results
+                }
+            })
+
+            return batch_results
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_SEARCH_BATCH_ERROR",
+                "message": f"Batch search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Batch search operation failed: {str(e)}") from e
+
+    def lexical_search(
+        self,
+        query: str,
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve documents by BM25 keyword relevance to the query text.
+
+        With filters, a larger page of BM25 candidates is fetched and
+        narrowed down with the metadata columns.
+
+        Args:
+            query: The query text
+            num_results: Maximum number of results to return
+            filters: Optional metadata filters
+
+        Returns:
+            List of documents with BM25 scores, best match first (empty
+            when the lexical index is disabled)
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        if self._lexical_index is None:
+            return []
+
+        try:
+            with self._lock:
+                candidate_count = num_results if not filters else max(num_results * 10, 100)
+                hits = self._lexical_index.search(query, candidate_count)
+                mask = self._live_mask(filters)
+
+                formatted_results = []
+                for doc_id, score in hits:
+                    row = self._id_to_row.get(doc_id)
+                    if row is None or not mask[row]:
+                        continue
+                    formatted_results.append({
+                        "id": doc_id,
+                        "text": self._texts[row],
+                        "metadata": self._row_metadata(row),
+                        "score": score
+                    })
+                    if len(formatted_results) == num_results:
+                        break
+
+            self.logger.info({
+                "action": "VECTOR_STORE_LEXICAL_SEARCH",
+                "message": f"Lexical search returned {len(formatted_results)} results",
+                "data": {"query_results": len(formatted_results), "num_requested": num_results}
+            })
+
+            return formatted_results
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_LEXICAL_SEARCH_ERROR",
+                "message": f"Lexical search failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Lexical search operation failed: {str(e)}") from e
+
+    def delete(
+        self,
+        document_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Delete documents from the vector store by ID or filter.
+
+        Deleted rows are tombstoned and reclaimed by compact().
+
+        Args:
+            document_ids: List of document IDs to delete
+            filters: Metadata filters to select documents for deletion
+
+        Returns:
+            Number of documents deleted
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        if not document_ids and not filters:
+            raise VectorStoreError("Either document_ids or filters must be provided")
+
+        try:
+            with self._lock:
+                if document_ids:
+                    matching_ids = [doc_id for doc_id in dict.fromkeys(document_ids) if doc_id in self._id_to_row]
+                else:
+                    matching_ids = [self._ids[row] for row in np.flatnonzero(self._live_mask(filters))]
+
+                for doc_id in matching_ids:
+                    self._clear_row(self._id_to_row.pop(doc_id))
+
+                self._persist([{"op": "delete", "id": doc_id} for doc_id in matching_ids])
+
+                if self._lexical_index is not None:
+                    self._lexical_index.delete_many(matching_ids)
+
+                deleted_count = len(matching_ids)
+
+            self.logger.info({
+                "action": "VECTOR_STORE_DELETE",
+                "message": f"Deleted {deleted_count} documents from vector store",
+                "data": {
+                    "deleted_count": deleted_count,
+                    "by_ids": document_ids is not None,
+                    "by_filters": filters is not None
+                }
+            })
+
+            return deleted_count
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_DELETE_ERROR",
+                "message": f"Document deletion failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Delete operation failed: {str(e)}") from e
+
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count documents in the vector store, optionally filtered by metadata.
+
+        Args:
+            filters: Optional metadata filters
+
+        Returns:
+            Number of documents matching the filter
+
+        Raises:
+            VectorStoreError: If count operation fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        try:
+            with self._lock:
+                if filters:
+                    count = int(np.count_nonzero(self._live_mask(filters)))
+                else:
+                    count = len(self._id_to_row)
+
+            self.logger.debug({
+                "action": "VECTOR_STORE_COUNT",
+                "message": f"Counted {count} documents in vector store",
+                "data": {"count": count, "with_filters": filters is not None}
+            })
+
+            return count
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_COUNT_ERROR",
+                "message": f"Count operation failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Count operation failed: {str(e)}") from e
+
+    def healthcheck(self) -> Dict[str, Any]:
+        """
+        Check if the vector store is properly configured and functioning.
+
+        Returns:
+            Dictionary with health status information
+        """
+        health_result = {
+            "healthy": False,
+            "message": "Vector store health check failed",
+            "details": {}
+        }
+
+        try:
+            if not self._is_initialized:
+                health_result["message"] = "Vector store not initialized"
+                return health_result
+
+            with self._lock:
+                health_result.update({
+                    "healthy": True,
+                    "message": "NumPy vector store is healthy",
+                    "details": {
+                        "document_count": self.count(),
+                        "tombstoned_rows": self._size - len(self._id_to_row),
+                        "dimensions": self._dimensions,
+                        "is_persistent": self._persist_directory is not None,
+                        "persist_directory": self._persist_directory,
+                        "index_type": self._index_type,
+                        "ivf_trained": self._centroids is not None,
+                        "ivf_partitions": len(self._centroids) if self._centroids is not None else 0
+                    }
+                })
+                if self._lexical_index is not None:
+                    health_result["details"]["lexical_index"] = self._lexical_index.stats()
+
+            self.logger.debug({
+                "action": "VECTOR_STORE_HEALTHCHECK",
+                "message": "Vector store health check completed",
+                "data": health_result
+            })
+
+            return health_result
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_HEALTHCHECK_ERROR",
+                "message": f"Health check failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            health_result["message"] = f"Health check failed: {str(e)}"
+            health_result["details"] = {"error": str(e), "error_type": type(e).__name__}
+            return health_result
+
+    def store_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        This method is deprecated and should not be used.
+
+        Raises:
+            NotImplementedError: Always raises this exception
+        """
+        raise NotImplementedError(
+            "store_documents is deprecated. Use add_documents method instead."
+        )
+
+    def compact(self) -> None:
+        """
+        Reclaim tombstoned rows and fold the change log into the snapshot.
+
+        Returns:
+            None
+
+        Raises:
+            VectorStoreError: If compaction fails
+        """
+        if not self._is_initialized:
+            raise VectorStoreError("Vector store not initialized. Call initialize() first.")
+
+        try:
+            with self._lock:
+                self._compact()
+
+            self.logger.info({
+                "action": "VECTOR_STORE_COMPACT",
+                "message": "Compacted vector store",
+                "data": {"documents": self._size, "generation": self._generation}
+            })
+
+        except Exception as e:
+            self.logger.error({
+                "action": "VECTOR_STORE_COMPACT_ERROR",
+                "message": f"Compaction failed: {str(e)}",
+                "data": {"error": str(e), "error_type": type(e).__name__}
+            })
+            raise VectorStoreError(f"Compaction failed: {str(e)}") from e
+
+    def close(self) -> None:
+        """
+        Compact the store and release the memory map.
+
+        Returns:
+            None
+        """
+        if not self._is_initialized:
+            return
+
+        with self._lock:
+            if self._persist_directory and (self._log_entries or self._size != len(self._id_to_row)):
+                self.compact()
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._vectors = None
+            if self._lexical_index is not None:
+                self._lexical_index.close()
+            self._is_initialized = False
+
+    def _init_lexical_index(self, lexical_config: Dict[str, Any]) -> None:
+        """
+        Open the BM25 index and index documents stored before it existed.
+
+        Args:
+            lexical_config: The lexical_index config section
+        """
+        default_path = (
+            os.path.join(self._persist_directory, "lexical_index.db") if self._persist_directory else None
+        )
+        db_path = lexical_config.get("path", default_path)
+        if not db_path:
+            self.logger.warning({
+                "action": "VECTOR_STORE_LEXICAL_INDEX_DISABLED",
+                "message": "Lexical index needs a path when the store is not persistent",
+                "data": {}
+            })
+            return
+
+        self._lexical_index = LexicalIndex(db_path=db_path, logger_name=f"{self.logger.name}.lexical")
+        self._lexical_index.initialize()
+
+        if self._lexical_index.count() == 0 and self._id_to_row:
+            self._lexical_index.add_many(
+                list(self._id_to_row), [self._texts[row] for row in self._id_to_row.values()]
+            )
+
+    def _compact(self) -> None:
+        """
+        Drop tombstoned rows and write a new snapshot of the remaining ones.
+
+        Compacted vectors go to a new vectors file next to the current one;
+        replacing the snapshot that names it is the single step that switches
+        over, so a crash at any point leaves a matching vectors file and
+        snapshot on disk. The previous vectors file is removed afterwards.
+        """
+        live_rows = np.flatnonzero(self._alive[:self._size])
+        if self._vectors is None or len(live_rows) == self._size:
+            self._write_snapshot()
+            return
+
+        previous_file = self._vectors_file
+        vectors_file = (
+            f"vectors.{self._generation + 1}.npy" if self._persist_directory else self._vectors_file
+        )
+        vectors = self._rewrite_vectors(self._vectors[live_rows], max(len(live_rows), 1), vectors_file)
+
+        self._vectors = vectors
+        self._vectors_file = vectors_file
+        self._assignments = self._resize(self._assignments[live_rows], len(vectors))
+        self._partition_index = None
+        self._alive = self._resize(np.ones(len(live_rows), dtype=bool), len(vectors))
+        self._ids = [self._ids[row] for row in live_rows]
+        self._texts = [self._texts[row] for row in live_rows]
+        columns = {name: [values[row] for row in live_rows] for name, values in self._columns.items()}
+        # Drop columns that only deleted rows had
+        self._columns = {
+            name: values for name, values in columns.items()
+            if any(value is not None for value in values)
+        }
+        self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._ids)}
+        self._size = len(live_rows)
+        self._column_cache.clear()
+
+        self._write_snapshot()
+
+        if self._persist_directory and previous_file != vectors_file:
+            previous_path = os.path.join(self._persist_directory, previous_file)
+            if os.path.exists(previous_path):
+                os.remove(previous_path)
+
+    # Search
+
+    def _search_many(
+        self, queries: np.ndarray, num_results: int, filters: Optional[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Score queries against the candidate rows and format the top results.
+
+        Args:
+            queries: (num_queries, dimensions) float32 query matrix
+            num_results: Maximum number of results per query
+            filters: Optional metadata filters
+
+        Returns:
+            One formatted result list per query
+        """
+        if queries.ndim != 2:
+            raise ValueError(f"Expected a 2-D query matrix, got shape {queries.shape}")
+        if not self._id_to_row or num_results <= 0:
+            return [[] for _ in range(len(queries))]
+        if queries.shape[1] != self._dimensions:
+            raise ValueError(
+                f"Query dimensions ({queries.shape[1]}) do not match the store ({self._dimensions})"
+            )
+
+        queries = self._normalize(queries)
+        mask = self._live_mask(filters)
+
+        if self._centroids is None:
+            # Flat: score every candidate for every query with one matrix product
+            if mask.all():
+                # Score the memory-mapped rows in place instead of gathering a copy
+                candidates = np.arange(self._size)
+                scores = self._vectors[:self._size] @ queries.T
+            else:
+                candidates = np.flatnonzero(mask)
+                scores = self._vectors[candidates] @ queries.T
+            return [
+                self._top_results(candidates, scores[:, i], num_results)
+                for i in range(len(queries))
+            ]
+
+        # IVF: each query only scans its nprobe closest partitions
+        nprobe = min(self._nprobe, len(self._centroids))
+        partition_scores = queries @ self._centroids.T
+        order, offsets = self._partitions()
+        batch_results = []
+        for i, query in enumerate(queries):
+            probes = np.argpartition(-partition_scores[i], nprobe - 1)[:nprobe]
+            candidates = np.concatenate([order[offsets[p]:offsets[p + 1]] for p in probes])
+            candidates = candidates[mask[candidates]]
+            scores = self._vectors[candidates] @ query
+            batch_results.append(self._top_results(candidates, scores, num_results))
+        return batch_results
+
+    def _top_results(self, candidates: np.ndarray, scores: np.ndarray, num_results: int) -> List[Dict[str, Any]]:
+        """
+        Select and format the num_results highest scoring candidates.
+
+        Args:
+            candidates: Row indices that were scored
+            scores: Cosine similarity per candidate
+            num_results: Maximum number of results
+
+        Returns:
+            Documents sorted by descending score
+        """
+        k = min(num_results, len(candidates))
+        if k == 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            {
+                "id": self._ids[row],
+                "text": self._texts[row],
+                "metadata": self._row_metadata(row),
+                "score": float(scores[position])
+            }
+            for position, row in zip(top, candidates[top])
+        ]
+
+    # Metadata filtering
+
+    def _live_mask(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """
+        Get a boolean mask of live rows matching the filters.
+
+        Args:
+            filters: Optional metadata filters
+
+        Returns:
+            np.ndarray: Boolean mask of length _size
+        """
+        mask = self._alive[:self._size].copy()
+        if filters:
+            mask &= self._filter_mask(filters)
+        return mask
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Evaluate a metadata filter over the metadata columns.
+
+        Supports equality ({'source': 'telegram'}), comparison operators
+        (eq, ne, gt, gte, lt, lte, in, nin, with or without a leading '$')
+        and '$and' / '$or' combinations. Rows missing a field never match a
+        condition on it.
+
+        Args:
+            filters: Metadata filters
+
+        Returns:
+            np.ndarray: Boolean mask of length _size
+        """
+        mask = np.ones(self._size, dtype=bool)
+        for key, condition in filters.items():
+            if key in ("$and", "$or"):
+                masks = [self._filter_mask(sub_filter) for sub_filter in condition]
+                if key == "$and":
+                    mask &= np.logical_and.reduce(masks) if masks else True
+                else:
+                    mask &= np.logical_or.reduce(masks) if masks else False
+                continue
+
+            if isinstance(condition, dict):
+                for op, value in condition.items():
+                    mask &= self._compare(key, op.lstrip("$"), value)
+            else:
+                mask &= self._compare(key, "eq", condition)
+        return mask
+
+    def _compare(self, key: str, op: str, value: Any) -> np.ndarray:
+        """
+        Evaluate one condition on a metadata column.
+
+        Args:
+            key: Metadata field
+            op: Operator name without '$'
+            value: Operand
+
+        Returns:
+            np.ndarray: Boolean mask of length _size
+        """
+        column = self._column_array(key)
+        if column is None:
+            return np.zeros(self._size, dtype=bool)
+
+        if op in ("in", "nin"):
+            try:
+                values = set(value)
+            except TypeError:
+                # Unhashable operands (e.g. lists) are compared one by one
+                values = list(value)
+            matches = np.fromiter(
+                (self._contains_any(item, values) for item in column), dtype=bool, count=self._size
+            )
+            if op == "nin":
+                matches = ~matches & self._present(column)
+            return matches
+
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported filter operator '{op}'")
+
+        if column.dtype == np.float64 and isinstance(value, (int, float)) and not isinstance(value, bool):
+            # Numeric column: vectorized comparison, NaN (missing) never matches
+            with np.errstate(invalid="ignore"):
+                matches = _COMPARISONS[op](column, value)
+            return matches & ~np.isnan(column)
+
+        compare = _COMPARISONS[op]
+
+        def matches_item(item: Any) -> bool:
+            try:
+                return item is not None and bool(compare(item, value))
+            except TypeError:
+                return False
+
+        matches = np.fromiter((matches_item(item) for item in column), dtype=bool, count=self._size)
+        # Missing values are NaN in numeric columns, which would satisfy 'ne'
+        return matches & self._present(column)
+
+    @staticmethod
+    def _contains_any(item: Any, values: Any) -> bool:
+        """
+        Check an 'in' condition for one metadata value.
+
+        List-valued metadata (e.g. tags) matches when any of its elements is
+        among values.
+
+        Args:
+            item: Metadata value of one row, or None if missing
+            values: The operator's operands, as a set or (if unhashable) a list
+
+        Returns:
+            bool: Whether the row matches
+        """
+        if item is None:
+            return False
+        elements = item if isinstance(item, (list, tuple)) else [item]
+        for element in elements:
+            try:
+                if element in values:
+                    return True
+            except TypeError:
+                # An unhashable element cannot equal any member of a set of hashables
+                continue
+        return False
+
+    def _column_array(self, key: str) -> Optional[np.ndarray]:
+        """
+        Get a metadata column as an array, cached until the next write.
+
+        Numeric columns become float64 arrays with NaN for missing values so
+        range filters are vectorized; other columns become object arrays.
+
+        Args:
+            key: Metadata field
+
+        Returns:
+            Optional[np.ndarray]: Column values, or None if no row has the field
+        """
+        if key in self._column_cache:
+            return self._column_cache[key]
+        if key not in self._columns:
+            return None
+
+        values = self._columns[key][:self._size]
+        present = [value for value in values if value is not None]
+        if present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+            column = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+
+        self._column_cache[key] = column
+        return column
+
+    @staticmethod
+    def _present(column: np.ndarray) -> np.ndarray:
+        """Mask of rows that have a value in a column array."""
+        if column.dtype == np.float64:
+            return ~np.isnan(column)
+        return np.fromiter((item is not None for item in column), dtype=bool, count=len(column))
+
+    # Row bookkeeping
+
+    def _set_row(self, row: int, doc_id: str, text: str, metadata: Dict[str, Any]) -> None:
+        """Write the ID, text and metadata of one row into the columnar sidecar."""
+        if row >= len(self._ids):
+            grow = row + 1 - len(self._ids)
+            self._ids.extend([None] * grow)
+            self._texts.extend([None] * grow)
+            for values in self._columns.values():
+                values.extend([None] * grow)
+
+        self._ids[row] = doc_id
+        self._texts[row] = text
+        self._alive[row] = True
+
+        for name, values in self._columns.items():
+            values[row] = metadata.get(name)
+        for name, value in metadata.items():
+            if name not in self._columns:
+                self._columns[name] = [None] * len(self._ids)
+                self._columns[name][row] = value
+
+        self._column_cache.clear()
+
+    def _clear_row(self, row: int) -> None:
+        """Tombstone one row."""
+        self._alive[row] = False
+        self._ids[row] = None
+        self._texts[row] = None
+        for values in self._columns.values():
+            values[row] = None
+        self._column_cache.clear()
+
+    def _row_metadata(self, row: int) -> Dict[str, Any]:
+        """Rebuild one row's metadata dictionary from the columns."""
+        return {
+            name: values[row]
+            for name, values in self._columns.items()
+            if values[row] is not None
+        }
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize rows so dot products are cosine similarities."""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return np.ascontiguousarray(vectors / np.maximum(norms, 1e-12), dtype=np.float32)
+
+    @staticmethod
+    def _resize(array: np.ndarray, length: int) -> np.ndarray:
+        """Copy a 1-D array into a zero-filled array of the given length."""
+        resized = np.zeros(length, dtype=array.dtype)
+        resized[:min(len(array), length)] = array[:length]
+        return resized
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """
+        Grow the vector matrix (doubling) so it can hold at least rows rows.
+
+        Args:
+            rows: Required number of rows
+        """
+        capacity = 0 if self._vectors is None else len(self._vectors)
+        if rows <= capacity:
+            return
+
+        new_capacity = max(self._INITIAL_CAPACITY, capacity)
+        while new_capacity < rows:
+            new_capacity *= 2
+
+        existing = self._vectors[:self._size] if self._vectors is not None else None
+        self._vectors = self._rewrite_vectors(existing, new_capacity)
+        self._alive = self._resize(self._alive, new_capacity)
+        self._assignments = self._resize(self._assignments, new_capacity)
+
+    def _rewrite_vectors(
+        self, rows: Optional[np.ndarray], capacity: int, vectors_file: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Create a vector matrix of the given capacity holding rows.
+
+        Persistent stores write a new memory-mapped file and swap it in.
+
+        Args:
+            rows: Existing rows to copy, or None
+            capacity: Number of rows to allocate
+            vectors_file: File to write, defaults to the current vectors file
+
+        Returns:
+            np.ndarray: The new matrix
+        """
+        shape = (capacity, self._dimensions)
+        if not self._persist_directory:
+            matrix = np.zeros(shape, dtype=np.float32)
+            if rows is not None:
+                matrix[:len(rows)] = rows
+            return matrix
+
+        path = os.path.join(self._persist_directory, vectors_file or self._vectors_file)
+        tmp_path = f"{path}.tmp"
+        matrix = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=shape)
+        if rows is not None:
+            matrix[:len(rows)] = rows
+        matrix.flush()
+        del matrix
+        os.replace(tmp_path, path)
+        return np.load(path, mmap_mode="r+")
+
+    # IVF index
+
+    def _maybe_train(self) -> None:
+        """
+        Train the IVF partitions once the store is large enough.
+
+        Partitions are retrained whenever the collection has doubled since
+        the last training, so they keep up with a growing corpus.
+        """
+        if self._index_type != "ivf":
+            return
+        live = len(self._id_to_row)
+        if live < self._min_train_size:
+            return
+        if self._centroids is not None and live < 2 * self._trained_size:
+            return
+        self._train_ivf()
+
+    def _train_ivf(self) -> None:
+        """Partition the live rows with spherical k-means and assign every row."""
+        live_rows = np.flatnonzero(self._alive[:self._size])
+        nlist = min(self._nlist, len(live_rows))
+        rng = np.random.default_rng(0)
+
+        # Train on a sample; k-means converges well with a few hundred points per list
+        sample_size = min(len(live_rows), nlist * 256)
+        sample = self._vectors[np.sort(rng.choice(live_rows, sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(self._train_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._trained_size = len(live_rows)
+        self._assignments[:self._size] = self._assign(self._vectors[:self._size])
+        self._partition_index = None
+        if self._persist_directory:
+            self._write_ivf()
+
+        self.logger.info({
+            "action": "VECTOR_STORE_IVF_TRAINED",
+            "message": f"Trained IVF index with {nlist} partitions",
+            "data": {"partitions": nlist, "documents": self._trained_size}
+        })
+
+    def _partitions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the rows grouped by IVF partition.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices sorted by partition, and
+                offsets such that partition p's rows are order[offsets[p]:offsets[p + 1]]
+        """
+        if self._partition_index is None:
+            assignments = self._assignments[:self._size]
+            order = np.argsort(assignments, kind="stable")
+            offsets = np.searchsorted(assignments[order], np.arange(len(self._centroids) + 1))
+            self._partition_index = (order, offsets)
+        return self._partition_index
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Assign each vector to its closest IVF partition."""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), self._ASSIGN_CHUNK_SIZE):
+            chunk = vectors[start:start + self._ASSIGN_CHUNK_SIZE]
+            assignments[start:start + len(chunk)] = np.argmax(chunk @ self._centroids.T, axis=1)
+        return assignments
+
+    # Persistence
+
+    def _persist(self, log_records: List[Dict[str, Any]]) -> None:
+        """
+        Make a write durable: flush the matrix, then append to the change log.
+
+        The log is written after the vectors so that rows it references are
+        always on disk.
+
+        Args:
+            log_records: Upsert/delete records describing the write
+        """
+        if not self._persist_directory or not log_records:
+            return
+
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+
+        log_path = os.path.join(self._persist_directory, self.LOG_FILE)
+        with open(log_path, "a", encoding="utf-8") as log_file:
+            for record in log_records:
+                log_file.write(json.dumps(record, default=str) + "\n")
+        self._log_entries += len(log_records)
+
+        # Bound the log (and the replay on the next open) by folding it into a snapshot
+        if self._log_entries >= self._max_log_entries:
+            self._compact()
+
+    def _write_snapshot(self) -> None:
+        """
+        Write the columnar sidecar snapshot and start a new change log.
+
+        The snapshot gets a new generation and the log is restarted with a
+        header naming it, so a log left behind by a crash between the two
+        steps is recognized as already folded in.
+        """
+        if not self._persist_directory:
+            return
+
+        generation = self._generation + 1
+        snapshot = {
+            "generation": generation,
+            "vectors_file": self._vectors_file,
+            "dimensions": self._dimensions,
+            "size": self._size,
+            "ids": self._ids[:self._size],
+            "texts": self._texts[:self._size],
+            "columns": {name: values[:self._size] for name, values in self._columns.items()}
+        }
+
+        path = os.path.join(self._persist_directory, self.SNAPSHOT_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot, snapshot_file, default=str)
+        os.replace(f"{path}.tmp", path)
+        self._generation = generation
+
+        log_path = os.path.join(self._persist_directory, self.LOG_FILE)
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            log_file.write(json.dumps({"op": "generation", "generation": generation}) + "\n")
+        self._log_entries = 0
+
+        if self._centroids is not None:
+            self._write_ivf()
+
+    def _write_ivf(self) -> None:
+        """Persist the IVF centroids and row assignments."""
+        path = os.path.join(self._persist_directory, self.IVF_FILE)
+        with open(f"{path}.tmp", "wb") as ivf_file:
+            np.savez(
+                ivf_file,
+                centroids=self._centroids,
+                assignments=self._assignments[:self._size],
+                trained_size=np.int64(self._trained_size)
+            )
+        os.replace(f"{path}.tmp", path)
+
+    def _load(self) -> None:
+        """Open the memory-mapped matrix and replay the snapshot and change log."""
+        snapshot_path = os.path.join(self._persist_directory, self.SNAPSHOT_FILE)
+        log_path = os.path.join(self._persist_directory, self.LOG_FILE)
+
+        snapshot = None
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            # Snapshots written before generations existed describe vectors.npy
+            self._generation = snapshot.get("generation", 0)
+            self._vectors_file = snapshot.get("vectors_file", self.VECTORS_FILE)
+
+        vectors_path = os.path.join(self._persist_directory, self._vectors_file)
+        if not os.path.exists(vectors_path):
+            return
+        self._remove_stale_vectors()
+
+        self._vectors = np.load(vectors_path, mmap_mode="r+")
+        self._dimensions = self._vectors.shape[1]
+        capacity = len(self._vectors)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._assignments = np.zeros(capacity, dtype=np.int32)
+
+        if snapshot is not None:
+            self._size = snapshot["size"]
+            self._ids = snapshot["ids"]
+            self._texts = snapshot["texts"]
+            self._columns = snapshot["columns"]
+            self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._ids) if doc_id is not None}
+            self._alive[list(self._id_to_row.values())] = True
+
+        # Replay writes made since the snapshot; rows are appended in log order
+        replayed_rows = []
+        if os.path.exists(log_path):
+            # Logs written before generations existed have no header
+            log_generation = 0
+            with open(log_path, "r", encoding="utf-8") as log_file:
+                for line in log_file:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record["op"] == "generation":
+                        log_generation = record["generation"]
+                        continue
+                    if log_generation != self._generation:
+                        # Already folded into the snapshot: the crash came before the log restarted
+                        break
+                    self._log_entries += 1
+                    if record["op"] == "delete":
+                        row = self._id_to_row.pop(record["id"], None)
+                        if row is not None:
+                            self._clear_row(row)
+                        continue
+
+                    row = self._id_to_row.get(record["id"])
+                    if row is None:
+                        row = self._size
+                        self._size += 1
+                        self._id_to_row[record["id"]] = row
+                    self._set_row(row, record["id"], record["text"], record["metadata"])
+                    replayed_rows.append(row)
+
+        if self._index_type == "ivf":
+            self._load_ivf(replayed_rows)
+
+        self._column_cache.clear()
+
+    def _remove_stale_vectors(self) -> None:
+        """Delete vectors files left behind by a compaction that did not finish."""
+        for name in os.listdir(self._persist_directory):
+            is_vectors_file = name.startswith("vectors.") and (name.endswith(".npy") or name.endswith(".npy.tmp"))
+            if is_vectors_file and name != self._vectors_file:
+                os.remove(os.path.join(self._persist_directory, name))
+
+    def _load_ivf(self, replayed_rows: List[int]) -> None:
+        """
+        Load persisted IVF partitions and assign rows written since they were saved.
+
+        Args:
+            replayed_rows: Rows upserted by the change log replay
+        """
+        path = os.path.join(self._persist_directory, self.IVF_FILE)
+        if not os.path.exists(path):
+            self._maybe_train()
+            return
+
+        with np.load(path) as ivf:
+            self._centroids = ivf["centroids"]
+            assignments = ivf["assignments"]
+            self._trained_size = int(ivf["trained_size"])
+
+        known = min(len(assignments), self._size)
+        self._assignments[:known] = assignments[:known]
+        stale_rows = np.unique(np.concatenate([
+            np.asarray(replayed_rows, dtype=np.int64),
+            np.arange(known, self._size, dtype=np.int64)
+        ]))
+        if len(stale_rows):
+            self._assignments[stale_rows] = self._assign(self._vectors[stale_rows])
+        self._partition_index = None
@@ -0,0 +1,119 @@
+"""
+Search result cache for VectorStore implementations.
+
+This module provides a SearchResultCache class that remembers the results of
+recent searches, keyed by the quantized query vector (or query text), the
+metadata filters and the number of results. Every key also carries the
+store's write generation, which add_documents() and delete() bump, so cached
+results never outlive the data they were computed from.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ici.utils.cache import TTLLRUCache
+
+
+class SearchResultCache:
+    """
+    Generation-versioned LRU cache of search results.
+
+    Query vectors are rounded to float16 before hashing, so vectors that
+    differ only by float noise (the same text embedded twice) share an
+    entry. Keys are built with the generation current at lookup time; a
+    search that races with a write stores its results under the old
+    generation, where no later lookup will find them.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the SearchResultCache.
+
+        Args:
+            max_size: Maximum number of cached searches
+            ttl_seconds: Entry lifetime in seconds, or None for no expiry; bounds
+                         staleness when another process writes to the same store
+        """
+        self._cache = TTLLRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of writes seen so far."""
+        return self._generation
+
+    def key(
+        self,
+        kind: str,
+        query: Union[str, List[float], np.ndarray],
+        num_results: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Hashable, ...]:
+        """
+        Build the cache key of a search at the current generation.
+
+        Args:
+            kind: Search type, e.g. 'vector' or 'lexical'
+            query: Query vector or query text
+            num_results: Number of results requested
+            filters: Metadata filters of the search
+
+        Returns:
+            Tuple[Hashable, ...]: The cache key
+        """
+        if isinstance(query, str):
+            query_key = " ".join(query.split())
+        else:
+            quantized = np.asarray(query, dtype=np.float32).astype(np.float16)
+            query_key = hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+        filters_key = json.dumps(filters, sort_keys=True, default=str) if filters else None
+        return (self._generation, kind, query_key, num_results, filters_key)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results.
+
+        Args:
+            key: Key returned by key()
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: A copy of the cached results, or None on a miss
+        """
+        results = self._cache.get(key)
+        return copy.deepcopy(results) if results is not None else None
+
+    def set(self, key: Tuple[Hashable, ...], results: List[Dict[str, Any]]) -> None:
+        """
+        Cache the results of a search.
+
+        Args:
+            key: Key returned by key() before the search ran
+            results: The search results
+        """
+        if key[0] == self._generation:
+            self._cache.set(key, copy.deepcopy(results))
+
+    def invalidate(self) -> None:
+        """
+        Start a new generation and drop every cached result.
+
+        Stores call this after each write.
+        """
+        with self._lock:
+            self._generation += 1
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: TTLLRUCache statistics plus the current generation
+        """
+        return {**self._cache.stats(), "generation": self._generation}
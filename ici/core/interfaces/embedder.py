@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
+
 
 class Embedder(ABC):
     """
@@ -62,6 +64,32 @@ class Embedder(ABC):
         """
         pass
 
+    async def embed_batch_array(self, texts: List[str]) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+        """
+        Generates vector embeddings for multiple texts as one float32 matrix.
+
+        Preferred over embed_batch() on hot paths: the vectors stay in a single
+        contiguous array instead of one Python list of floats per text. The
+        default implementation converts the output of embed_batch(); embedders
+        should override it to produce the array directly.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+                - A (len(texts), dimensions) C-contiguous float32 array
+                - Optional metadata for each text
+
+        Raises:
+            EmbeddingError: If batch embedding generation fails for any reason
+        """
+        results = await self.embed_batch(texts)
+        if not results:
+            return np.empty((0, self.dimensions), dtype=np.float32), []
+        vectors = np.asarray([vector for vector, _ in results], dtype=np.float32)
+        return vectors, [metadata for _, metadata in results]
+
     @property
     @abstractmethod
     def dimensions(self) -> int:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 
 
 class Generator(ABC):
@@ -53,6 +53,29 @@ class Generator(ABC):
         """
         pass
 
+    async def generate_stream(
+        self, prompt: str, generation_options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generates an output incrementally, yielding text as it is produced.
+
+        Lets callers show the first tokens after prompt processing instead of
+        waiting for the whole completion. The default implementation yields
+        the full result of generate() as a single chunk; providers that
+        support streaming should override it.
+
+        Args:
+            prompt: The input prompt for the language model
+            generation_options: Optional parameters to override defaults
+
+        Yields:
+            str: Consecutive pieces of the generated text
+
+        Raises:
+            GenerationError: If text generation fails for any reason
+        """
+        yield await self.generate(prompt, generation_options)
+
     @abstractmethod
     async def set_model(self, model: str) -> None:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict
+from typing import Any, AsyncIterator, Optional, Dict
 from datetime import datetime
 
 
@@ -62,6 +62,44 @@ class Ingestor(ABC):
         """
         pass
 
+    async def fetch_full_data_stream(self) -> AsyncIterator[Any]:
+        """
+        Fetches all available data as a stream of smaller chunks.
+
+        Streaming lets downstream stages start processing before the full
+        history has been fetched and bounds the amount of raw data held in
+        memory. Each chunk uses the same format as fetch_full_data().
+
+        The default implementation yields the result of fetch_full_data() as a
+        single chunk. Ingestors that can fetch incrementally (e.g. one
+        conversation at a time) should override it.
+
+        Yields:
+            Any: Raw data chunks in a source-native format.
+
+        Raises:
+            IngestorError: If data fetching fails for any reason.
+        """
+        yield await self.fetch_full_data()
+
+    async def fetch_new_data_stream(self, since: Optional[datetime] = None) -> AsyncIterator[Any]:
+        """
+        Fetches new data since the given timestamp as a stream of smaller chunks.
+
+        The default implementation yields the result of fetch_new_data() as a
+        single chunk.
+
+        Args:
+            since: Optional timestamp to fetch data from.
+
+        Yields:
+            Any: Raw data chunks in a source-native format.
+
+        Raises:
+            IngestorError: If data fetching fails for any reason.
+        """
+        yield await self.fetch_new_data(since=since)
+
     @abstractmethod
     async def fetch_data_in_range(self, start: datetime, end: datetime) -> Any:
         """
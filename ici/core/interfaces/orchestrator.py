@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 
 
 class Orchestrator(ABC):
@@ -58,6 +58,32 @@ class Orchestrator(ABC):
         """
         pass
 
+    async def process_query_stream(
+        self, source: str, user_id: str, query: str, additional_info: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Processes a query like process_query, yielding the response incrementally.
+
+        The default implementation yields the full result of process_query()
+        as a single chunk; orchestrators whose generator can stream should
+        override it.
+
+        Args:
+            source: The source of the query
+            user_id: Identifier for the user making the request
+            query: The user input/question to process
+            additional_info: Dictionary containing additional attributes and values
+
+        Yields:
+            str: Consecutive pieces of the final response
+
+        Raises:
+            OrchestratorError: If the orchestration process fails
+            GenerationError: If generation fails after part of the response
+                was yielded; the response seen so far is incomplete
+        """
+        yield await self.process_query(source, user_id, query, additional_info)
+
     @abstractmethod
     async def configure(self, config: Dict[str, Any]) -> None:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict
+from typing import Any, AsyncIterator, List, Dict
 
 
 class Preprocessor(ABC):
@@ -47,6 +47,26 @@ class Preprocessor(ABC):
         """
         pass
 
+    async def preprocess_stream(self, raw_chunks: AsyncIterator[Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Transforms a stream of raw data chunks into standardized documents.
+
+        Used by streaming ingestion, where an Ingestor yields its data in
+        chunks (e.g. one conversation at a time). The default implementation
+        calls preprocess() on each chunk.
+
+        Args:
+            raw_chunks: Async iterator of source-specific data chunks from an Ingestor
+
+        Yields:
+            List[Dict[str, Any]]: The standardized documents for each chunk.
+
+        Raises:
+            PreprocessorError: If preprocessing fails for any reason.
+        """
+        async for raw_data in raw_chunks:
+            yield await self.preprocess(raw_data)
+
     @abstractmethod
     def healthcheck(self) -> Dict[str, Any]:
         """
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+import numpy as np
 
 
 class VectorStore(ABC):
@@ -69,6 +71,7 @@ class VectorStore(ABC):
 
         Returns:
             List[Dict[str, Any]]: List of documents, each containing:
+                - 'id': Document ID
                 - 'text': Original text content
                 - 'metadata': Original metadata
                 - 'score': Similarity score (higher is more similar)
@@ -78,6 +81,70 @@ class VectorStore(ABC):
         """
         pass
 
+    def search_batch(
+        self,
+        query_vectors: Union[List[List[float]], np.ndarray],
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieves the most similar documents for several query vectors at once.
+
+        The default implementation calls search() once per query vector.
+        Implementations whose backend accepts multiple queries per request
+        should override it to answer the whole batch in one round trip.
+
+        Args:
+            query_vectors: The vectors to search for, either a
+                           (num_queries, dimensions) float32 array or a list
+                           of float lists
+            num_results: Number of results to return per query
+            filters: Optional metadata filters applied to every query
+
+        Returns:
+            List[List[Dict[str, Any]]]: One result list per query vector, in
+                the same order and format as search()
+
+        Raises:
+            VectorStoreError: If the search operation fails for any reason
+        """
+        if isinstance(query_vectors, np.ndarray):
+            query_vectors = query_vectors.tolist()
+        return [
+            self.search(query_vector=query_vector, num_results=num_results, filters=filters)
+            for query_vector in query_vectors
+        ]
+
+    def lexical_search(
+        self,
+        query: str,
+        num_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves documents by keyword (BM25) relevance to the query text.
+
+        Complements search() for exact terms that embeddings match poorly,
+        such as names, handles, URLs and numbers. The default implementation
+        has no lexical index and returns no results.
+
+        Args:
+            query: The query text
+            num_results: Number of results to return
+            filters: Optional metadata filters to apply
+
+        Returns:
+            List[Dict[str, Any]]: List of documents, best match first, each containing:
+                - 'id': Document ID
+                - 'text': Original text content
+                - 'metadata': Original metadata
+                - 'score': BM25 relevance score (higher is more relevant)
+
+        Raises:
+            VectorStoreError: If the search operation fails for any reason
+        """
+        return []
+
     @abstractmethod
     def delete(
         self,
@@ -135,14 +202,16 @@ class VectorStore(ABC):
 
     @abstractmethod
     def add_documents(
-        self, documents: List[Dict[str, Any]], vectors: List[List[float]]
+        self, documents: List[Dict[str, Any]], vectors: Union[List[List[float]], np.ndarray]
     ) -> List[str]:
         """
         Stores documents along with their vector embeddings.
 
         Args:
             documents: List of documents to store
-            vectors: List of vector embeddings for the documents
+            vectors: Vector embeddings for the documents, either a
+                     (len(documents), dimensions) float32 array (preferred) or
+                     a list of float lists
 
         Returns:
             List[str]: List of document IDs
@@ -17,6 +17,12 @@ from ici.utils.datetime_utils import (
 from ici.utils.load_env import load_env
 from ici.utils.component_loader import load_component_class
 from ici.utils.print_banner import print_banner
+from ici.utils.document_id import generate_document_id
+from ici.utils.cache import TTLLRUCache
+from ici.utils.response_cache import SemanticResponseCache
+from ici.utils.query_filters import extract_query_constraints, build_metadata_filter
+from ici.utils.component_registry import ComponentHandle, ComponentRegistry, get_component_registry
+from ici.utils.tracing import Tracer, MetricsExporter, get_tracer
 
 __all__ = [
     "get_component_config",
@@ -30,4 +36,15 @@ __all__ = [
     "load_env",
     "load_component_class",
     "print_banner",
+    "generate_document_id",
+    "TTLLRUCache",
+    "SemanticResponseCache",
+    "extract_query_constraints",
+    "build_metadata_filter",
+    "ComponentRegistry",
+    "ComponentHandle",
+    "get_component_registry",
+    "Tracer",
+    "MetricsExporter",
+    "get_tracer",
 ] 
\ No newline at end of file
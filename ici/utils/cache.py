@@ -0,0 +1,155 @@
+"""
+In-process caching utilities for the ICI framework.
+
+This module provides a thread-safe LRU cache with optional time-to-live
+expiry and hit/miss statistics.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLLRUCache:
+    """
+    Thread-safe LRU cache with an optional per-entry time-to-live.
+    
+    Entries are evicted when the cache exceeds max_size (least recently used
+    first) or when they are older than ttl_seconds at lookup time.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the TTLLRUCache.
+        
+        Args:
+            max_size: Maximum number of entries
+            ttl_seconds: Entry lifetime in seconds, or None for no expiry
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value to return on a miss
+            
+        Returns:
+            Any: The cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            
+            value, stored_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any, age: float = 0.0) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            age: Seconds the value has already been cached, e.g. when restoring saved entries
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() - age)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an entry without counting a lookup.
+        
+        Args:
+            key: Cache key
+            default: Value to return if the key is not cached
+            
+        Returns:
+            Any: The removed value, or default
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[0]
+    
+    def items(self) -> List[Tuple[Hashable, Any, float]]:
+        """
+        Get the live entries, least recently used first.
+        
+        Expired entries are dropped. Unlike get(), this neither counts
+        lookups nor changes recency, so callers can scan for an entry and
+        then get() the one they use.
+        
+        Returns:
+            List[Tuple[Hashable, Any, float]]: (key, value, age in seconds) per entry
+        """
+        with self._lock:
+            now = time.monotonic()
+            live = []
+            for key, (value, stored_at) in list(self._entries.items()):
+                age = now - stored_at
+                if self.ttl_seconds is not None and age > self.ttl_seconds:
+                    del self._entries[key]
+                    self._expirations += 1
+                    continue
+                live.append((key, value, age))
+            return live
+    
+    def clear(self) -> None:
+        """
+        Remove all entries. Statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Hit/miss counters, hit rate, evictions, expirations and size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds
+            }
@@ -0,0 +1,183 @@
+"""
+Component registry for sharing component instances.
+
+This module provides a ComponentRegistry that hands out a single, reference
+counted instance per key (typically a config section such as
+"embedders.sentence_transformer"), so components like the orchestrator and
+the ingestion pipeline share one embedder and one vector store instead of
+each loading their own. Each user holds its references through a
+ComponentHandle, which releases everything it acquired in one call.
+"""
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class ComponentRegistry:
+    """
+    Registry of shared component instances keyed by config section.
+
+    acquire() creates the instance on first use and increments its reference
+    count; release() decrements it and closes the instance once the last user
+    has released it.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty ComponentRegistry.
+        """
+        self._instances: Dict[str, Any] = {}
+        self._ref_counts: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get the shared instance for a key, creating it with factory if needed.
+
+        Args:
+            key: Registry key, usually the component's config section
+            factory: Coroutine function returning an initialized instance
+
+        Returns:
+            Any: The shared instance
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self._instances:
+                self._instances[key] = await factory()
+                self._ref_counts[key] = 0
+            self._ref_counts[key] += 1
+            return self._instances[key]
+
+    async def release(self, key: str) -> None:
+        """
+        Release one reference to a shared instance, closing it when unused.
+
+        Args:
+            key: Registry key passed to acquire()
+
+        Returns:
+            None
+        """
+        if key not in self._instances:
+            return
+
+        self._ref_counts[key] -= 1
+        if self._ref_counts[key] > 0:
+            return
+
+        instance = self._instances.pop(key)
+        del self._ref_counts[key]
+
+        close = getattr(instance, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+    def handle(self) -> "ComponentHandle":
+        """
+        Create a handle that tracks the references acquired by one owner.
+
+        Returns:
+            ComponentHandle: A handle with no references yet
+        """
+        return ComponentHandle(self)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a shared instance without acquiring a reference.
+
+        Args:
+            key: Registry key
+
+        Returns:
+            Optional[Any]: The instance, or None if it has not been created
+        """
+        return self._instances.get(key)
+
+    def keys(self) -> List[str]:
+        """
+        Get the keys of all live instances.
+
+        Returns:
+            List[str]: Registry keys
+        """
+        return list(self._instances.keys())
+
+
+class ComponentHandle:
+    """
+    References to shared instances held by a single owner.
+
+    The owner (e.g. the orchestrator or the ingestion pipeline) acquires its
+    components through the handle and calls release_all() when it closes.
+    """
+
+    def __init__(self, registry: ComponentRegistry):
+        """
+        Initialize a handle without references.
+
+        Args:
+            registry: The registry the references are acquired from
+        """
+        self._registry = registry
+        self._keys: List[str] = []
+
+    async def acquire(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get the shared instance for a key and record the reference.
+
+        Args:
+            key: Registry key, usually the component's config section
+            factory: Coroutine function returning an initialized instance
+
+        Returns:
+            Any: The shared instance
+        """
+        instance = await self._registry.acquire(key, factory)
+        self._keys.append(key)
+        return instance
+
+    async def release_all(self) -> Dict[str, Exception]:
+        """
+        Release every reference acquired through this handle.
+
+        A failing release does not stop the others; the handle holds no
+        references afterwards either way.
+
+        Returns:
+            Dict[str, Exception]: The error raised for each key whose release failed
+        """
+        keys, self._keys = self._keys, []
+        errors: Dict[str, Exception] = {}
+        for key in keys:
+            try:
+                await self._registry.release(key)
+            except Exception as e:
+                errors[key] = e
+        return errors
+
+    def keys(self) -> List[str]:
+        """
+        Get the keys this handle holds references to.
+
+        Returns:
+            List[str]: Registry keys, in acquisition order
+        """
+        return list(self._keys)
+
+
+# Process-wide registry shared by the orchestrator and the ingestion pipeline
+_default_registry = ComponentRegistry()
+
+
+def get_component_registry() -> ComponentRegistry:
+    """
+    Get the process-wide component registry.
+
+    Returns:
+        ComponentRegistry: The shared registry
+    """
+    return _default_registry
@@ -118,11 +118,13 @@ def _map_legacy_path_to_new(component_name: str) -> str:
         "generator": "orchestrator.generator",
         "vector_stores": "orchestrator.vector_store",
         "vector_stores.chroma": "orchestrator.vector_store.chroma",
+        "vector_stores.numpy": "orchestrator.vector_store.numpy",
         "prompt_builder": "orchestrator.prompt_builder",
         "orchestrator": "orchestrator",
         
         # Pipeline components
         "pipelines": "orchestrator.pipelines",
+        "pipelines.default": "orchestrator.pipelines.default",
         "pipelines.telegram": "orchestrator.pipelines.telegram",
         "pipelines.whatsapp": "orchestrator.pipelines.whatsapp",
         "pipelines.telegram.ingestor.telegram": "orchestrator.pipelines.telegram.ingestor.telegram",
@@ -0,0 +1,60 @@
+"""
+Document ID utilities for the ICI framework.
+
+This module derives deterministic, content-addressed IDs for preprocessed
+documents so that re-ingesting the same messages overwrites existing vector
+store entries instead of duplicating them.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+
+def _stringify(value: Any) -> str:
+    """
+    Convert an ID component to a stable string.
+    
+    Args:
+        value: Component value (str, int, list, dict, ...)
+        
+    Returns:
+        str: Stable string representation
+    """
+    if isinstance(value, (list, tuple)):
+        return ",".join(_stringify(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
+
+
+def generate_document_id(document: Dict[str, Any]) -> str:
+    """
+    Generate a deterministic ID for a preprocessed document.
+    
+    The ID is derived from the document's source, chat ID and the IDs of the
+    messages it covers ('message_ids' for multi-message chunks, 'message_id'
+    for single-message documents). Documents without message IDs fall back to
+    a hash of their text.
+    
+    Args:
+        document: Document with 'text' and 'metadata'
+        
+    Returns:
+        str: ID of the form '<source>_<sha256 hex digest>'
+    """
+    metadata = document.get("metadata") or {}
+    source = _stringify(metadata.get("source") or "document")
+    
+    message_ids = metadata.get("message_ids") or metadata.get("message_id")
+    if message_ids:
+        key = "|".join([
+            source,
+            _stringify(metadata.get("chat_id", "")),
+            _stringify(message_ids)
+        ])
+    else:
+        key = "|".join([source, "text", document.get("text", "")])
+    
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return f"{source}_{digest}"
@@ -0,0 +1,203 @@
+"""
+Metadata filter extraction for retrieval queries.
+
+This module turns structured constraints found in a query ("on telegram",
+"last week", "in group chats") or passed explicitly by the caller into
+metadata filters that vector stores can apply during search, so narrow
+questions only score documents that can answer them.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ici.utils.datetime_utils import ensure_tz_aware, from_isoformat
+
+# Sources written by the ingestion preprocessors
+KNOWN_SOURCES = ("telegram", "whatsapp")
+
+_SOURCE_PATTERNS = [
+    re.compile(r"\b(?:on|in|from|via|over)\s+(?:my\s+|the\s+)?(telegram|whatsapp)\b", re.IGNORECASE),
+    re.compile(r"\b(telegram|whatsapp)\s+(?:chats?|messages?|groups?|conversations?|dms?)\b", re.IGNORECASE),
+]
+_GROUP_PATTERN = re.compile(r"\bgroup\s+(?:chats?|conversations?)\b|\bin\s+(?:the|my|a|our)\s+groups?\b", re.IGNORECASE)
+_DIRECT_PATTERN = re.compile(r"\b(?:dms?|direct\s+messages?|private\s+(?:chats?|messages?))\b", re.IGNORECASE)
+
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_UNIT_DAYS = {"hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+_RELATIVE_RANGE = re.compile(
+    r"\b(?:last|past|previous)\s+(\d+|" + "|".join(_NUMBER_WORDS) + r")\s+(hour|day|week|month|year)s?\b",
+    re.IGNORECASE,
+)
+_RELATIVE_PERIOD = re.compile(r"\b(?:last|past|previous)\s+(hour|day|week|month|year)\b", re.IGNORECASE)
+_CURRENT_PERIOD = re.compile(r"\bthis\s+(week|month|year)\b", re.IGNORECASE)
+_TODAY = re.compile(r"\btoday\b", re.IGNORECASE)
+_YESTERDAY = re.compile(r"\byesterday\b", re.IGNORECASE)
+
+
+def extract_query_constraints(
+    query: str,
+    additional_info: Optional[Dict[str, Any]] = None,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Extract retrieval constraints from a query and the caller's filters.
+
+    Recognises sources ("on telegram"), chat kinds ("group chats", "DMs")
+    and time phrases ("today", "yesterday", "this week", "last month",
+    "past 3 days"). Explicit values in additional_info["filters"] (keys
+    source, chat_id, is_group, since, until) override the query text.
+
+    Args:
+        query: The user's query
+        additional_info: Optional request attributes, may contain a 'filters' dict
+        now: Reference time for relative phrases (defaults to the current time)
+
+    Returns:
+        Dict with any of 'source', 'chat_id', 'is_group', 'start' and 'end'
+        (Unix seconds); empty if the query is unconstrained
+    """
+    now = ensure_tz_aware(now) if now else datetime.now(timezone.utc)
+    constraints: Dict[str, Any] = {}
+    text = query or ""
+
+    for pattern in _SOURCE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            constraints["source"] = match.group(1).lower()
+            break
+
+    if _GROUP_PATTERN.search(text):
+        constraints["is_group"] = True
+    elif _DIRECT_PATTERN.search(text):
+        constraints["is_group"] = False
+
+    time_range = _extract_time_range(text, now)
+    if time_range:
+        constraints["start"], constraints["end"] = time_range
+
+    explicit = (additional_info or {}).get("filters") or {}
+    for key in ("source", "chat_id", "is_group"):
+        if explicit.get(key) is not None:
+            constraints[key] = explicit[key]
+    if isinstance(constraints.get("source"), str):
+        constraints["source"] = constraints["source"].lower()
+    if explicit.get("since") is not None:
+        constraints["start"] = _to_epoch_seconds(explicit["since"])
+    if explicit.get("until") is not None:
+        constraints["end"] = _to_epoch_seconds(explicit["until"])
+
+    return constraints
+
+
+def build_metadata_filter(constraints: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Build a vector store metadata filter from extracted constraints.
+
+    Time ranges match both document layouts written by the preprocessors:
+    Telegram conversation chunks overlapping the range (timestamp_start and
+    timestamp_end, in seconds) and WhatsApp messages inside it (timestamp,
+    in milliseconds).
+
+    Args:
+        constraints: Constraints returned by extract_query_constraints()
+
+    Returns:
+        Optional[Dict[str, Any]]: Chroma-style 'where' filter, or None if
+        there is nothing to filter on
+    """
+    clauses: List[Dict[str, Any]] = []
+    source = constraints.get("source")
+
+    if source:
+        clauses.append({"source": source})
+
+    chat_id = constraints.get("chat_id")
+    if isinstance(chat_id, (list, tuple, set)):
+        clauses.append({"chat_id": {"$in": list(chat_id)}})
+    elif chat_id is not None:
+        clauses.append({"chat_id": chat_id})
+
+    if constraints.get("is_group") is not None:
+        clauses.append({"is_group": bool(constraints["is_group"])})
+
+    start, end = constraints.get("start"), constraints.get("end")
+    if start is not None or end is not None:
+        layouts = []
+        if source in (None, "telegram"):
+            layouts.append(_all_of(
+                ([{"timestamp_end": {"$gte": int(start)}}] if start is not None else [])
+                + ([{"timestamp_start": {"$lte": int(end)}}] if end is not None else [])
+            ))
+        if source in (None, "whatsapp"):
+            layouts.append(_all_of(
+                ([{"timestamp": {"$gte": int(start * 1000)}}] if start is not None else [])
+                + ([{"timestamp": {"$lte": int(end * 1000)}}] if end is not None else [])
+            ))
+        if len(layouts) == 1:
+            clauses.append(layouts[0])
+        elif layouts:
+            clauses.append({"$or": layouts})
+
+    if not clauses:
+        return None
+    return _all_of(clauses)
+
+
+def _all_of(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine clauses with $and; Chroma rejects $and with a single operand."""
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _extract_time_range(text: str, now: datetime) -> Optional[tuple]:
+    """Find the first supported time phrase and return its (start, end) in Unix seconds."""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    match = _RELATIVE_RANGE.search(text)
+    if match:
+        amount = match.group(1).lower()
+        amount = int(amount) if amount.isdigit() else _NUMBER_WORDS[amount]
+        days = amount * _UNIT_DAYS[match.group(2).lower()]
+        return _epoch(now - timedelta(days=days)), _epoch(now)
+
+    match = _RELATIVE_PERIOD.search(text)
+    if match:
+        days = _UNIT_DAYS[match.group(1).lower()]
+        return _epoch(now - timedelta(days=days)), _epoch(now)
+
+    match = _CURRENT_PERIOD.search(text)
+    if match:
+        period = match.group(1).lower()
+        if period == "week":
+            start = midnight - timedelta(days=midnight.weekday())
+        elif period == "month":
+            start = midnight.replace(day=1)
+        else:
+            start = midnight.replace(month=1, day=1)
+        return _epoch(start), _epoch(now)
+
+    if _YESTERDAY.search(text):
+        return _epoch(midnight - timedelta(days=1)), _epoch(midnight) - 1
+
+    if _TODAY.search(text):
+        return _epoch(midnight), _epoch(now)
+
+    return None
+
+
+def _epoch(dt: datetime) -> int:
+    return int(dt.timestamp())
+
+
+def _to_epoch_seconds(value: Any) -> int:
+    """Convert a datetime, ISO string or Unix timestamp (s or ms) to Unix seconds."""
+    if isinstance(value, datetime):
+        return _epoch(ensure_tz_aware(value))
+    if isinstance(value, str):
+        return _epoch(from_isoformat(value))
+    value = float(value)
+    # Millisecond timestamps (as stored for WhatsApp) are ~1000x larger
+    return int(value / 1000) if value > 1e11 else int(value)
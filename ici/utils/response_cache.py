@@ -0,0 +1,272 @@
+"""
+Semantic response cache for the ICI framework.
+
+This module provides a SemanticResponseCache that stores generated responses
+and serves them again for queries whose embedding is close enough (by cosine
+similarity) to an earlier query, as long as the context the response was
+generated from is unchanged. That context is identified by two
+fingerprints: one of the retrieved documents and one of the chat-history
+window. Entries expire after a TTL, are evicted least recently used first,
+and can be saved to and loaded from a local JSON file.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ici.utils.cache import TTLLRUCache
+
+
+class SemanticResponseCache:
+    """
+    Thread-safe LRU cache of responses keyed by query similarity and context fingerprints.
+
+    Entries live in a TTLLRUCache keyed by the history fingerprint and the
+    quantized query vector, so asking the same query again replaces its
+    entry. A lookup hits when an entry has the same documents and history
+    fingerprints and its query vector has a cosine similarity of at least
+    similarity_threshold with the new query. When the same query now
+    retrieves different documents (typically because ingestion added or
+    updated documents), its entry is dropped; entries of other, merely
+    similar queries are left alone.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: Optional[float] = 86400,
+        similarity_threshold: float = 0.95,
+        path: Optional[str] = None,
+        namespace: str = ""
+    ):
+        """
+        Initialize the SemanticResponseCache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Entry lifetime in seconds, or None for no expiry
+            similarity_threshold: Minimum cosine similarity between query vectors for a hit
+            path: JSON file used by save() and load(), or None to keep entries in memory only
+            namespace: Identifies the settings responses were generated with (model,
+                       generation options); load() ignores files saved under another namespace
+        """
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError("similarity_threshold must be in (0, 1]")
+
+        # (history fingerprint, query key) -> (unit query vector, documents fingerprint, response)
+        self._entries = TTLLRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.similarity_threshold = similarity_threshold
+        self.path = path
+        self.namespace = namespace
+
+        self._dirty = False
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._entries.max_size
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._entries.ttl_seconds
+
+    @staticmethod
+    def fingerprint(items: Iterable[Any]) -> str:
+        """
+        Hash an ordered sequence of JSON-serializable items.
+
+        Args:
+            items: Items such as (document ID, text) pairs or (role, content) pairs
+
+        Returns:
+            str: Hex digest identifying the sequence
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for item in items:
+            digest.update(json.dumps(item, sort_keys=True, default=str).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _normalize(vector: Any) -> Optional[np.ndarray]:
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    @staticmethod
+    def _key(unit: np.ndarray, history_fingerprint: str) -> Tuple[Hashable, ...]:
+        """
+        Build the entry key of a query.
+
+        The unit vector is rounded to float16 before hashing, so the same
+        query embedded twice maps to the same entry despite float noise.
+        """
+        query_key = hashlib.blake2b(unit.astype(np.float16).tobytes(), digest_size=16).digest()
+        return (history_fingerprint, query_key)
+
+    def get(self, query_vector: Any, documents_fingerprint: str, history_fingerprint: str) -> Optional[str]:
+        """
+        Get the response of the most similar cached query with the same context.
+
+        Args:
+            query_vector: Embedding of the new query
+            documents_fingerprint: Fingerprint of the documents retrieved for the query
+            history_fingerprint: Fingerprint of the chat-history window
+
+        Returns:
+            Optional[str]: The cached response, or None on a miss
+        """
+        unit = self._normalize(query_vector)
+        if unit is None:
+            return None
+        key = self._key(unit, history_fingerprint)
+
+        best_key, best_similarity = None, self.similarity_threshold
+        for entry_key, (vector, documents, _), _ in self._entries.items():
+            if entry_key == key and documents != documents_fingerprint:
+                # Retrieval for this query has changed since the response was generated
+                if self._entries.pop(key) is not None:
+                    with self._lock:
+                        self._invalidations += 1
+                        self._dirty = True
+                continue
+            if entry_key[0] != history_fingerprint or documents != documents_fingerprint:
+                continue
+            if vector.shape != unit.shape:
+                continue
+
+            similarity = float(np.dot(vector, unit))
+            if similarity >= best_similarity:
+                best_key, best_similarity = entry_key, similarity
+
+        # One counted lookup per call: the best match, or the query's own (missing) key
+        entry = self._entries.get(key if best_key is None else best_key)
+        return entry[2] if entry is not None else None
+
+    def set(self, query_vector: Any, documents_fingerprint: str, history_fingerprint: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry if the cache is full.
+
+        Args:
+            query_vector: Embedding of the query the response answers
+            documents_fingerprint: Fingerprint of the documents the response was generated from
+            history_fingerprint: Fingerprint of the chat-history window
+            response: The generated response
+        """
+        unit = self._normalize(query_vector)
+        if unit is None:
+            return
+
+        self._entries.set(self._key(unit, history_fingerprint), (unit, documents_fingerprint, response))
+        with self._lock:
+            self._dirty = True
+
+    def clear(self) -> None:
+        """
+        Remove all entries. Statistics are kept.
+        """
+        self._entries.clear()
+        with self._lock:
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> bool:
+        """
+        Write the entries to path, if anything changed since the last save or load.
+
+        The file is replaced atomically. Blocking; run off the event loop.
+
+        Returns:
+            bool: Whether the file was written
+        """
+        if not self.path:
+            return False
+
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._dirty = False
+
+        now = time.time()
+        entries = [
+            {
+                "vector": vector.tolist(),
+                "documents": documents,
+                "history": key[0],
+                "response": response,
+                "stored_at": now - age
+            }
+            for key, (vector, documents, response), age in self._entries.items()
+        ]
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.FILE_VERSION, "namespace": self.namespace, "entries": entries}, f)
+        os.replace(temp_path, self.path)
+        return True
+
+    def load(self) -> int:
+        """
+        Replace the entries with those saved at path.
+
+        Missing files, files from another version or namespace, and expired
+        entries are skipped. Blocking; run off the event loop.
+
+        Returns:
+            int: Number of entries loaded
+        """
+        if not self.path or not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != self.FILE_VERSION or data.get("namespace") != self.namespace:
+            return 0
+
+        now = time.time()
+        entries: List[Dict[str, Any]] = [
+            entry for entry in data.get("entries", [])
+            if self.ttl_seconds is None or now - entry["stored_at"] <= self.ttl_seconds
+        ][-self.max_size:]
+
+        self._entries.clear()
+        for entry in entries:
+            unit = np.asarray(entry["vector"], dtype=np.float32)
+            self._entries.set(
+                self._key(unit, entry["history"]),
+                (unit, entry["documents"], entry["response"]),
+                age=max(0.0, now - entry["stored_at"])
+            )
+        with self._lock:
+            self._dirty = False
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: TTLLRUCache statistics plus invalidations and settings
+        """
+        with self._lock:
+            invalidations = self._invalidations
+        return {
+            **self._entries.stats(),
+            "invalidations": invalidations,
+            "similarity_threshold": self.similarity_threshold,
+            "path": self.path
+        }
@@ -0,0 +1,432 @@
+"""
+Lightweight latency tracing for the ICI framework.
+
+This module provides a Tracer that records the duration of named spans
+(pipeline stages such as "query.embed" or "ingestion.store") into
+histograms, reports p50/p95/p99 statistics, and renders them in the
+Prometheus text exposition format or as OTLP/JSON metrics. A
+MetricsExporter periodically writes those renderings to a local file or
+posts them to an OTLP/HTTP collector.
+"""
+
+import asyncio
+import bisect
+import json
+import math
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+# Bucket upper bounds in seconds, covering cache hits up to slow LLM generations
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0
+)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency distribution for one span name.
+
+    Keeps per-bucket counts, sum and count for export, plus a bounded
+    window of recent samples from which percentiles are computed.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 1024):
+        """
+        Initialize the LatencyHistogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds in seconds
+            window: Number of recent samples kept for percentiles
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.buckets = tuple(buckets)
+        self._bucket_counts = [0] * (len(self.buckets) + 1)  # last bucket is +Inf
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds: The measured duration
+            error: Whether the span ended with an exception
+        """
+        with self._lock:
+            self._bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._samples.append(seconds)
+            self.count += 1
+            self.sum += seconds
+            self.max = max(self.max, seconds)
+            if error:
+                self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a consistent copy of the histogram's state.
+
+        Returns:
+            Dict[str, Any]: count, errors, sum, mean, max, p50/p95/p99 over the
+                recent window, and per-bucket (non-cumulative) counts
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            return {
+                "count": self.count,
+                "errors": self.errors,
+                "sum": self.sum,
+                "mean": self.sum / self.count if self.count else 0.0,
+                "max": self.max,
+                "p50": _percentile(samples, 0.50),
+                "p95": _percentile(samples, 0.95),
+                "p99": _percentile(samples, 0.99),
+                "bucket_counts": list(self._bucket_counts)
+            }
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples (0.0 when empty)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class Tracer:
+    """
+    Records span durations into one LatencyHistogram per span name.
+
+    Span names are dotted paths whose first part is the path the stage
+    belongs to, e.g. "query.search" or "ingestion.embed".
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 1024):
+        """
+        Initialize the Tracer.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+            window: Number of recent samples per span kept for percentiles
+        """
+        self.buckets = tuple(buckets)
+        self.window = window
+        self.enabled = True
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = LatencyHistogram(self.buckets, self.window)
+                self._histograms[name] = histogram
+            return histogram
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            name: Span name
+            seconds: The measured duration
+            error: Whether the stage failed
+        """
+        if self.enabled:
+            self._histogram(name).observe(seconds, error)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block and record it under name.
+
+        Works in both synchronous and async code; exceptions are counted as
+        errors and re-raised.
+
+        Args:
+            name: Span name
+        """
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - started, error)
+
+    def stats(self, prefix: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-span latency statistics.
+
+        Args:
+            prefix: Only include spans whose name starts with this prefix
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Span name to count, errors, mean, max,
+                p50, p95 and p99 (seconds)
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+
+        stats = {}
+        for name in sorted(histograms):
+            if prefix and not name.startswith(prefix):
+                continue
+            snapshot = histograms[name].snapshot()
+            snapshot.pop("bucket_counts")
+            snapshot.pop("sum")
+            stats[name] = snapshot
+        return stats
+
+    def reset(self) -> None:
+        """
+        Discard all recorded spans.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._started_at = time.time()
+
+    def to_prometheus(self) -> str:
+        """
+        Render all histograms in the Prometheus text exposition format.
+
+        Returns:
+            str: ici_stage_duration_seconds histograms and ici_stage_errors_total
+                counters, labelled by stage
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+
+        lines = [
+            "# HELP ici_stage_duration_seconds Duration of ICI query and ingestion stages.",
+            "# TYPE ici_stage_duration_seconds histogram"
+        ]
+        errors = []
+        for name in sorted(histograms):
+            snapshot = histograms[name].snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), snapshot["bucket_counts"]):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'ici_stage_duration_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'ici_stage_duration_seconds_sum{{stage="{name}"}} {snapshot["sum"]!r}')
+            lines.append(f'ici_stage_duration_seconds_count{{stage="{name}"}} {snapshot["count"]}')
+            errors.append(f'ici_stage_errors_total{{stage="{name}"}} {snapshot["errors"]}')
+
+        lines.append("# HELP ici_stage_errors_total Stages that ended with an error.")
+        lines.append("# TYPE ici_stage_errors_total counter")
+        lines.extend(errors)
+        return "\n".join(lines) + "\n"
+
+    def to_otlp(self, service_name: str = "ici-core") -> Dict[str, Any]:
+        """
+        Render all histograms as an OTLP/JSON ExportMetricsServiceRequest.
+
+        Args:
+            service_name: Value of the service.name resource attribute
+
+        Returns:
+            Dict[str, Any]: JSON-serializable request body for /v1/metrics
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+            started_at = self._started_at
+
+        now_nanos = str(time.time_ns())
+        data_points = []
+        for name in sorted(histograms):
+            snapshot = histograms[name].snapshot()
+            data_points.append({
+                "attributes": [{"key": "stage", "value": {"stringValue": name}}],
+                "startTimeUnixNano": str(int(started_at * 1e9)),
+                "timeUnixNano": now_nanos,
+                "count": str(snapshot["count"]),
+                "sum": snapshot["sum"],
+                "max": snapshot["max"],
+                "bucketCounts": [str(bucket_count) for bucket_count in snapshot["bucket_counts"]],
+                "explicitBounds": list(self.buckets)
+            })
+
+        return {
+            "resourceMetrics": [{
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]
+                },
+                "scopeMetrics": [{
+                    "scope": {"name": "ici.utils.tracing"},
+                    "metrics": [{
+                        "name": "ici.stage.duration",
+                        "unit": "s",
+                        "description": "Duration of ICI query and ingestion stages",
+                        "histogram": {
+                            "aggregationTemporality": 2,  # cumulative
+                            "dataPoints": data_points
+                        }
+                    }]
+                }]
+            }]
+        }
+
+
+class MetricsExporter:
+    """
+    Periodically exports a Tracer's metrics.
+
+    Supported formats:
+    - "prometheus": writes the text exposition format to path (for the node
+      exporter textfile collector or any file-based scraper)
+    - "otlp": posts OTLP/JSON to endpoint, or appends one JSON request per line
+      to path when no endpoint is configured
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        format: str = "prometheus",
+        path: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        interval_seconds: float = 15.0,
+        service_name: str = "ici-core",
+        timeout_seconds: float = 5.0
+    ):
+        """
+        Initialize the MetricsExporter.
+
+        Args:
+            tracer: The tracer to export
+            format: "prometheus" or "otlp"
+            path: Output file path
+            endpoint: OTLP/HTTP metrics URL, e.g. http://localhost:4318/v1/metrics
+            interval_seconds: Seconds between exports
+            service_name: service.name resource attribute for OTLP
+            timeout_seconds: HTTP timeout for OTLP posts
+        """
+        if format not in ("prometheus", "otlp"):
+            raise ValueError(f"Unknown metrics export format '{format}', expected 'prometheus' or 'otlp'")
+        if format == "prometheus" and not path:
+            raise ValueError("Prometheus export requires a path")
+        if format == "otlp" and not (endpoint or path):
+            raise ValueError("OTLP export requires an endpoint or a path")
+
+        self.tracer = tracer
+        self.format = format
+        self.path = path
+        self.endpoint = endpoint
+        self.interval_seconds = interval_seconds
+        self.service_name = service_name
+        self.timeout_seconds = timeout_seconds
+        self._task: Optional[asyncio.Task] = None
+        
+        # Export outcome counters
+        self.exports = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def export(self) -> None:
+        """
+        Export the current metrics once. Blocking; run off the event loop.
+        """
+        if self.format == "prometheus":
+            self._write_atomic(self.tracer.to_prometheus())
+            return
+
+        body = json.dumps(self.tracer.to_otlp(self.service_name))
+        if self.endpoint:
+            request = urllib.request.Request(
+                self.endpoint,
+                data=body.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+                response.read()
+        else:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(body + "\n")
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get the exporter's configuration and export outcomes.
+
+        Returns:
+            Dict[str, Any]: Format, destination, interval, export/failure counts and last error
+        """
+        return {
+            "format": self.format,
+            "destination": self.endpoint or self.path,
+            "interval_seconds": self.interval_seconds,
+            "running": self._task is not None and not self._task.done(),
+            "exports": self.exports,
+            "failures": self.failures,
+            "last_error": self.last_error
+        }
+
+    def _write_atomic(self, text: str) -> None:
+        # Scrapers must never see a half-written file
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, self.path)
+
+    def start(self) -> None:
+        """
+        Start exporting every interval_seconds in a background task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._export_loop())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and export one final time.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.export)
+        self.exports += 1
+
+    async def _export_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.export)
+                self.exports += 1
+            except Exception as e:
+                # Collector outages must not stop the exporter; the next run retries
+                self.failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+
+
+_default_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer shared by the orchestrator and ingestion pipeline.
+
+    Returns:
+        Tracer: The shared tracer
+    """
+    return _default_tracer
@@ -13,7 +13,7 @@ setup(
         "sentence-transformers>=3.4.1",  # For text embeddings
         "torch>=2.6.0",  # Required for sentence-transformers
         "faiss-cpu>=1.7.0",  # For vector similarity search
-        "chromadb>=0.6.3",  # For ChromaDB vector database
+        "chromadb>=1.0",  # For ChromaDB vector database (dict collection configuration)
         "numpy>=2.2.2",     # Required for vector operations
         "telethon>=1.39.0",  # For Telegram API access
         "logtail-python>=0.3.3",
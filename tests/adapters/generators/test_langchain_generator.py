@@ -4,7 +4,7 @@ Tests for the LangchainGenerator implementation.
 
 import os
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 import asyncio
 from ici.adapters.generators.langchain_generator import LangchainGenerator
@@ -150,4 +150,30 @@ async def test_set_model(generator, mock_config):
                     
                     assert generator._model == "gpt-3.5-turbo"
                     # Verify that a new ChatOpenAI instance was created
-                    assert mock_chat_openai.call_count >= 2 
\ No newline at end of file
+                    assert mock_chat_openai.call_count >= 2 
+
+@pytest.mark.asyncio
+async def test_generate_reuses_cached_client_for_same_options(generator, mock_config):
+    """Test that requests with the same option overrides share one LLM client and chain"""
+    with patch('ici.adapters.generators.langchain_generator.get_component_config', return_value=mock_config):
+        with patch('ici.adapters.generators.langchain_generator.ChatOpenAI') as mock_chat_openai:
+            with patch('ici.adapters.generators.langchain_generator.LLMChain') as mock_chain:
+                with patch('ici.adapters.generators.langchain_generator.ConversationBufferMemory'):
+                    await generator.initialize()
+                    mock_chain.return_value.ainvoke = AsyncMock(return_value={"text": "ok"})
+                    initial_clients = mock_chat_openai.call_count
+                    
+                    for _ in range(3):
+                        assert await generator.generate("Hi", {"temperature": 0.2}) == "ok"
+                    assert mock_chat_openai.call_count == initial_clients + 1
+                    
+                    # Different effective options get their own client
+                    await generator.generate("Hi", {"temperature": 0.3})
+                    assert mock_chat_openai.call_count == initial_clients + 2
+                    
+                    # All OpenAI-compatible clients share the pooled HTTP client
+                    pooled = {call.kwargs["http_async_client"] for call in mock_chat_openai.call_args_list}
+                    assert len(pooled) == 1
+                    
+                    await generator.close()
+                    assert generator._http_async_client is None
@@ -239,4 +239,24 @@ async def test_healthcheck_failure(generator):
         # Verify
         assert health_result["healthy"] is False
         assert "failed" in health_result["message"]
-        assert "error" in health_result["details"] 
\ No newline at end of file
+        assert "error" in health_result["details"] 
+
+@pytest.mark.asyncio
+async def test_generate_stream(generator):
+    """Test streaming yields content deltas and skips empty chunks."""
+    def make_chunk(content):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+    async def fake_stream():
+        for content in ["AI ", None, "is ", "artificial intelligence"]:
+            yield make_chunk(content)
+
+    with patch.object(generator._client.chat.completions, "create",
+                     new_callable=AsyncMock,
+                     return_value=fake_stream()):
+
+        chunks = [chunk async for chunk in generator.generate_stream("Tell me about AI")]
+
+        assert chunks == ["AI ", "is ", "artificial intelligence"]
+        call_kwargs = generator._client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
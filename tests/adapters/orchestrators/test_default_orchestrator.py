@@ -6,6 +6,7 @@ This module contains tests for the DefaultOrchestrator implementation.
 
 import os
 import time
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from typing import Dict, Any, List
@@ -79,6 +80,34 @@ async def orchestrator():
     return orchestrator
 
 
+def make_query_orchestrator() -> DefaultOrchestrator:
+    """
+    Create an initialized orchestrator with stub components for a full query.
+    
+    A query on chat "chat-1" with no earlier messages retrieves one document
+    and generates "Test response". Tests replace individual stubs to script
+    the behavior they check.
+    """
+    orchestrator = DefaultOrchestrator()
+    orchestrator._is_initialized = True
+    orchestrator._user_id_generator = AsyncMock()
+    orchestrator._user_id_generator.validate_id = AsyncMock(return_value=True)
+    orchestrator._chat_history_manager = AsyncMock()
+    orchestrator._chat_history_manager.create_chat = AsyncMock(return_value="chat-1")
+    orchestrator._chat_history_manager.get_messages = AsyncMock(return_value=[])
+    orchestrator._validator = AsyncMock()
+    orchestrator._validator.validate = AsyncMock(return_value=True)
+    orchestrator._embedder = MagicMock()
+    orchestrator._embedder.embed = AsyncMock(return_value=([0.1, 0.2], {}))
+    orchestrator._vector_store = MagicMock()
+    orchestrator._vector_store.search.return_value = [{"id": "1", "text": "Document 1", "score": 0.9}]
+    orchestrator._prompt_builder = AsyncMock()
+    orchestrator._prompt_builder.build_prompt = AsyncMock(return_value="Test prompt")
+    orchestrator._generator = MagicMock()
+    orchestrator._generator.generate = AsyncMock(return_value="Test response")
+    return orchestrator
+
+
 @pytest.mark.asyncio
 async def test_initialization():
     """Test orchestrator initialization."""
@@ -263,4 +292,283 @@ async def test_healthcheck(orchestrator):
     assert health["healthy"] is True
     assert "message" in health
     assert "components" in health
-    assert len(health["components"]) == 4 
\ No newline at end of file
+    assert len(health["components"]) == 4 
+
+@pytest.mark.asyncio
+async def test_embed_query_uses_query_cache():
+    """Repeated queries are embedded once and reported in the cache stats."""
+    orchestrator = DefaultOrchestrator()
+    orchestrator._embedder = MagicMock()
+    orchestrator._embedder.embed = AsyncMock(return_value=([0.1, 0.2], {}))
+
+    first = await orchestrator._embed_query("what did  Alice say?")
+    second = await orchestrator._embed_query("what did Alice say?")
+
+    assert first == second == [0.1, 0.2]
+    orchestrator._embedder.embed.assert_awaited_once()
+    stats = orchestrator._query_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_search_documents_batch_uses_one_embed_and_search_call():
+    """Batch search embeds uncached queries together and searches in one call."""
+    orchestrator = DefaultOrchestrator()
+    orchestrator._is_initialized = True
+    orchestrator._similarity_threshold = 0.5
+    orchestrator._query_cache.set("cached query", [0.9, 0.9])
+    orchestrator._embedder = MagicMock()
+    orchestrator._embedder.embed_batch_array = AsyncMock(
+        return_value=(np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float32), [{}, {}])
+    )
+    orchestrator._vector_store = MagicMock()
+    orchestrator._vector_store.search_batch.return_value = [
+        [{"text": "a", "score": 0.9}, {"text": "b", "score": 0.1}],
+        [{"text": "c", "score": 0.8}],
+        [],
+        [{"text": "d", "score": 0.7}],
+    ]
+
+    results = await orchestrator.search_documents_batch(
+        ["first", "cached  query", "second", "first"], top_k=1
+    )
+
+    assert results == [[{"text": "a", "score": 0.9}], [{"text": "c", "score": 0.8}], [], [{"text": "d", "score": 0.7}]]
+    # Only the distinct uncached queries are embedded, in a single batch
+    orchestrator._embedder.embed_batch_array.assert_awaited_once_with(["first", "second"])
+    call = orchestrator._vector_store.search_batch.call_args
+    assert call.kwargs["num_results"] == 2
+    assert call.kwargs["query_vectors"][1] == [0.9, 0.9]
+    assert call.kwargs["query_vectors"][0] == call.kwargs["query_vectors"][3]
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_vector_and_lexical_results():
+    """Hybrid mode ranks documents found by both searches first and keeps lexical-only hits."""
+    orchestrator = DefaultOrchestrator()
+    orchestrator._configure_retrieval({"mode": "hybrid", "lexical_weight": 0.5, "rrf_k": 60})
+    orchestrator._embedder = MagicMock()
+    orchestrator._embedder.embed = AsyncMock(return_value=([0.1, 0.2], {}))
+    orchestrator._vector_store = MagicMock()
+    orchestrator._vector_store.search.return_value = [
+        {"id": "a", "text": "a", "score": 0.9},
+        {"id": "b", "text": "b", "score": 0.8},
+    ]
+    orchestrator._vector_store.lexical_search.return_value = [
+        {"id": "c", "text": "c", "score": 7.0},
+        {"id": "b", "text": "b", "score": 3.0},
+    ]
+
+    results = await orchestrator._search_documents("invoice 4711", top_k=3)
+
+    assert [doc["id"] for doc in results] == ["b", "a", "c"]
+    assert results[0]["score"] == 0.8  # the vector copy is kept for documents found by both
+    orchestrator._vector_store.lexical_search.assert_called_once_with("invoice 4711", num_results=6, filters=None)
+
+    # A failing lexical search falls back to the vector ranking
+    orchestrator._vector_store.lexical_search.side_effect = RuntimeError("index locked")
+    results = await orchestrator._search_documents("invoice 4711", top_k=3)
+    assert [doc["id"] for doc in results] == ["a", "b"]
+
+@pytest.mark.asyncio
+async def test_search_pushes_filters_and_adapts_overfetch():
+    """Query constraints reach the vector store and over-fetching follows the measured threshold pass rate."""
+    orchestrator = DefaultOrchestrator()
+    orchestrator._similarity_threshold = 0.5
+    orchestrator._embedder = MagicMock()
+    orchestrator._embedder.embed = AsyncMock(return_value=([0.1, 0.2], {}))
+    orchestrator._vector_store = MagicMock()
+    orchestrator._vector_store.search.return_value = [{"id": str(i), "text": str(i), "score": 0.9} for i in range(4)]
+
+    filters = orchestrator._build_search_filters("what was said on whatsapp today?", {"session_id": "cli"})
+    assert filters["$and"][0] == {"source": "whatsapp"}
+    assert orchestrator._build_search_filters("what was said?", {}) is None
+
+    await orchestrator._search_documents("what was said on whatsapp today?", 2, filters)
+    call = orchestrator._vector_store.search.call_args
+    assert call.kwargs["filters"] == filters
+    assert call.kwargs["num_results"] == 4  # initial 2x over-fetch
+
+    # Every result passed the threshold, so later searches with the same filter fields fetch less
+    for _ in range(5):
+        await orchestrator._search_documents("what was said on whatsapp today?", 2, filters)
+    assert orchestrator._vector_store.search.call_args.kwargs["num_results"] == 3
+    assert orchestrator._fetch_size(2, None) == 4
+
+    # Without a threshold nothing is discarded, so nothing is over-fetched
+    orchestrator._similarity_threshold = 0.0
+    assert orchestrator._fetch_size(3, filters) == 3
+
+@pytest.mark.asyncio
+async def test_process_query_stream_yields_chunks_and_stores_response():
+    """Streamed chunks reach the caller as generated and the joined response is stored."""
+    async def fake_stream(prompt, options):
+        for chunk in ["The ", "answer ", "is 42."]:
+            yield chunk
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._generator.generate_stream = fake_stream
+
+    chunks = [
+        chunk async for chunk in orchestrator.process_query_stream(
+            "cli", "test_user", "What is the answer?", {}
+        )
+    ]
+
+    assert chunks == ["The ", "answer ", "is 42."]
+    await orchestrator._wait_for_persistence()
+    stored = orchestrator._chat_history_manager.add_message.call_args_list[-1].kwargs
+    assert stored == {"chat_id": "chat-1", "content": "The answer is 42.", "role": "assistant"}
+
+@pytest.mark.asyncio
+async def test_process_query_stream_flags_incomplete_response_on_mid_stream_failure():
+    """A failure after the first chunk is raised, and the partial response is stored as incomplete."""
+    from ici.core.exceptions import GenerationError
+
+    async def failing_stream(prompt, options):
+        yield "The "
+        raise RuntimeError("connection reset")
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._generator.generate_stream = failing_stream
+
+    chunks = []
+    with pytest.raises(GenerationError):
+        async for chunk in orchestrator.process_query_stream("cli", "test_user", "What is the answer?", {}):
+            chunks.append(chunk)
+
+    assert chunks == ["The "]
+    await orchestrator._wait_for_persistence()
+    stored = orchestrator._chat_history_manager.add_message.call_args_list[-1].kwargs
+    assert stored["content"] == "The "
+    assert stored["metadata"] == {"incomplete": True, "reason": "generation_failed"}
+
+@pytest.mark.asyncio
+async def test_process_query_overlaps_history_with_retrieval_and_defers_persistence():
+    """History loading runs alongside embedding, and the response is returned before it is stored."""
+    import asyncio
+
+    history_loading = asyncio.Event()
+    embedding = asyncio.Event()
+    release_write = asyncio.Event()
+    stored = []
+
+    async def get_messages(chat_id):
+        history_loading.set()
+        await asyncio.wait_for(embedding.wait(), timeout=1)
+        return []
+
+    async def embed(query):
+        embedding.set()
+        await asyncio.wait_for(history_loading.wait(), timeout=1)
+        return [0.1, 0.2], {}
+
+    async def add_message(chat_id, content, role):
+        if role == "assistant":
+            await release_write.wait()
+        stored.append((role, content))
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._chat_history_manager.get_messages = get_messages
+    orchestrator._chat_history_manager.add_message = add_message
+    orchestrator._embedder.embed = embed
+
+    # Would time out if history loading and embedding ran one after the other
+    response = await orchestrator.process_query("cli", "test_user", "What happened?", {})
+
+    assert response == "Test response"
+    assert ("assistant", "Test response") not in stored
+
+    release_write.set()
+    await orchestrator._wait_for_persistence()
+    assert stored[-1] == ("assistant", "Test response")
+    orchestrator._chat_history_manager.generate_title.assert_awaited_once_with("chat-1")
+
+@pytest.mark.asyncio
+async def test_process_query_serves_similar_query_from_response_cache():
+    """A near-duplicate query with the same documents skips generation; new documents do not."""
+    from ici.utils.response_cache import SemanticResponseCache
+
+    vectors = {"What is the answer?": [1.0, 0.0], "what's the answer": [0.99, 0.05]}
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._response_cache = SemanticResponseCache(similarity_threshold=0.95)
+    orchestrator._embedder.embed = AsyncMock(side_effect=lambda query: (vectors[query], {}))
+    orchestrator._generator.generate = AsyncMock(side_effect=["First response", "Second response"])
+
+    assert await orchestrator.process_query("cli", "test_user", "What is the answer?", {}) == "First response"
+    assert await orchestrator.process_query("cli", "test_user", "what's the answer", {}) == "First response"
+    assert orchestrator._generator.generate.await_count == 1
+
+    # Ingestion changed what the query retrieves
+    orchestrator._vector_store.search.return_value = [{"id": "2", "text": "Document 2", "score": 0.9}]
+    assert await orchestrator.process_query("cli", "test_user", "what's the answer", {}) == "Second response"
+    await orchestrator._wait_for_persistence()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_reuses_the_retrieval_query_vector():
+    """With the query cache off, the response cache key does not embed the query again."""
+    from ici.utils.response_cache import SemanticResponseCache
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._query_cache = None
+    orchestrator._response_cache = SemanticResponseCache(similarity_threshold=0.95)
+
+    assert await orchestrator.process_query("cli", "test_user", "What is the answer?", {}) == "Test response"
+    orchestrator._embedder.embed.assert_awaited_once_with("What is the answer?")
+    await orchestrator._wait_for_persistence()
+
+@pytest.mark.asyncio
+async def test_failed_search_is_traced_as_error():
+    """A failing vector search is recorded as an errored query.search span."""
+    from ici.utils.tracing import Tracer
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._tracer = Tracer()
+    orchestrator._vector_store.search.side_effect = RuntimeError("store unavailable")
+
+    assert await orchestrator._search_documents("What is the answer?", top_k=3) == []
+
+    stats = orchestrator._tracer.stats("query.")
+    assert stats["query.search"]["count"] == 1
+    assert stats["query.search"]["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_process_query_keeps_user_message_when_validation_errors():
+    """The user message is still stored when validation raises."""
+    orchestrator = make_query_orchestrator()
+    orchestrator._validator.validate = AsyncMock(side_effect=RuntimeError("rules unavailable"))
+
+    await orchestrator.process_query("cli", "test_user", "What is the answer?", {})
+
+    orchestrator._generator.generate.assert_not_awaited()
+    orchestrator._chat_history_manager.add_message.assert_any_await(
+        chat_id="chat-1", content="What is the answer?", role="user"
+    )
+
+@pytest.mark.asyncio
+async def test_vector_search_runs_off_the_event_loop():
+    """The blocking store query runs in a thread while the history load proceeds on the loop."""
+    import asyncio
+    import threading
+
+    history_loaded = threading.Event()
+    waits = []
+
+    async def get_messages(chat_id):
+        await asyncio.sleep(0.05)
+        history_loaded.set()
+        return []
+
+    def search(**kwargs):
+        # Would time out if the search blocked the event loop the history load runs on
+        waits.append(history_loaded.wait(timeout=1))
+        return [{"id": "1", "text": "Document 1", "score": 0.9}]
+
+    orchestrator = make_query_orchestrator()
+    orchestrator._chat_history_manager.get_messages = get_messages
+    orchestrator._vector_store.search.side_effect = search
+
+    assert await orchestrator.process_query("cli", "test_user", "What is the answer?", {}) == "Test response"
+    assert waits == [True]
+    await orchestrator._wait_for_persistence()
@@ -7,12 +7,14 @@ This test suite tests the ChromaDBStore class using real components:
 - Real logging
 """
 
+import asyncio
 import os
 import unittest
 from unittest.mock import patch, MagicMock, AsyncMock
 import shutil
 import tempfile
 import numpy as np
+import pytest
 from typing import List, Dict, Any
 
 from ici.adapters.vector_stores.chroma import ChromaDBStore
@@ -136,7 +138,6 @@ vector_store:
         # Setup mock collection
         mock_collection = MagicMock()
         mock_collection.name = "test_collection"
-        mock_collection.add = MagicMock()
         
         # Setup client
         mock_client_instance = mock_persistent_client.return_value
@@ -160,11 +161,11 @@ vector_store:
         # Add documents
         self.store.add_documents(documents, vectors)
         
-        # Check that collection.add was called correctly
-        mock_collection.add.assert_called_once()
+        # Check that collection.upsert was called correctly
+        mock_collection.upsert.assert_called_once()
         
         # Verify the correct arguments were passed
-        args, kwargs = mock_collection.add.call_args
+        args, kwargs = mock_collection.upsert.call_args
         self.assertEqual(kwargs["documents"], ["This is a test document"])
         self.assertEqual(kwargs["metadatas"], [{"source": "test", "category": "testing"}])
         self.assertEqual(len(kwargs["embeddings"]), 1)
@@ -388,4 +389,249 @@ vector_store:
             
         # Clear environment variable
         if "ICI_CONFIG_PATH" in os.environ:
-            del os.environ["ICI_CONFIG_PATH"] 
\ No newline at end of file
+            del os.environ["ICI_CONFIG_PATH"] 
+
+@pytest.fixture
+def chroma_store(tmp_path):
+    """Create an initialized ChromaDBStore persisted in a temporary directory."""
+    config = {
+        "type": "chroma",
+        "collection_name": "test_collection",
+        "persist_directory": str(tmp_path / "chroma_db")
+    }
+    with patch('ici.adapters.vector_stores.chroma.get_component_config', return_value=config):
+        store = ChromaDBStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+    return store
+
+
+def make_chunk_document(message_ids: str, text: str) -> Dict[str, Any]:
+    """Create a Telegram-style chunk document."""
+    return {
+        "text": text,
+        "metadata": {"source": "telegram", "chat_id": 42, "message_ids": message_ids}
+    }
+
+
+def test_add_documents_is_idempotent(chroma_store):
+    """Re-adding the same documents replaces them instead of duplicating."""
+    documents = [make_chunk_document("1,2,3", "first window"), make_chunk_document("4,5", "second window")]
+    vectors = [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+
+    first_ids = chroma_store.add_documents(documents, vectors)
+    second_ids = chroma_store.add_documents(documents, vectors)
+
+    assert first_ids == second_ids
+    assert chroma_store.count() == 2
+
+
+def test_add_documents_dedupes_ids_within_batch(chroma_store):
+    """Duplicate IDs in one batch are collapsed, keeping the last document."""
+    documents = [make_chunk_document("1,2", "old text"), make_chunk_document("1,2", "new text")]
+    vectors = [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+
+    ids = chroma_store.add_documents(documents, vectors)
+
+    assert ids[0] == ids[1]
+    assert chroma_store.count() == 1
+    assert chroma_store._collection.get(ids=[ids[0]])["documents"] == ["new text"]
+
+
+def test_add_documents_accepts_float32_array(chroma_store):
+    """A float32 matrix from embed_batch_array is stored and searchable."""
+    documents = [make_chunk_document("1", "apples"), make_chunk_document("2", "oranges")]
+    vectors = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+
+    chroma_store.add_documents(documents, vectors)
+
+    results = chroma_store.search([0.0, 1.0, 0.0], num_results=1)
+    assert results[0]["text"] == "oranges"
+    add_log = next(
+        call.args[0] for call in chroma_store.logger.info.call_args_list
+        if call.args[0]["action"] == "VECTOR_STORE_ADD"
+    )
+    assert "vectors" not in add_log["data"]
+    assert add_log["data"]["dimensions"] == 3
+
+
+def add_chat_documents(store, count: int, chat_id: int):
+    """Add count single-message documents for one chat."""
+    documents = [
+        {"text": f"message {i}", "metadata": {"source": "whatsapp", "chat_id": chat_id, "message_id": i + 1}}
+        for i in range(count)
+    ]
+    store.add_documents(documents, np.random.default_rng(chat_id).random((count, 3), dtype=np.float32))
+
+
+def test_count_uses_native_count_and_pages_filters(chroma_store):
+    """Unfiltered counts avoid reading records; filtered counts page through IDs."""
+    chroma_store._ID_PAGE_SIZE = 2
+    add_chat_documents(chroma_store, 5, chat_id=1)
+    add_chat_documents(chroma_store, 3, chat_id=2)
+
+    with patch.object(chroma_store._collection, "get", wraps=chroma_store._collection.get) as get:
+        assert chroma_store.count() == 8
+        get.assert_not_called()
+
+        assert chroma_store.count({"chat_id": 1}) == 5
+        assert all(call.kwargs["include"] == [] for call in get.call_args_list)
+        assert get.call_count == 3
+
+
+def test_delete_reports_deleted_count(chroma_store):
+    """Deletes by filter and by ID report exactly the removed documents."""
+    chroma_store._ID_PAGE_SIZE = 2
+    add_chat_documents(chroma_store, 5, chat_id=1)
+    add_chat_documents(chroma_store, 3, chat_id=2)
+
+    assert chroma_store.delete(filters={"chat_id": 1}) == 5
+    assert chroma_store.count() == 3
+
+    remaining_id = chroma_store._collection.get(include=[])["ids"][0]
+    assert chroma_store.delete(document_ids=[remaining_id, "missing"]) == 1
+    assert chroma_store.count() == 2
+
+
+def test_search_batch_answers_all_queries_in_one_call(chroma_store):
+    """search_batch issues a single query and matches per-query search() results."""
+    documents = [make_chunk_document("1", "apples"), make_chunk_document("2", "oranges")]
+    chroma_store.add_documents(documents, np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32))
+    queries = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.9, 0.1, 0.0]], dtype=np.float32)
+
+    expected = [chroma_store.search(query.tolist(), num_results=1) for query in queries]
+    with patch.object(chroma_store._collection, "query", wraps=chroma_store._collection.query) as query:
+        results = chroma_store.search_batch(queries, num_results=1)
+
+    assert query.call_count == 1
+    assert [[doc["text"] for doc in result] for result in results] == [["oranges"], ["apples"], ["apples"]]
+    assert results == expected
+    assert chroma_store.search_batch([], num_results=1) == []
+
+
+def test_lexical_search_tracks_adds_and_deletes(tmp_path):
+    """The BM25 index follows upserts and deletes and honours metadata filters."""
+    config = {
+        "type": "chroma",
+        "collection_name": "test_collection",
+        "persist_directory": str(tmp_path / "chroma_db"),
+        "lexical_index": {"enabled": True}
+    }
+    with patch('ici.adapters.vector_stores.chroma.get_component_config', return_value=config):
+        store = ChromaDBStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+
+    documents = [
+        {"text": "ping @jdoe about invoice 4711", "metadata": {"source": "whatsapp", "chat_id": 1, "message_id": 1}},
+        {"text": "invoice paid", "metadata": {"source": "whatsapp", "chat_id": 2, "message_id": 2}},
+    ]
+    ids = store.add_documents(documents, np.eye(2, 3, dtype=np.float32))
+
+    results = store.lexical_search("invoice 4711", num_results=5)
+    assert [doc["id"] for doc in results] == ids
+    assert results[0]["metadata"]["chat_id"] == 1
+    assert [doc["id"] for doc in store.lexical_search("invoice", filters={"chat_id": 2})] == [ids[1]]
+
+    store.delete(document_ids=[ids[0]])
+    assert [doc["id"] for doc in store.lexical_search("invoice")] == [ids[1]]
+
+    # An existing collection is backfilled into a new, empty index
+    config["lexical_index"]["path"] = str(tmp_path / "fresh_index.db")
+    with patch('ici.adapters.vector_stores.chroma.get_component_config', return_value=config):
+        reopened = ChromaDBStore(logger_name="test_vector_store")
+        reopened.logger = MagicMock()
+        asyncio.run(reopened.initialize())
+    assert [doc["id"] for doc in reopened.lexical_search("paid")] == [ids[1]]
+
+
+def test_hnsw_settings_and_rebuild(tmp_path):
+    """Configured HNSW settings apply to new collections and rebuild() migrates vectors."""
+    config = {
+        "type": "chroma",
+        "collection_name": "test_collection",
+        "persist_directory": str(tmp_path / "chroma_db"),
+        "hnsw": {"space": "l2", "M": 8, "ef_search": 20}
+    }
+
+    def open_store():
+        with patch('ici.adapters.vector_stores.chroma.get_component_config', return_value=config):
+            store = ChromaDBStore(logger_name="test_vector_store")
+            store.logger = MagicMock()
+            asyncio.run(store.initialize())
+        return store
+
+    store = open_store()
+    assert store._hnsw_config["max_neighbors"] == 8
+    assert store._hnsw_config["ef_search"] == 20
+    add_chat_documents(store, 6, chat_id=1)
+    store.delete(filters={"message_id": 6})
+    ids = sorted(store._collection.get(include=[])["ids"])
+    vectors = store._collection.get(ids=ids, include=["embeddings"])["embeddings"]
+
+    result = store.rebuild({"space": "cosine", "max_neighbors": 24})
+    assert result["documents"] == 5
+    assert store._hnsw_config["space"] == "cosine"
+    assert store._hnsw_config["max_neighbors"] == 24
+    assert store._hnsw_config["ef_search"] == 20
+    assert store.count() == 5
+    # The same vectors are stored under the same IDs, without re-embedding
+    assert sorted(store._collection.get(include=[])["ids"]) == ids
+    np.testing.assert_allclose(store._collection.get(ids=ids, include=["embeddings"])["embeddings"], vectors, rtol=1e-6)
+    assert len(store.search([1.0, 0.0, 0.0], num_results=3)) == 3
+
+    # Search-time settings change in place; build-time differences ask for a rebuild
+    config["hnsw"] = {"space": "cosine", "max_neighbors": 24, "ef_search": 50, "ef_construction": 300}
+    reopened = open_store()
+    assert reopened.count() == 5
+    assert reopened._hnsw_config["ef_search"] == 50
+    warning = reopened.logger.warning.call_args.args[0]
+    assert warning["action"] == "VECTOR_STORE_HNSW_REBUILD_NEEDED"
+    assert set(warning["data"]["settings"]) == {"ef_construction"}
+
+    config["hnsw"] = {"space": "dot"}
+    with pytest.raises(VectorStoreError):
+        open_store()
+
+
+def test_result_cache_skips_queries_until_a_write(tmp_path):
+    """Repeated searches are served from the cache, and writes invalidate it."""
+    config = {
+        "type": "chroma",
+        "collection_name": "test_collection",
+        "persist_directory": str(tmp_path / "chroma_db"),
+        "result_cache": {"enabled": True}
+    }
+    with patch('ici.adapters.vector_stores.chroma.get_component_config', return_value=config):
+        store = ChromaDBStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+
+    store.add_documents([make_chunk_document("1", "apples")], [[1.0, 0.0, 0.0]])
+    with patch.object(store._collection, "query", wraps=store._collection.query) as query:
+        first = store.search([0.0, 1.0, 0.0], num_results=2)
+        # Float noise below float16 precision maps to the same entry
+        assert store.search([0.0, 1.0000001, 0.0], num_results=2) == first
+        assert query.call_count == 1
+        store.search([0.0, 1.0, 0.0], num_results=2, filters={"chat_id": 42})
+        assert query.call_count == 2
+
+        # New data mid-session is visible immediately
+        store.add_documents([make_chunk_document("2", "oranges")], [[0.0, 1.0, 0.0]])
+        assert store.search([0.0, 1.0, 0.0], num_results=2)[0]["text"] == "oranges"
+        assert query.call_count == 3
+
+        # Batches only send the uncached queries
+        results = store.search_batch(np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]], dtype=np.float32), num_results=2)
+        assert [result[0]["text"] for result in results] == ["oranges", "apples"]
+        assert query.call_count == 4
+        assert len(query.call_args.kwargs["query_embeddings"]) == 1
+
+        store.delete(filters={"message_ids": "2"})
+        assert [doc["text"] for doc in store.search([0.0, 1.0, 0.0], num_results=2)] == ["apples"]
+        assert query.call_count == 5
+
+    # Cached results are copies that callers cannot corrupt
+    store.search([1.0, 0.0, 0.0], num_results=1)[0]["metadata"]["chat_id"] = 0
+    assert store.search([1.0, 0.0, 0.0], num_results=1)[0]["metadata"]["chat_id"] == 42
+    assert store.healthcheck()["details"]["result_cache"]["generation"] == 3
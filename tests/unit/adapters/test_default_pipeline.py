@@ -0,0 +1,315 @@
+"""
+Unit tests for DefaultIngestionPipeline.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+from ici.adapters.pipelines.default import DefaultIngestionPipeline
+
+
+INGESTOR_ID = "@test/ingestor"
+
+
+def fake_vectors(texts):
+    """Embedder output for embed_batch_array: a float32 matrix plus metadata."""
+    return np.full((len(texts), 2), 0.1, dtype=np.float32), [{} for _ in texts]
+
+
+def make_documents(count: int):
+    """Create simple preprocessed documents."""
+    return [
+        {"text": f"document {i}", "metadata": {"source": "test", "index": i}}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def pipeline():
+    """Create a pipeline with mocked shared components and one ingestor."""
+    pipeline = DefaultIngestionPipeline(logger_name="test_pipeline")
+    pipeline.logger = MagicMock()
+    pipeline._is_initialized = True
+    pipeline._batch_size = 4
+
+    pipeline._embedder = MagicMock()
+    pipeline._embedder.embed = AsyncMock(return_value=([0.1, 0.2], {}))
+    pipeline._embedder.embed_batch_array = AsyncMock(side_effect=fake_vectors)
+
+    pipeline._vector_store = MagicMock()
+    pipeline._state_manager = MagicMock()
+    pipeline._state_manager.get_state.return_value = {
+        "last_timestamp": 0,
+        "additional_metadata": {}
+    }
+
+    ingestor = MagicMock()
+    ingestor.fetch_full_data = AsyncMock(return_value={"conversations": {"chat": [{"id": 1}]}})
+    preprocessor = MagicMock()
+    preprocessor.preprocess = AsyncMock(return_value=make_documents(10))
+    pipeline._ingestors[INGESTOR_ID] = {
+        "ingestor": ingestor,
+        "preprocessor": preprocessor
+    }
+
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_run_ingestion_embeds_one_batch_per_slice(pipeline):
+    """Each batch_size slice is embedded with a single embed_batch_array call."""
+    result = await pipeline.run_ingestion(INGESTOR_ID)
+
+    assert result["success"] is True
+    assert result["documents_processed"] == 10
+
+    # 10 documents with batch size 4 -> slices of 4, 4 and 2
+    batch_sizes = [len(call.args[0]) for call in pipeline._embedder.embed_batch_array.call_args_list]
+    assert batch_sizes == [4, 4, 2]
+    pipeline._embedder.embed.assert_not_called()
+    pipeline._embedder.embed_batch.assert_not_called()
+
+    assert pipeline._vector_store.add_documents.call_count == 3
+    first_call = pipeline._vector_store.add_documents.call_args_list[0]
+    assert [doc["text"] for doc in first_call.kwargs["documents"]] == [
+        "document 0", "document 1", "document 2", "document 3"
+    ]
+    vectors = first_call.kwargs["vectors"]
+    assert isinstance(vectors, np.ndarray)
+    assert vectors.shape == (4, 2) and vectors.dtype == np.float32
+
+
+@pytest.mark.asyncio
+async def test_run_ingestion_batch_error_is_isolated(pipeline):
+    """A failing batch is recorded without aborting the remaining batches."""
+    calls = {"count": 0}
+
+    async def flaky_embed_batch_array(texts):
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise RuntimeError("model exploded")
+        return fake_vectors(texts)
+
+    pipeline._embedder.embed_batch_array = AsyncMock(side_effect=flaky_embed_batch_array)
+
+    result = await pipeline.run_ingestion(INGESTOR_ID)
+
+    assert result["success"] is True
+    assert result["documents_processed"] == 6
+    assert len(result["errors"]) == 1
+    assert pipeline._vector_store.add_documents.call_count == 2
+
+
+def test_update_message_stats_handles_conversations():
+    """Message stats are gathered from the 'conversations' format."""
+    pipeline = DefaultIngestionPipeline(logger_name="test_pipeline")
+    stats = {"message_count": 0, "latest_timestamp": 0}
+
+    pipeline._update_message_stats(stats, {
+        "conversations": {
+            "telegram_chat": [{"timestamp": 1700000000}, {"timestamp": 1700000500}],
+            "whatsapp_chat": [{"timestamp": 1700000900000}]
+        }
+    })
+
+    assert stats["message_count"] == 3
+    # WhatsApp millisecond timestamps are converted to seconds
+    assert stats["latest_timestamp"] == 1700000900
+
+
+class FakeStreamingIngestor:
+    """Ingestor yielding one conversation per chunk."""
+
+    def __init__(self, chunk_count: int, fail_after: int = None):
+        self.chunk_count = chunk_count
+        self.fail_after = fail_after
+
+    async def fetch_full_data_stream(self):
+        for i in range(self.chunk_count):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connection lost")
+            yield {"conversations": {f"chat_{i}": [{"id": i, "timestamp": 1700000000 + i}]}}
+
+
+class FakeStreamingPreprocessor:
+    """Preprocessor producing three documents per chunk."""
+
+    async def preprocess_stream(self, raw_chunks):
+        async for raw_data in raw_chunks:
+            chat_id = next(iter(raw_data["conversations"]))
+            yield [
+                {"text": f"{chat_id} document {i}", "metadata": {"chat_id": chat_id}}
+                for i in range(3)
+            ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_ingestion_rebatches_documents(pipeline):
+    """Streamed documents are re-batched to batch_size and state is updated."""
+    pipeline._streaming_enabled = True
+    pipeline._stream_queue_size = 1
+    pipeline._ingestors[INGESTOR_ID] = {
+        "ingestor": FakeStreamingIngestor(chunk_count=3),
+        "preprocessor": FakeStreamingPreprocessor()
+    }
+
+    result = await pipeline.run_ingestion(INGESTOR_ID)
+
+    assert result["success"] is True
+    assert result["documents_processed"] == 9
+
+    # 3 chunks of 3 documents with batch size 4 -> batches of 4, 4 and 1
+    batch_sizes = [len(call.args[0]) for call in pipeline._embedder.embed_batch_array.call_args_list]
+    assert batch_sizes == [4, 4, 1]
+
+    state_call = pipeline._state_manager.set_state.call_args
+    assert state_call.kwargs["last_timestamp"] == 1700000002
+    assert state_call.kwargs["additional_metadata"]["total_messages_processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_ingestion_fetch_error_fails_run(pipeline):
+    """A failing fetch stage stops the other stages and fails the run."""
+    pipeline._streaming_enabled = True
+    pipeline._stream_queue_size = 1
+    pipeline._ingestors[INGESTOR_ID] = {
+        "ingestor": FakeStreamingIngestor(chunk_count=5, fail_after=2),
+        "preprocessor": FakeStreamingPreprocessor()
+    }
+
+    result = await pipeline.run_ingestion(INGESTOR_ID)
+
+    assert result["success"] is False
+    assert "connection lost" in result["errors"][0]
+    pipeline._state_manager.set_state.assert_not_called()
+
+
+class SlowIngestor:
+    """Ingestor whose fetch takes a fixed amount of time."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def fetch_full_data(self):
+        await asyncio.sleep(self.delay)
+        return {"conversations": {"chat": [{"id": 1, "timestamp": 1700000000}]}}
+
+
+def register_slow_ingestors(pipeline, delays):
+    """Replace the fixture ingestor with one slow ingestor per delay."""
+    pipeline._ingestors.clear()
+    for i, delay in enumerate(delays):
+        preprocessor = MagicMock()
+        preprocessor.preprocess = AsyncMock(return_value=make_documents(2))
+        pipeline._ingestors[f"@test/ingestor_{i}"] = {
+            "ingestor": SlowIngestor(delay),
+            "preprocessor": preprocessor
+        }
+
+
+@pytest.mark.asyncio
+async def test_start_runs_ingestors_concurrently(pipeline):
+    """Ingestors overlap up to the concurrency limit and report throughput."""
+    pipeline._max_concurrent_ingestors = 2
+    register_slow_ingestors(pipeline, [0.3, 0.3])
+
+    started = time.perf_counter()
+    results = await pipeline.start()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.55
+    assert set(results) == {"@test/ingestor_0", "@test/ingestor_1"}
+    for result in results.values():
+        assert result["success"] is True
+        assert result["documents_processed"] == 2
+        assert result["documents_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_start_respects_concurrency_limit(pipeline):
+    """With a limit of one the ingestors run one after another."""
+    pipeline._max_concurrent_ingestors = 1
+    register_slow_ingestors(pipeline, [0.2, 0.2])
+
+    started = time.perf_counter()
+    await pipeline.start()
+
+    assert time.perf_counter() - started >= 0.4
+
+
+@pytest.mark.asyncio
+async def test_start_isolates_timeouts(pipeline):
+    """A timed-out ingestor does not affect the others."""
+    register_slow_ingestors(pipeline, [5, 0])
+    pipeline._ingestor_timeouts["@test/ingestor_0"] = 0.1
+
+    results = await pipeline.start()
+
+    assert results["@test/ingestor_0"]["success"] is False
+    assert results["@test/ingestor_0"]["timed_out"] is True
+    assert results["@test/ingestor_1"]["success"] is True
+
+
+async def run_schedule_loop(pipeline, ticks: int):
+    """Run the schedule loop for a number of ticks, recording each wait."""
+    delays = []
+
+    async def fake_sleep(delay):
+        if len(delays) == ticks:
+            raise asyncio.CancelledError()
+        delays.append(delay)
+
+    with patch("ici.adapters.pipelines.default.asyncio.sleep", side_effect=fake_sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await pipeline._schedule_loop(INGESTOR_ID, interval_seconds=60)
+
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_schedule_loop_backs_off_after_failures(pipeline):
+    """Failures double the wait up to the cap and a success resets it."""
+    pipeline._schedule_jitter_ratio = 0
+    pipeline._schedule_max_backoff_minutes = 3
+    pipeline.run_ingestion = AsyncMock(side_effect=[
+        {"success": False},
+        RuntimeError("boom"),
+        {"success": False},
+        {"success": True},
+        {"success": True},
+    ])
+
+    delays = await run_schedule_loop(pipeline, ticks=5)
+
+    assert delays == [60, 120, 180, 180, 60]
+    assert pipeline.run_ingestion.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_schedule_loop_skips_running_ingestor(pipeline):
+    """A tick is skipped while the ingestor is still running."""
+    pipeline._schedule_jitter_ratio = 0
+    pipeline.run_ingestion = AsyncMock(return_value={"success": True})
+    pipeline._running_ingestors.add(INGESTOR_ID)
+
+    await run_schedule_loop(pipeline, ticks=3)
+
+    pipeline.run_ingestion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_scheduler(pipeline):
+    """stop() cancels every background schedule loop."""
+    await pipeline.start_scheduler()
+    tasks = list(pipeline._scheduler_tasks.values())
+    assert len(tasks) == 1
+
+    pipeline.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(task.cancelled() for task in tasks)
+    assert pipeline._scheduler_tasks == {}
@@ -0,0 +1,64 @@
+"""
+Unit tests for the SQLite-backed EmbeddingCache.
+"""
+
+import pytest
+
+from ici.adapters.embedders.cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an initialized cache in a temporary directory."""
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache" / "embeddings.db"), max_entries=3)
+    cache.initialize()
+    yield cache
+    cache.close()
+
+
+def test_round_trip_and_counters(cache):
+    """Stored vectors are returned as float32 values and hits/misses are counted."""
+    cache.put_many("model-a", ["hello", "world"], [[0.5, 0.25], [1.0, -1.0]])
+
+    results = cache.get_many("model-a", ["hello", "missing", "world"])
+
+    assert results == [[0.5, 0.25], None, [1.0, -1.0]]
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+
+
+def test_entries_are_scoped_by_model(cache):
+    """The same text embedded by another model is a miss."""
+    cache.put_many("model-a", ["hello"], [[0.5, 0.25]])
+
+    assert cache.get_many("model-b", ["hello"]) == [None]
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    """Exceeding max_entries evicts the entries accessed longest ago."""
+    cache.put_many("model-a", ["one", "two", "three"], [[1.0], [2.0], [3.0]])
+    # Touch "one" so that "two" becomes the least recently used entry
+    cache.get_many("model-a", ["one"])
+
+    cache.put_many("model-a", ["four"], [[4.0]])
+
+    assert cache.count() == 3
+    assert cache.get_many("model-a", ["one", "two", "three", "four"]) == [[1.0], None, [3.0], [4.0]]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_close_closes_every_thread_connection(cache):
+    """Connections opened by worker threads are closed too, and later use reconnects."""
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache.put_many("model-a", ["hello"], [[0.5, 0.25]])
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker_connection = pool.submit(cache._get_connection).result()
+        cache.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            pool.submit(worker_connection.execute, "SELECT 1").result()
+        assert pool.submit(cache.get_many, "model-a", ["hello"]).result() == [[0.5, 0.25]]
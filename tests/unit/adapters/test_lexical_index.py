@@ -0,0 +1,71 @@
+"""
+Unit tests for the SQLite FTS5-backed LexicalIndex.
+"""
+
+import pytest
+
+from ici.adapters.vector_stores.lexical_index import LexicalIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an initialized index in a temporary directory."""
+    index = LexicalIndex(db_path=str(tmp_path / "lexical" / "index.db"))
+    index.initialize()
+    yield index
+    index.close()
+
+
+def test_search_ranks_exact_terms(index):
+    """Names, handles and URLs are matched and rarer terms rank higher."""
+    index.add_many(
+        ["a", "b", "c"],
+        [
+            "ask @jdoe about the invoice",
+            "the invoice is at https://example.com/inv/4711",
+            "lunch tomorrow?",
+        ]
+    )
+
+    assert [doc_id for doc_id, _ in index.search("what did @jdoe say?")] == ["a"]
+    assert [doc_id for doc_id, _ in index.search("example.com 4711")] == ["b"]
+    results = index.search("invoice jdoe")
+    assert [doc_id for doc_id, _ in results] == ["a", "b"]
+    assert results[0][1] > results[1][1] > 0
+
+
+def test_upsert_and_delete_are_incremental(index):
+    """Re-adding an ID replaces its text and deleted IDs stop matching."""
+    index.add_many(["a", "b"], ["old words", "other words"])
+    index.add_many(["a"], ["new words"])
+
+    assert index.count() == 2
+    assert index.search("old") == []
+    assert [doc_id for doc_id, _ in index.search("new")] == ["a"]
+
+    assert index.delete_many(["a", "missing"]) == 1
+    assert [doc_id for doc_id, _ in index.search("words")] == ["b"]
+
+
+def test_query_syntax_is_escaped(index):
+    """FTS5 operators and punctuation in queries are treated as plain terms."""
+    index.add_many(["a"], ['he said "NOT" AND left'])
+
+    assert LexicalIndex.build_match_query('NOT "quoted" (x) *') == '"not" OR "quoted" OR "x"'
+    assert [doc_id for doc_id, _ in index.search('NOT AND')] == ["a"]
+    assert index.search("?!") == []
+
+
+def test_close_closes_every_thread_connection(index):
+    """Connections opened by worker threads are closed too, and later use reconnects."""
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+
+    index.add_many(["a"], ["hello world"])
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker_connection = pool.submit(index._get_connection).result()
+        index.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            pool.submit(worker_connection.execute, "SELECT 1").result()
+        assert pool.submit(index.count).result() == 1
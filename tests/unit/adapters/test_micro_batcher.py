@@ -0,0 +1,106 @@
+"""
+Unit tests for MicroBatchingEmbedder.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from ici.adapters.embedders.micro_batcher import MicroBatchingEmbedder
+from ici.core.exceptions import EmbeddingError
+
+
+class RecordingEmbedder:
+    """Embedder stub recording every embed_batch call."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+        self.closed = False
+
+    async def initialize(self):
+        pass
+
+    async def embed_batch_array(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise EmbeddingError("model exploded")
+        vectors = np.array([[float(len(text))] for text in texts], dtype=np.float32)
+        return vectors, [{"text_length": len(text)} for text in texts]
+
+    async def close(self):
+        self.closed = True
+
+
+def make_batcher(inner, **kwargs):
+    batcher = MicroBatchingEmbedder(inner, **kwargs)
+    batcher.logger = MagicMock()
+    return batcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeds_share_one_batch():
+    """Concurrent embed() calls are encoded together and resolved individually."""
+    inner = RecordingEmbedder()
+    batcher = make_batcher(inner, max_batch_size=8, max_wait_ms=20)
+
+    results = await asyncio.gather(*(batcher.embed("x" * n) for n in range(1, 4)))
+
+    assert inner.calls == [["x", "xx", "xxx"]]
+    assert [vector for vector, _ in results] == [[1.0], [2.0], [3.0]]
+    assert batcher.stats()["query_items"] == 3
+    await batcher.close()
+    assert inner.closed is True
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size():
+    """Bulk requests are split at max_batch_size and stacked back into one array."""
+    inner = RecordingEmbedder()
+    batcher = make_batcher(inner, max_batch_size=4, max_wait_ms=0)
+
+    results = await batcher.embed_batch([f"doc {i}" for i in range(10)])
+
+    assert len(results) == 10
+    assert [len(call) for call in inner.calls] == [4, 4, 2]
+
+    vectors, metadatas = await batcher.embed_batch_array(["a", "bbb"])
+    assert vectors.dtype == np.float32 and vectors.shape == (2, 1)
+    assert vectors[:, 0].tolist() == [1.0, 3.0]
+    assert metadatas[1] == {"text_length": 3}
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_queries_are_served_before_bulk_traffic():
+    """A query queued behind a backfill joins the next batch ahead of bulk texts."""
+    inner = RecordingEmbedder()
+    batcher = make_batcher(inner, max_batch_size=4, max_wait_ms=0)
+
+    bulk = asyncio.create_task(batcher.embed_batch([f"doc {i}" for i in range(12)]))
+    await asyncio.sleep(0)
+    query = asyncio.create_task(batcher.embed("query"))
+    await asyncio.gather(bulk, query)
+
+    # The query waits for at most the batch already in flight, then goes first
+    query_call = next(i for i, call in enumerate(inner.calls) if "query" in call)
+    assert query_call <= 1
+    assert inner.calls[query_call][0] == "query"
+    assert len(inner.calls) == 4
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    """A failing model call fails each request in the batch."""
+    batcher = make_batcher(RecordingEmbedder(fail=True), max_batch_size=8, max_wait_ms=10)
+
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, EmbeddingError) for result in results)
+    await batcher.close()
@@ -0,0 +1,213 @@
+"""
+Unit tests for the NumPy vector store adapter.
+"""
+
+import asyncio
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from ici.adapters.vector_stores.numpy_store import NumpyVectorStore
+from ici.adapters.vector_stores.factory import create_vector_store
+from ici.core.exceptions import ConfigurationError, VectorStoreError
+
+
+def open_store(path, index=None) -> NumpyVectorStore:
+    """Create and initialize a NumpyVectorStore persisted in path."""
+    config = {"type": "numpy", "persist_directory": str(path), "index": index or {"type": "flat"}}
+    with patch('ici.adapters.vector_stores.numpy_store.get_component_config', return_value=config):
+        store = NumpyVectorStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+    return store
+
+
+def make_documents(count: int, chat_id: str = "chat"):
+    """Create single-message documents with numeric and string metadata."""
+    return [
+        {
+            "text": f"{chat_id} message {i}",
+            "metadata": {"source": "whatsapp", "chat_id": chat_id, "message_id": i + 1, "timestamp": 1000 + i}
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return open_store(tmp_path / "numpy_db")
+
+
+def test_search_matches_brute_force_cosine(store):
+    """Top-k results and scores match an exact cosine ranking."""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((200, 16)).astype(np.float32)
+    store.add_documents(make_documents(200), vectors)
+
+    query = rng.standard_normal(16).astype(np.float32)
+    results = store.search(query.tolist(), num_results=5)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+    assert [doc["text"] for doc in results] == [f"chat message {i}" for i in expected]
+    assert results[0]["score"] >= results[-1]["score"]
+    assert results[0]["metadata"]["message_id"] == expected[0] + 1
+
+    batch = store.search_batch(np.stack([query, query]), num_results=5)
+    for batch_results in batch:
+        assert [doc["id"] for doc in batch_results] == [doc["id"] for doc in results]
+        assert [doc["score"] for doc in batch_results] == pytest.approx([doc["score"] for doc in results])
+
+
+def test_filters_and_upserts(store):
+    """Metadata filters narrow results and re-adding a document replaces it."""
+    vectors = np.eye(4, dtype=np.float32)
+    store.add_documents(make_documents(2, "a") + make_documents(2, "b"), vectors)
+
+    assert store.count() == 4
+    assert store.count({"chat_id": "a"}) == 2
+    assert store.count({"timestamp": {"$gte": 1001}}) == 2
+    assert store.count({"$or": [{"chat_id": "a"}, {"message_id": {"in": [2]}}]}) == 3
+    assert store.count({"missing_field": "x"}) == 0
+
+    results = store.search([0.0, 0.0, 1.0, 0.0], num_results=4, filters={"chat_id": "a"})
+    assert {doc["metadata"]["chat_id"] for doc in results} == {"a"}
+
+    replacement = make_documents(1, "a")
+    replacement[0]["text"] = "edited"
+    store.add_documents(replacement, [[0.0, 0.0, 0.0, 1.0]])
+    assert store.count() == 4
+    assert store.search([0.0, 0.0, 0.0, 1.0], num_results=1)[0]["text"] == "edited"
+
+
+def test_delete_and_reopen(tmp_path):
+    """Writes survive a cold open with and without compaction."""
+    path = tmp_path / "numpy_db"
+    store = open_store(path)
+    store.add_documents(make_documents(3, "a") + make_documents(3, "b"), np.eye(6, dtype=np.float32))
+    assert store.delete(filters={"chat_id": "b"}) == 3
+    assert store.delete(document_ids=["unknown"]) == 0
+
+    # Reopen from the change log without closing
+    reopened = open_store(path)
+    assert reopened.count() == 3
+    assert reopened.search([1.0, 0, 0, 0, 0, 0], num_results=1)[0]["text"] == "a message 0"
+
+    # close() compacts tombstoned rows into a fresh snapshot
+    reopened.close()
+    compacted = open_store(path)
+    assert compacted.count() == 3
+    assert compacted.count({"chat_id": "b"}) == 0
+    assert compacted.search([0, 0, 1.0, 0, 0, 0], num_results=1)[0]["text"] == "a message 2"
+
+
+def test_ivf_index_finds_nearest_neighbours(tmp_path):
+    """IVF mode trains partitions and still returns the exact match."""
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((500, 8)).astype(np.float32)
+    store = open_store(tmp_path / "ivf_db", index={"type": "ivf", "nlist": 8, "nprobe": 2, "min_train_size": 100})
+    store.add_documents(make_documents(500), vectors)
+
+    assert store.healthcheck()["details"]["ivf_partitions"] == 8
+    for i in (0, 123, 499):
+        assert store.search(vectors[i].tolist(), num_results=1)[0]["text"] == f"chat message {i}"
+
+    reopened = open_store(tmp_path / "ivf_db", index={"type": "ivf", "nlist": 8, "nprobe": 2, "min_train_size": 100})
+    assert reopened.search(vectors[42].tolist(), num_results=1)[0]["text"] == "chat message 42"
+
+
+def test_create_vector_store_selects_backend():
+    """The factory picks the backend named in vector_stores.backend."""
+    with patch('ici.adapters.vector_stores.factory.get_component_config', return_value={"backend": "numpy"}):
+        assert isinstance(create_vector_store(), NumpyVectorStore)
+
+    with patch('ici.adapters.vector_stores.factory.get_component_config', return_value={"backend": "faiss"}):
+        with pytest.raises(ConfigurationError):
+            create_vector_store()
+
+
+def test_list_metadata_and_missing_fields(store):
+    """'in' matches list-valued metadata and 'ne' never matches rows missing the field."""
+    documents = make_documents(3)
+    documents[0]["metadata"]["tags"] = [1, "work"]
+    documents[1]["metadata"]["tags"] = [2]
+    store.add_documents(documents, np.eye(3, dtype=np.float32))
+
+    assert store.count({"tags": {"$in": [1]}}) == 1
+    assert store.count({"tags": {"$in": ["work", 2]}}) == 2
+    assert store.count({"tags": {"$nin": [1]}}) == 1
+    assert store.count({"tags": {"$in": [[2]]}}) == 0
+    assert store.count({"tags": [2]}) == 1
+    assert store.count({"timestamp": {"$ne": "x"}}) == 3
+    assert store.count({"tags": {"$ne": "x"}}) == 2
+
+
+def test_change_log_is_compacted_past_threshold(tmp_path):
+    """Writes fold the change log into a snapshot once it reaches max_log_entries."""
+    path = tmp_path / "numpy_db"
+    config = {"type": "numpy", "persist_directory": str(path), "max_log_entries": 4}
+    with patch('ici.adapters.vector_stores.numpy_store.get_component_config', return_value=config):
+        store = NumpyVectorStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+
+    store.add_documents(make_documents(3), np.eye(3, dtype=np.float32))
+    assert store.delete(document_ids=[store.search([1.0, 0, 0], num_results=1)[0]["id"]]) == 1
+    assert store._log_entries == 0
+    assert store._size == 2
+
+    store.add_documents(make_documents(1, "b"), [[0, 0, 1.0]])
+    reopened = open_store(path)
+    assert reopened.count() == 3
+    assert reopened.search([0, 1.0, 0], num_results=1)[0]["text"] == "chat message 1"
+
+
+def test_interrupted_compaction_keeps_consistent_files(tmp_path):
+    """A crash before the new snapshot is written leaves the previous files in use."""
+    path = tmp_path / "numpy_db"
+    store = open_store(path)
+    store.add_documents(make_documents(4), np.eye(4, dtype=np.float32))
+    store.delete(filters={"message_id": {"$in": [1, 2]}})
+
+    with patch.object(NumpyVectorStore, "_write_snapshot", side_effect=OSError("disk full")):
+        with pytest.raises(VectorStoreError):
+            store.compact()
+
+    reopened = open_store(path)
+    assert reopened.count() == 2
+    assert reopened.search([0, 0, 0, 1.0], num_results=1)[0]["text"] == "chat message 3"
+    assert sorted(p.name for p in path.glob("vectors*")) == ["vectors.npy"]
+
+    # A change log already folded into the snapshot is not replayed on the next open
+    reopened.add_documents(make_documents(1, "b"), [[1.0, 0, 0, 0]])
+    reopened.delete(filters={"chat_id": "b"})
+    log_path = path / "metadata.log.jsonl"
+    folded_log = log_path.read_text()
+    reopened.compact()
+    log_path.write_text(folded_log)
+
+    recovered = open_store(path)
+    assert recovered.count() == 2
+    assert recovered._size == 2
+
+
+def test_concurrent_writes_and_searches(store):
+    """Searches running alongside writes and deletes see consistent rows."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    store.add_documents(make_documents(10, "seed"), np.random.default_rng(0).standard_normal((10, 8)))
+
+    def write(batch):
+        vectors = np.random.default_rng(batch).standard_normal((50, 8))
+        store.add_documents(make_documents(50, f"chat{batch}"), vectors)
+        store.delete(filters={"chat_id": f"chat{batch}", "message_id": {"$lte": 25}})
+
+    def read(_):
+        for doc in store.search(np.ones(8).tolist(), num_results=20):
+            assert doc["id"] is not None and doc["text"] is not None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: write(i) if i % 2 else read(i), range(40)))
+
+    assert store.count() == 10 + 20 * 25
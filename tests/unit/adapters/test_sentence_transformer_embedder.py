@@ -6,6 +6,8 @@ import unittest
 import pytest
 import pytest_asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+import time
 import numpy as np
 from typing import List, Dict, Any
 
@@ -296,4 +298,182 @@ class TestSentenceTransformerEmbedder(unittest.TestCase):
         # Verify not healthy
         self.assertFalse(health["healthy"])
         self.assertEqual(health["message"], "Embedder not initialized")
-        self.assertEqual(health["details"]["initialized"], False) 
\ No newline at end of file
+        self.assertEqual(health["details"]["initialized"], False) 
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_embed_batch_uses_configured_batch_size(mock_sentence_transformer, mock_get_component_config):
+    """The configured batch_size is forwarded to a single encode call."""
+    mock_model = MagicMock()
+    mock_model.get_sentence_embedding_dimension.return_value = 3
+    mock_model.encode.return_value = np.zeros((5, 3), dtype=np.float32)
+    mock_sentence_transformer.return_value = mock_model
+    mock_get_component_config.return_value = {"model_name": "test-model", "batch_size": 16}
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await embedder.initialize()
+
+    results = await embedder.embed_batch([f"text {i}" for i in range(5)])
+
+    assert len(results) == 5
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.kwargs["batch_size"] == 16
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_embed_batch_only_encodes_cache_misses(mock_sentence_transformer, mock_get_component_config, tmp_path):
+    """Cached texts skip the model and duplicate misses are encoded once."""
+    mock_model = MagicMock()
+    mock_model.get_sentence_embedding_dimension.return_value = 2
+    mock_model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(text)), 1.0] for text in texts], dtype=np.float32
+    )
+    mock_sentence_transformer.return_value = mock_model
+    mock_get_component_config.return_value = {
+        "model_name": "test-model",
+        "cache": {"enabled": True, "path": str(tmp_path / "cache.db"), "max_entries": 100}
+    }
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await embedder.initialize()
+
+    first = await embedder.embed_batch(["a", "bb", "a"])
+    assert mock_model.encode.call_args.args[0] == ["a", "bb"]
+    assert [metadata["cached"] for _, metadata in first] == [False, False, False]
+
+    second = await embedder.embed_batch(["bb", "ccc", "a"])
+    assert mock_model.encode.call_args.args[0] == ["ccc"]
+    assert [vector for vector, _ in second] == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+    assert [metadata["cached"] for _, metadata in second] == [True, False, True]
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_embed_batch_does_not_block_event_loop(mock_sentence_transformer, mock_get_component_config):
+    """Encoding runs on the embedder's thread pool while the loop keeps ticking."""
+    def slow_encode(texts, **kwargs):
+        time.sleep(0.3)
+        return np.zeros((len(texts), 3), dtype=np.float32)
+
+    mock_model = MagicMock()
+    mock_model.get_sentence_embedding_dimension.return_value = 3
+    mock_model.encode.side_effect = slow_encode
+    mock_sentence_transformer.return_value = mock_model
+    mock_get_component_config.return_value = {"model_name": "test-model", "num_workers": 2}
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await embedder.initialize()
+    assert embedder._executor._max_workers == 2
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        results = await embedder.embed_batch(["a", "b"])
+    finally:
+        ticker_task.cancel()
+        await embedder.close()
+
+    assert len(results) == 2
+    assert ticks >= 10
+    assert embedder._executor is None
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_embed_batch_encodes_in_one_call(mock_sentence_transformer, mock_get_component_config):
+    """All texts go to the model in one encode() call, which batches them itself, without re-tokenizing."""
+    mock_model = MagicMock()
+    mock_model.get_sentence_embedding_dimension.return_value = 1
+    mock_model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(text.split()))] for text in texts], dtype=np.float32
+    )
+    mock_sentence_transformer.return_value = mock_model
+    mock_get_component_config.return_value = {"model_name": "test-model", "batch_size": 2}
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await embedder.initialize()
+
+    texts = ["a b c d e", "a", "a b c d", "a b"]
+    results = await embedder.embed_batch(texts)
+
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.args[0] == texts
+    assert mock_model.encode.call_args.kwargs["batch_size"] == 2
+    mock_model.tokenizer.assert_not_called()
+    assert [vector for vector, _ in results] == [[5.0], [1.0], [4.0], [2.0]]
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_onnx_backend_exports_once(mock_sentence_transformer, mock_get_component_config, tmp_path):
+    """The ONNX export is saved on first load and reused afterwards."""
+    mock_model = MagicMock()
+    mock_model.get_sentence_embedding_dimension.return_value = 3
+    mock_model.save_pretrained.side_effect = lambda path: (tmp_path / "models" / "org__model-onnx").mkdir(parents=True)
+    mock_sentence_transformer.return_value = mock_model
+    mock_get_component_config.return_value = {
+        "model_name": "org/model",
+        "backend": "onnx",
+        "backend_cache_dir": str(tmp_path / "models")
+    }
+
+    first = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await first.initialize()
+    second = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await second.initialize()
+
+    export_path = str(tmp_path / "models" / "org__model-onnx")
+    assert mock_sentence_transformer.call_args_list[0].args == ("org/model",)
+    assert mock_sentence_transformer.call_args_list[0].kwargs["backend"] == "onnx"
+    mock_model.save_pretrained.assert_called_once_with(export_path)
+    assert mock_sentence_transformer.call_args_list[1].args == (export_path,)
+    assert second._cache_model_key == "org/model:onnx"
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.torch.ao.quantization.quantize_dynamic')
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_int8_backend_quantizes_on_cpu(mock_sentence_transformer, mock_get_component_config, mock_quantize):
+    """The int8 backend dynamically quantizes the fp32 model on CPU."""
+    fp32_model = MagicMock()
+    quantized_model = MagicMock()
+    quantized_model.get_sentence_embedding_dimension.return_value = 3
+    mock_sentence_transformer.return_value = fp32_model
+    mock_quantize.return_value = quantized_model
+    mock_get_component_config.return_value = {"model_name": "test-model", "backend": "int8"}
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    await embedder.initialize()
+
+    mock_sentence_transformer.assert_called_once_with("test-model", device="cpu")
+    assert mock_quantize.call_args.args[0] is fp32_model
+    assert embedder._model is quantized_model
+    assert embedder._cache_model_key == "test-model:int8"
+
+
+@pytest.mark.asyncio
+@patch('ici.adapters.embedders.sentence_transformer.get_component_config')
+@patch('ici.adapters.embedders.sentence_transformer.SentenceTransformer')
+async def test_unknown_backend_is_rejected(mock_sentence_transformer, mock_get_component_config):
+    """An unsupported backend fails initialization."""
+    mock_get_component_config.return_value = {"model_name": "test-model", "backend": "tensorrt"}
+
+    embedder = SentenceTransformerEmbedder(logger_name="test_embedder")
+    with pytest.raises(EmbeddingError):
+        await embedder.initialize()
+
+    mock_sentence_transformer.assert_not_called()
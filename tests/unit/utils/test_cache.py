@@ -0,0 +1,75 @@
+"""
+Unit tests for TTLLRUCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ici.utils.cache import TTLLRUCache
+
+
+def test_get_returns_cached_value_and_counts_hits():
+    """Hits and misses are counted and reflected in the hit rate."""
+    cache = TTLLRUCache(max_size=2)
+
+    assert cache.get("a") is None
+    cache.set("a", [0.1])
+    assert cache.get("a") == [0.1]
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Reading an entry protects it from eviction."""
+    cache = TTLLRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entries_are_dropped():
+    """Entries older than ttl_seconds count as misses."""
+    cache = TTLLRUCache(max_size=2, ttl_seconds=10)
+
+    with patch("ici.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("ici.utils.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == 1
+    with patch("ici.utils.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalid_max_size():
+    """A cache must hold at least one entry."""
+    with pytest.raises(ValueError):
+        TTLLRUCache(max_size=0)
+
+
+def test_items_and_pop_do_not_count_lookups():
+    """items() skips expired entries and, like pop(), leaves counters and recency alone."""
+    cache = TTLLRUCache(max_size=2, ttl_seconds=10)
+
+    with patch("ici.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1, age=8)
+        cache.set("b", 2)
+    with patch("ici.utils.cache.time.monotonic", return_value=105.0):
+        assert cache.items() == [("b", 2, 5.0)]
+        assert cache.pop("b") == 2
+        assert cache.pop("b") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == stats["misses"] == 0
+    assert stats["expirations"] == 1
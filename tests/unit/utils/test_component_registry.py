@@ -0,0 +1,102 @@
+"""
+Unit tests for ComponentRegistry.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from ici.utils.component_registry import ComponentRegistry
+
+
+@pytest.mark.asyncio
+async def test_acquire_returns_one_instance_per_key():
+    """Concurrent acquires of the same key share a single instance."""
+    registry = ComponentRegistry()
+    created = []
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        created.append(object())
+        return created[-1]
+
+    first, second = await asyncio.gather(
+        registry.acquire("embedders.sentence_transformer", factory),
+        registry.acquire("embedders.sentence_transformer", factory)
+    )
+
+    assert first is second
+    assert len(created) == 1
+    assert registry.keys() == ["embedders.sentence_transformer"]
+
+
+@pytest.mark.asyncio
+async def test_release_closes_after_last_reference():
+    """The instance is closed only when every holder has released it."""
+    registry = ComponentRegistry()
+    component = MagicMock()
+    component.close = AsyncMock()
+
+    async def factory():
+        return component
+
+    await registry.acquire("vector_stores.chroma", factory)
+    await registry.acquire("vector_stores.chroma", factory)
+
+    await registry.release("vector_stores.chroma")
+    component.close.assert_not_awaited()
+    assert registry.get("vector_stores.chroma") is component
+
+    await registry.release("vector_stores.chroma")
+    component.close.assert_awaited_once()
+    assert registry.get("vector_stores.chroma") is None
+
+
+@pytest.mark.asyncio
+async def test_release_supports_sync_close_and_unknown_keys():
+    """Synchronous close() methods are called and unknown keys are ignored."""
+    registry = ComponentRegistry()
+    component = MagicMock()
+
+    async def factory():
+        return component
+
+    await registry.acquire("state_manager", factory)
+    await registry.release("state_manager")
+    await registry.release("missing")
+
+    component.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_release_all_releases_only_its_own_references():
+    """release_all() drops one owner's references, keeps going past errors and empties the handle."""
+    registry = ComponentRegistry()
+    embedder = MagicMock()
+    store = MagicMock()
+    store.close = AsyncMock(side_effect=RuntimeError("close failed"))
+
+    async def make_embedder():
+        return embedder
+
+    async def make_store():
+        return store
+
+    orchestrator = registry.handle()
+    pipeline = registry.handle()
+    await orchestrator.acquire("embedders.sentence_transformer", make_embedder)
+    await orchestrator.acquire("vector_stores.chroma", make_store)
+    await pipeline.acquire("embedders.sentence_transformer", make_embedder)
+    assert orchestrator.keys() == ["embedders.sentence_transformer", "vector_stores.chroma"]
+
+    errors = await orchestrator.release_all()
+
+    assert list(errors) == ["vector_stores.chroma"]
+    assert orchestrator.keys() == []
+    embedder.close.assert_not_called()
+    assert registry.get("embedders.sentence_transformer") is embedder
+
+    assert await orchestrator.release_all() == {}
+    assert await pipeline.release_all() == {}
+    embedder.close.assert_called_once()
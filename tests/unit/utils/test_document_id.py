@@ -0,0 +1,34 @@
+"""
+Unit tests for deterministic document IDs.
+"""
+
+from ici.utils.document_id import generate_document_id
+
+
+def test_id_is_stable_for_same_messages():
+    """The same source, chat and messages always map to the same ID."""
+    document = {"text": "a", "metadata": {"source": "telegram", "chat_id": 1, "message_ids": "1,2,3"}}
+    edited = {"text": "b", "metadata": {"source": "telegram", "chat_id": 1, "message_ids": "1,2,3"}}
+
+    assert generate_document_id(document) == generate_document_id(edited)
+    assert generate_document_id(document).startswith("telegram_")
+
+
+def test_id_differs_across_chats_and_windows():
+    """Different chats or message ranges produce different IDs."""
+    base = {"text": "a", "metadata": {"source": "whatsapp", "chat_id": "x", "message_id": "m1"}}
+    other_chat = {"text": "a", "metadata": {"source": "whatsapp", "chat_id": "y", "message_id": "m1"}}
+    other_message = {"text": "a", "metadata": {"source": "whatsapp", "chat_id": "x", "message_id": "m2"}}
+
+    ids = {generate_document_id(doc) for doc in (base, other_chat, other_message)}
+    assert len(ids) == 3
+
+
+def test_id_falls_back_to_text_hash():
+    """Documents without message IDs are addressed by their text."""
+    first = {"text": "hello", "metadata": {}}
+    same = {"text": "hello", "metadata": {"chat_id": "ignored"}}
+    different = {"text": "bye", "metadata": {}}
+
+    assert generate_document_id(first) == generate_document_id(same)
+    assert generate_document_id(first) != generate_document_id(different)
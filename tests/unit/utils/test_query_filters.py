@@ -0,0 +1,73 @@
+"""
+Unit tests for query constraint extraction and metadata filters.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from ici.adapters.vector_stores.numpy_store import NumpyVectorStore
+from ici.utils.query_filters import extract_query_constraints, build_metadata_filter
+
+NOW = datetime(2024, 5, 15, 12, 0, tzinfo=timezone.utc)  # a Wednesday
+DAY = 86400
+
+
+def test_extracts_source_chat_kind_and_time_phrases():
+    """Sources, group/direct chats and relative time phrases become constraints."""
+    constraints = extract_query_constraints("what did Ana say on telegram last week?", now=NOW)
+    assert constraints == {"source": "telegram", "start": int(NOW.timestamp()) - 7 * DAY, "end": int(NOW.timestamp())}
+
+    constraints = extract_query_constraints("plans discussed in group chats yesterday", now=NOW)
+    midnight = int(datetime(2024, 5, 15, tzinfo=timezone.utc).timestamp())
+    assert constraints == {"is_group": True, "start": midnight - DAY, "end": midnight - 1}
+
+    assert extract_query_constraints("any DMs in the past 3 days", now=NOW)["start"] == int(NOW.timestamp()) - 3 * DAY
+    assert extract_query_constraints("this week", now=NOW)["start"] == midnight - 2 * DAY
+    # Mentioning a source as a topic is not a constraint
+    assert extract_query_constraints("how do telegram bots work?", now=NOW) == {}
+
+
+def test_explicit_filters_override_query_text():
+    """additional_info['filters'] wins over phrases in the query."""
+    info = {"filters": {"source": "WhatsApp", "chat_id": "family", "since": "2024-05-01T00:00:00", "until": 1715731200000}}
+    constraints = extract_query_constraints("on telegram today", info, now=NOW)
+
+    assert constraints == {
+        "source": "whatsapp",
+        "chat_id": "family",
+        "start": int(datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp()),
+        "end": 1715731200,
+    }
+    assert build_metadata_filter(constraints) == {"$and": [
+        {"source": "whatsapp"},
+        {"chat_id": "family"},
+        {"$and": [{"timestamp": {"$gte": constraints["start"] * 1000}}, {"timestamp": {"$lte": 1715731200000}}]},
+    ]}
+    assert build_metadata_filter({}) is None
+    assert build_metadata_filter({"source": "telegram"}) == {"source": "telegram"}
+
+
+def test_time_filter_matches_both_document_layouts(tmp_path):
+    """Telegram chunks overlapping the range and WhatsApp messages inside it match."""
+    config = {"type": "numpy", "persist_directory": str(tmp_path / "db"), "index": {"type": "flat"}}
+    with patch('ici.adapters.vector_stores.numpy_store.get_component_config', return_value=config):
+        store = NumpyVectorStore(logger_name="test_vector_store")
+        store.logger = MagicMock()
+        asyncio.run(store.initialize())
+
+    documents = [
+        {"text": "tg inside", "metadata": {"source": "telegram", "chat_id": 1, "timestamp_start": 900, "timestamp_end": 1100}},
+        {"text": "tg before", "metadata": {"source": "telegram", "chat_id": 1, "timestamp_start": 100, "timestamp_end": 200}},
+        {"text": "wa inside", "metadata": {"source": "whatsapp", "chat_id": "x", "message_id": "m1", "timestamp": 1500000}},
+        {"text": "wa after", "metadata": {"source": "whatsapp", "chat_id": "x", "message_id": "m2", "timestamp": 9000000}},
+    ]
+    store.add_documents(documents, [[1.0, 0.0], [0.9, 0.1], [0.8, 0.2], [0.7, 0.3]])
+
+    filters = build_metadata_filter({"start": 1000, "end": 2000})
+    results = store.search([1.0, 0.0], num_results=4, filters=filters)
+    assert sorted(doc["text"] for doc in results) == ["tg inside", "wa inside"]
+
+    filters = build_metadata_filter({"source": "telegram", "start": 1000, "end": 2000})
+    assert [doc["text"] for doc in store.search([1.0, 0.0], num_results=4, filters=filters)] == ["tg inside"]
+    store.close()
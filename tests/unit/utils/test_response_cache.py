@@ -0,0 +1,94 @@
+"""
+Unit tests for SemanticResponseCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ici.utils.response_cache import SemanticResponseCache
+
+
+def test_similar_query_with_same_context_hits():
+    """Queries above the similarity threshold share a response; dissimilar ones miss."""
+    cache = SemanticResponseCache(similarity_threshold=0.95)
+    cache.set([1.0, 0.0], "docs", "history", "cached answer")
+
+    assert cache.get([0.99, 0.05], "docs", "history") == "cached answer"
+    assert cache.get([0.0, 1.0], "docs", "history") is None
+    assert cache.get([1.0, 0.0], "docs", "other history") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_changed_documents_invalidate_entry():
+    """An entry whose retrieved documents changed is dropped, not served."""
+    cache = SemanticResponseCache()
+    cache.set([1.0, 0.0], "old docs", "history", "stale answer")
+
+    assert cache.get([1.0, 0.0], "new docs", "history") is None
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_similar_query_with_other_documents_keeps_entry():
+    """A similar query that retrieved different documents misses without evicting the entry."""
+    cache = SemanticResponseCache(similarity_threshold=0.95)
+    cache.set([1.0, 0.0], "docs", "history", "answer")
+
+    assert cache.get([0.99, 0.05], "other docs", "history") is None
+    assert cache.get([1.0, 0.0], "docs", "history") == "answer"
+    assert cache.stats()["invalidations"] == 0
+
+
+def test_expired_and_evicted_entries_are_dropped():
+    """Entries expire after the TTL and the least recently used entry is evicted first."""
+    cache = SemanticResponseCache(max_size=2, ttl_seconds=10)
+    with patch("ici.utils.cache.time.monotonic", return_value=1000.0):
+        cache.set([1.0, 0.0], "docs", "history", "a")
+        cache.set([0.0, 1.0], "docs", "history", "b")
+        cache.get([1.0, 0.0], "docs", "history")
+        cache.set([0.6, 0.8], "docs", "history", "c")
+
+    assert cache.stats()["evictions"] == 1
+    with patch("ici.utils.cache.time.monotonic", return_value=1005.0):
+        assert cache.get([1.0, 0.0], "docs", "history") == "a"
+        assert cache.get([0.0, 1.0], "docs", "history") is None
+    with patch("ici.utils.cache.time.monotonic", return_value=1011.0):
+        assert cache.get([1.0, 0.0], "docs", "history") is None
+    assert cache.stats()["expirations"] == 2
+
+
+def test_fingerprint_is_order_sensitive():
+    """Fingerprints identify the exact sequence of items."""
+    first = SemanticResponseCache.fingerprint([("1", "a"), ("2", "b")])
+
+    assert first == SemanticResponseCache.fingerprint([("1", "a"), ("2", "b")])
+    assert first != SemanticResponseCache.fingerprint([("2", "b"), ("1", "a")])
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Saved entries are restored, unless the namespace changed."""
+    path = str(tmp_path / "cache" / "responses.json")
+    cache = SemanticResponseCache(path=path, namespace="gpt-4o")
+    cache.set([1.0, 0.0], "docs", "history", "saved answer")
+
+    assert cache.save() is True
+    assert cache.save() is False  # nothing changed since
+
+    restored = SemanticResponseCache(path=path, namespace="gpt-4o")
+    assert restored.load() == 1
+    assert restored.get([1.0, 0.0], "docs", "history") == "saved answer"
+
+    other_model = SemanticResponseCache(path=path, namespace="gpt-4o-mini")
+    assert other_model.load() == 0
+
+
+def test_invalid_settings_are_rejected():
+    """The threshold must be a usable cosine similarity."""
+    with pytest.raises(ValueError):
+        SemanticResponseCache(similarity_threshold=0.0)
+    with pytest.raises(ValueError):
+        SemanticResponseCache(max_size=0)
@@ -0,0 +1,95 @@
+"""
+Unit tests for the latency Tracer and MetricsExporter.
+"""
+
+import json
+
+import pytest
+
+from ici.utils.tracing import MetricsExporter, Tracer
+
+
+def test_stats_report_nearest_rank_percentiles():
+    """Percentiles are computed per span name from the recorded durations."""
+    tracer = Tracer()
+    for i in range(1, 101):
+        tracer.record("query.search", i / 1000)
+    tracer.record("ingestion.embed", 0.5)
+
+    stats = tracer.stats("query.")
+
+    assert list(stats) == ["query.search"]
+    assert stats["query.search"]["count"] == 100
+    assert stats["query.search"]["p50"] == pytest.approx(0.050)
+    assert stats["query.search"]["p95"] == pytest.approx(0.095)
+    assert stats["query.search"]["p99"] == pytest.approx(0.099)
+    assert stats["query.search"]["max"] == pytest.approx(0.100)
+
+
+def test_span_counts_errors_and_reraises():
+    """A span that raises is recorded as an error."""
+    tracer = Tracer()
+
+    with pytest.raises(ValueError):
+        with tracer.span("query.generate"):
+            raise ValueError("boom")
+
+    stats = tracer.stats()
+    assert stats["query.generate"]["count"] == 1
+    assert stats["query.generate"]["errors"] == 1
+
+
+def test_disabled_tracer_records_nothing():
+    """Spans are dropped while the tracer is disabled."""
+    tracer = Tracer()
+    tracer.enabled = False
+
+    with tracer.span("query.embed"):
+        pass
+
+    assert tracer.stats() == {}
+
+
+def test_prometheus_output_has_cumulative_buckets():
+    """Bucket counts are cumulative and end with +Inf equal to the count."""
+    tracer = Tracer(buckets=(0.01, 0.1))
+    tracer.record("query.search", 0.005)
+    tracer.record("query.search", 0.05)
+    tracer.record("query.search", 5.0, error=True)
+
+    text = tracer.to_prometheus()
+
+    assert 'ici_stage_duration_seconds_bucket{stage="query.search",le="0.01"} 1' in text
+    assert 'ici_stage_duration_seconds_bucket{stage="query.search",le="0.1"} 2' in text
+    assert 'ici_stage_duration_seconds_bucket{stage="query.search",le="+Inf"} 3' in text
+    assert 'ici_stage_duration_seconds_count{stage="query.search"} 3' in text
+    assert 'ici_stage_errors_total{stage="query.search"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_exporter_writes_files_on_stop(tmp_path):
+    """Stopping the exporter performs a final export in the configured format."""
+    tracer = Tracer()
+    tracer.record("ingestion.store", 0.2)
+
+    prometheus_path = tmp_path / "metrics" / "ici.prom"
+    prometheus = MetricsExporter(tracer, format="prometheus", path=str(prometheus_path))
+    await prometheus.stop()
+
+    otlp_path = tmp_path / "metrics.jsonl"
+    otlp = MetricsExporter(tracer, format="otlp", path=str(otlp_path))
+    await otlp.stop()
+
+    assert 'stage="ingestion.store"' in prometheus_path.read_text()
+    request = json.loads(otlp_path.read_text().splitlines()[0])
+    metric = request["resourceMetrics"][0]["scopeMetrics"][0]["metrics"][0]
+    assert metric["histogram"]["dataPoints"][0]["count"] == "1"
+    assert prometheus.status()["exports"] == 1
+
+
+def test_exporter_rejects_missing_destination():
+    """Each format needs somewhere to export to."""
+    with pytest.raises(ValueError):
+        MetricsExporter(Tracer(), format="prometheus")
+    with pytest.raises(ValueError):
+        MetricsExporter(Tracer(), format="statsd", path="metrics.txt")